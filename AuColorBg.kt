@@ -0,0 +1,47 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Background Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.bgDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.bg_active -> if (isDay) "#fffafafa".toColorInt() else "#ff26272b".toColorInt() // gray_50 -> gray_iron_800
+        R.color.bg_brand_primary -> if (isDay) "#fffdf5ef".toColorInt() else "#ff391004".toColorInt() // brand_50 -> brand_900
+        R.color.bg_brand_primary_alt -> if (isDay) "#fffdf5ef".toColorInt() else "#ff391004".toColorInt() // brand_50 -> brand_900
+        R.color.bg_brand_secondary -> if (isDay) "#fffbe7d9".toColorInt() else "#ffb1311d".toColorInt() // brand_100 -> brand_700
+        R.color.bg_brand_section -> if (isDay) "#ff8d291f".toColorInt() else "#fffbe7d9".toColorInt() // brand_800 -> brand_100
+        R.color.bg_brand_section_subtle -> if (isDay) "#ffb1311d".toColorInt() else "#fff6cbb2".toColorInt() // brand_700 -> brand_200
+        R.color.bg_brand_solid -> "#ffd54221".toColorInt() // brand_600
+        R.color.bg_brand_solid_hover -> "#ffb1311d".toColorInt() // brand_700
+        R.color.bg_disabled -> if (isDay) "#fff5f5f5".toColorInt() else "#ff26272b".toColorInt() // gray_100 -> gray_iron_800
+        R.color.bg_disabled_subtle -> if (isDay) "#fffafafa".toColorInt() else "#ff1a1a1e".toColorInt() // gray_50 -> gray_iron_900
+        R.color.bg_error_primary -> if (isDay) "#fffef3f2".toColorInt() else "#ff55160c".toColorInt() // error_50 -> error_950
+        R.color.bg_error_secondary -> if (isDay) "#fffee4e2".toColorInt() else "#ffd92d20".toColorInt() // error_100 -> error_600
+        R.color.bg_error_solid -> "#ffd92d20".toColorInt() // error_600
+        R.color.bg_overlay -> "#99000000".toColorInt() // #99000000
+        R.color.bg_overlay_full_sheet -> "#33000000".toColorInt() // #33000000
+        R.color.bg_primary -> if (isDay) "#ffffffff".toColorInt() else "#ff131316".toColorInt() // white -> gray_iron_950
+        R.color.bg_primary_900 -> if (isDay) "#ff181d27".toColorInt() else "#fffafafa".toColorInt() // gray_900 -> gray_iron_50
+        R.color.bg_primary_alt -> if (isDay) "#ffffffff".toColorInt() else "#ff1a1a1e".toColorInt() // white -> gray_iron_900
+        R.color.bg_primary_hover -> if (isDay) "#fffafafa".toColorInt() else "#ff26272b".toColorInt() // gray_50 -> gray_iron_800
+        R.color.bg_primary_solid -> if (isDay) "#ff0a0d12".toColorInt() else "#ff1a1a1e".toColorInt() // gray_950 -> gray_iron_900
+        R.color.bg_pure_black_same -> "#ff000000".toColorInt() // black
+        R.color.bg_quaternary -> if (isDay) "#ffe9eaeb".toColorInt() else "#ff3f3f46".toColorInt() // gray_200 -> gray_iron_700
+        R.color.bg_secondary -> if (isDay) "#fffafafa".toColorInt() else "#ff1a1a1e".toColorInt() // gray_50 -> gray_iron_900
+        R.color.bg_secondary_alt -> if (isDay) "#fffafafa".toColorInt() else "#ff131316".toColorInt() // gray_50 -> gray_iron_950
+        R.color.bg_secondary_hover -> if (isDay) "#fff5f5f5".toColorInt() else "#ff26272b".toColorInt() // gray_100 -> gray_iron_800
+        R.color.bg_secondary_solid -> if (isDay) "#ff535862".toColorInt() else "#ff51525c".toColorInt() // gray_600 -> gray_iron_600
+        R.color.bg_secondary_subtle -> if (isDay) "#fffdfdfd".toColorInt() else "#ff1a1a1e".toColorInt() // gray_25 -> gray_iron_900
+        R.color.bg_success_primary -> if (isDay) "#ffecfdf3".toColorInt() else "#ff053321".toColorInt() // success_50 -> success_950
+        R.color.bg_success_secondary -> if (isDay) "#ffdcfae6".toColorInt() else "#ff079455".toColorInt() // success_100 -> success_600
+        R.color.bg_success_solid -> "#ff079455".toColorInt() // success_600
+        R.color.bg_tertiary -> if (isDay) "#fff5f5f5".toColorInt() else "#ff26272b".toColorInt() // gray_100 -> gray_iron_800
+        R.color.bg_warning_primary -> if (isDay) "#fffffaeb".toColorInt() else "#ff4e1d09".toColorInt() // warning_50 -> warning_950
+        R.color.bg_warning_secondary -> if (isDay) "#fffef0c7".toColorInt() else "#ffdc6803".toColorInt() // warning_100 -> warning_600
+        R.color.bg_warning_solid -> "#ffdc6803".toColorInt() // warning_600
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
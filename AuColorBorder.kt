@@ -0,0 +1,25 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Border Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.borderDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.border_brand -> if (isDay) "#ffe35728".toColorInt() else "#ffe97b4e".toColorInt() // brand_500 -> brand_400
+        R.color.border_brand_alt -> if (isDay) "#ffd54221".toColorInt() else "#ffe35728".toColorInt() // brand_600 -> brand_500
+        R.color.border_disabled -> if (isDay) "#ffcecfd2".toColorInt() else "#ff3f3f46".toColorInt() // #ffcecfd2 -> gray_iron_700
+        R.color.border_disabled_subtle -> if (isDay) "#ffececed".toColorInt() else "#ff26272b".toColorInt() // #ffececed -> gray_iron_800
+        R.color.border_error -> if (isDay) "#fff04438".toColorInt() else "#fff97066".toColorInt() // error_500 -> error_400
+        R.color.border_error_subtle -> if (isDay) "#fffda29b".toColorInt() else "#fff04438".toColorInt() // error_300 -> error_500
+        R.color.border_inverse -> if (isDay) "#ffffffff".toColorInt() else "#ff000000".toColorInt() // white -> black
+        R.color.border_primary -> if (isDay) "#ffcecfd2".toColorInt() else "#ff3f3f46".toColorInt() // #ffcecfd2 -> gray_iron_700
+        R.color.border_primary_900 -> if (isDay) "#ff181d27".toColorInt() else "#fffafafa".toColorInt() // gray_900 -> gray_iron_50
+        R.color.border_secondary -> if (isDay) "#ffececed".toColorInt() else "#ff26272b".toColorInt() // #ffececed -> gray_iron_800
+        R.color.border_secondary_alt -> if (isDay) "#ffececed".toColorInt() else "#ff3f3f46".toColorInt() // #ffececed -> gray_iron_700
+        R.color.border_tertiary -> if (isDay) "#fff0f0f1".toColorInt() else "#ff26272b".toColorInt() // #fff0f0f1 -> gray_iron_800
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
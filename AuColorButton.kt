@@ -0,0 +1,17 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Button Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.buttonDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.button_destructive_primary_icon -> "#fffda29b".toColorInt() // error_300
+        R.color.button_destructive_primary_icon_hover -> "#fffecdca".toColorInt() // error_200
+        R.color.button_primary_icon -> "#fff0a881".toColorInt() // brand_300
+        R.color.button_primary_icon_hover -> "#fff6cbb2".toColorInt() // brand_200
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
@@ -0,0 +1,36 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Foreground Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.fgDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.fg_brand_primary -> if (isDay) "#ffd54221".toColorInt() else "#ffe35728".toColorInt() // brand_600 -> brand_500
+        R.color.fg_brand_primary_alt -> if (isDay) "#ffd54221".toColorInt() else "#ffcecfd2".toColorInt() // brand_600 -> gray_300
+        R.color.fg_brand_secondary -> "#ffe35728".toColorInt() // brand_500
+        R.color.fg_brand_secondary_alt -> if (isDay) "#ffe35728".toColorInt() else "#ff61656c".toColorInt() // brand_500 -> gray_600
+        R.color.fg_brand_secondary_hover -> if (isDay) "#ffd54221".toColorInt() else "#ff85888e".toColorInt() // brand_600 -> gray_500
+        R.color.fg_disabled -> if (isDay) "#ffa4a7ae".toColorInt() else "#ff85888e".toColorInt() // gray_400 -> gray_500
+        R.color.fg_disabled_subtle -> if (isDay) "#ffd5d7da".toColorInt() else "#ff61656c".toColorInt() // gray_300 -> gray_600
+        R.color.fg_error_primary -> if (isDay) "#ffd92d20".toColorInt() else "#fff04438".toColorInt() // error_600 -> error_500
+        R.color.fg_error_secondary -> if (isDay) "#fff04438".toColorInt() else "#fff97066".toColorInt() // error_500 -> error_400
+        R.color.fg_inverse -> if (isDay) "#ffffffff".toColorInt() else "#ff000000".toColorInt() // white -> black
+        R.color.fg_primary -> if (isDay) "#ff181d27".toColorInt() else "#ffffffff".toColorInt() // gray_900 -> white
+        R.color.fg_quaternary -> if (isDay) "#ffa4a7ae".toColorInt() else "#ff61656c".toColorInt() // gray_400 -> gray_600
+        R.color.fg_quaternary_500 -> if (isDay) "#ff717680".toColorInt() else "#ff94979c".toColorInt() // gray_500 -> gray_400
+        R.color.fg_quaternary_hover -> if (isDay) "#ff717680".toColorInt() else "#ff85888e".toColorInt() // gray_500
+        R.color.fg_secondary -> if (isDay) "#ff414651".toColorInt() else "#ffcecfd2".toColorInt() // gray_700 -> gray_300
+        R.color.fg_secondary_hover -> if (isDay) "#ff252b37".toColorInt() else "#ffececed".toColorInt() // gray_800 -> gray_200
+        R.color.fg_success_primary -> if (isDay) "#ff079455".toColorInt() else "#ff17b26a".toColorInt() // success_600 -> success_500
+        R.color.fg_success_secondary -> if (isDay) "#ff17b26a".toColorInt() else "#ff47cd89".toColorInt() // success_500 -> success_400
+        R.color.fg_tertiary -> if (isDay) "#ff535862".toColorInt() else "#ff94979c".toColorInt() // gray_600 -> gray_400
+        R.color.fg_tertiary_hover -> if (isDay) "#ff414651".toColorInt() else "#ffcecfd2".toColorInt() // gray_700 -> gray_300
+        R.color.fg_warning_primary -> "#ffdc6803".toColorInt() // warning_600
+        R.color.fg_warning_secondary -> "#fff79009".toColorInt() // warning_500
+        R.color.fg_white_same -> "#ffffffff".toColorInt() // white
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
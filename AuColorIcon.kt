@@ -0,0 +1,19 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Icon Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.iconDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.featured_icon_light_fg_brand -> if (isDay) "#ffd54221".toColorInt() else "#fff6cbb2".toColorInt() // brand_600 -> brand_200
+        R.color.featured_icon_light_fg_error -> if (isDay) "#ffd92d20".toColorInt() else "#fffecdca".toColorInt() // error_600 -> error_200
+        R.color.featured_icon_light_fg_gray -> if (isDay) "#ff717680".toColorInt() else "#ffececed".toColorInt() // gray_500 -> gray_200
+        R.color.featured_icon_light_fg_success -> if (isDay) "#ff079455".toColorInt() else "#ffabefc6".toColorInt() // success_600 -> success_200
+        R.color.featured_icon_light_fg_warning -> if (isDay) "#ffdc6803".toColorInt() else "#fffedf89".toColorInt() // warning_600 -> warning_200
+        R.color.icon_fg_brand_on_brand -> if (isDay) "#fff6cbb2".toColorInt() else "#ff94979c".toColorInt() // brand_200 -> gray_400
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
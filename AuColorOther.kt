@@ -0,0 +1,73 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Other Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.otherDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.alpha_black_10 -> if (isDay) "#1a000000".toColorInt() else "#1affffff".toColorInt() // #1a000000 -> #1affffff
+        R.color.alpha_black_100 -> if (isDay) "#ff000000".toColorInt() else "#ffffffff".toColorInt() // #ff000000 -> #ffffffff
+        R.color.alpha_black_20 -> if (isDay) "#33000000".toColorInt() else "#33ffffff".toColorInt() // #33000000 -> #33ffffff
+        R.color.alpha_black_30 -> if (isDay) "#4d000000".toColorInt() else "#4dffffff".toColorInt() // #4d000000 -> #4dffffff
+        R.color.alpha_black_40 -> if (isDay) "#66000000".toColorInt() else "#66ffffff".toColorInt() // #66000000 -> #66ffffff
+        R.color.alpha_black_50 -> if (isDay) "#80000000".toColorInt() else "#80ffffff".toColorInt() // #80000000 -> #80ffffff
+        R.color.alpha_black_60 -> if (isDay) "#99000000".toColorInt() else "#99ffffff".toColorInt() // #99000000 -> #99ffffff
+        R.color.alpha_black_70 -> if (isDay) "#b3000000".toColorInt() else "#b3ffffff".toColorInt() // #b3000000 -> #b3ffffff
+        R.color.alpha_black_80 -> if (isDay) "#cc000000".toColorInt() else "#ccffffff".toColorInt() // #cc000000 -> #ccffffff
+        R.color.alpha_black_90 -> if (isDay) "#e6000000".toColorInt() else "#e6ffffff".toColorInt() // #e6000000 -> #e6ffffff
+        R.color.alpha_white_10 -> if (isDay) "#1affffff".toColorInt() else "#1a0c0e12".toColorInt() // #1affffff -> #1a0c0e12
+        R.color.alpha_white_100 -> if (isDay) "#ffffffff".toColorInt() else "#ff0c0e12".toColorInt() // white -> gray_950
+        R.color.alpha_white_20 -> if (isDay) "#33ffffff".toColorInt() else "#330c0e12".toColorInt() // #33ffffff -> #330c0e12
+        R.color.alpha_white_30 -> if (isDay) "#4dffffff".toColorInt() else "#4d0c0e12".toColorInt() // #4dffffff -> #4d0c0e12
+        R.color.alpha_white_40 -> if (isDay) "#66ffffff".toColorInt() else "#660c0e12".toColorInt() // #66ffffff -> #660c0e12
+        R.color.alpha_white_50 -> if (isDay) "#80ffffff".toColorInt() else "#800c0e12".toColorInt() // #80ffffff -> #800c0e12
+        R.color.alpha_white_60 -> if (isDay) "#99ffffff".toColorInt() else "#990c0e12".toColorInt() // #99ffffff -> #990c0e12
+        R.color.alpha_white_70 -> if (isDay) "#b3ffffff".toColorInt() else "#b30c0e12".toColorInt() // #b3ffffff -> #b30c0e12
+        R.color.alpha_white_80 -> if (isDay) "#ccffffff".toColorInt() else "#cc0c0e12".toColorInt() // #ccffffff -> #cc0c0e12
+        R.color.alpha_white_90 -> if (isDay) "#e6ffffff".toColorInt() else "#e60c0e12".toColorInt() // #e6ffffff -> #e60c0e12
+        R.color.app_store_badge_border -> if (isDay) "#ffa3a3a3".toColorInt() else "#ffffffff".toColorInt() // gray_true_400 -> white
+        R.color.avatar_styles_bg_neutral -> "#ffe5e5e5".toColorInt() // gray_true_200
+        R.color.focus_ring -> "#ffe35728".toColorInt() // brand_500
+        R.color.focus_ring_error -> "#fff04438".toColorInt() // error_500
+        R.color.footer_button_fg -> if (isDay) "#fff6cbb2".toColorInt() else "#ffcecfd2".toColorInt() // brand_200 -> gray_300
+        R.color.footer_button_fg_hover -> if (isDay) "#ffffffff".toColorInt() else "#fff0f0f1".toColorInt() // white -> gray_100
+        R.color.function_gain_green -> "#ff15b374".toColorInt() // #ff15b374
+        R.color.function_gain_green_alpha -> "#1f15b374".toColorInt() // #1f15b374
+        R.color.function_loss_red -> "#fff44040".toColorInt() // #fff44040
+        R.color.function_loss_red_alpha -> "#1ff44040".toColorInt() // #1ff44040
+        R.color.function_unchanged -> if (isDay) "#ffa4a7ae".toColorInt() else "#ff61656c".toColorInt() // gray_400 -> gray_600
+        R.color.screen_mockup_border -> if (isDay) "#ff181d27".toColorInt() else "#ff373a41".toColorInt() // gray_900 -> gray_700
+        R.color.shadow_2xl_01 -> if (isDay) "#2e0a0d12".toColorInt() else "#00ffffff".toColorInt() // #2e0a0d12 -> transparent
+        R.color.shadow_2xl_02 -> if (isDay) "#0a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #0a0a0d12 -> transparent
+        R.color.shadow_3xl_01 -> if (isDay) "#240a0d12".toColorInt() else "#00ffffff".toColorInt() // #240a0d12 -> transparent
+        R.color.shadow_3xl_02 -> if (isDay) "#0a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #0a0a0d12 -> transparent
+        R.color.shadow_grid_md -> if (isDay) "#140a0d12".toColorInt() else "#00ffffff".toColorInt() // #140a0d12 -> transparent
+        R.color.shadow_lg_01 -> if (isDay) "#140a0d12".toColorInt() else "#00ffffff".toColorInt() // #140a0d12 -> transparent
+        R.color.shadow_lg_02 -> if (isDay) "#080a0d12".toColorInt() else "#00ffffff".toColorInt() // #080a0d12 -> transparent
+        R.color.shadow_lg_03 -> if (isDay) "#0a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #0a0a0d12 -> transparent
+        R.color.shadow_main_centre_lg -> if (isDay) "#2e0a0d12".toColorInt() else "#00ffffff".toColorInt() // #2e0a0d12 -> transparent
+        R.color.shadow_main_centre_md -> if (isDay) "#240a0d12".toColorInt() else "#00ffffff".toColorInt() // #240a0d12 -> transparent
+        R.color.shadow_md_01 -> if (isDay) "#1a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #1a0a0d12 -> transparent
+        R.color.shadow_md_02 -> if (isDay) "#0f0a0d12".toColorInt() else "#00ffffff".toColorInt() // #0f0a0d12 -> transparent
+        R.color.shadow_overlay_lg -> if (isDay) "#1f0a0d12".toColorInt() else "#00ffffff".toColorInt() // #1f0a0d12 -> transparent
+        R.color.shadow_skeumorphic_inner -> if (isDay) "#0d0a0d12".toColorInt() else "#0d0c0e12".toColorInt() // #0d0a0d12 -> #0d0c0e12
+        R.color.shadow_skeumorphic_inner_border -> if (isDay) "#2e0a0d12".toColorInt() else "#2e0c0e12".toColorInt() // #2e0a0d12 -> #2e0c0e12
+        R.color.shadow_sm_01 -> if (isDay) "#1a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #1a0a0d12 -> transparent
+        R.color.shadow_sm_02 -> if (isDay) "#1a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #1a0a0d12 -> transparent
+        R.color.shadow_xl_01 -> if (isDay) "#140a0d12".toColorInt() else "#00ffffff".toColorInt() // #140a0d12 -> transparent
+        R.color.shadow_xl_02 -> if (isDay) "#080a0d12".toColorInt() else "#00ffffff".toColorInt() // #080a0d12 -> transparent
+        R.color.shadow_xl_03 -> if (isDay) "#0a0a0d12".toColorInt() else "#00ffffff".toColorInt() // #0a0a0d12 -> transparent
+        R.color.shadow_xs -> if (isDay) "#0d0a0d12".toColorInt() else "#00ffffff".toColorInt() // #0d0a0d12 -> transparent
+        R.color.slider_handle_bg -> if (isDay) "#ffffffff".toColorInt() else "#ffe35728".toColorInt() // white -> brand_500
+        R.color.slider_handle_border -> if (isDay) "#ffd54221".toColorInt() else "#ff131316".toColorInt() // brand_600 -> gray_iron_950
+        R.color.toggle_border -> if (isDay) "#ffd5d7da".toColorInt() else "#00ffffff".toColorInt() // gray_300 -> transparent
+        R.color.toggle_button_fg_disabled -> if (isDay) "#fffafafa".toColorInt() else "#ff61656c".toColorInt() // gray_50 -> gray_600
+        R.color.toggle_slim_border_pressed -> if (isDay) "#ffd54221".toColorInt() else "#00ffffff".toColorInt() // brand_600 -> transparent
+        R.color.toggle_slim_border_pressed_hover -> if (isDay) "#ffb1311d".toColorInt() else "#00ffffff".toColorInt() // brand_700 -> transparent
+        R.color.tooltip_supporting_text -> if (isDay) "#ffd5d7da".toColorInt() else "#ffcecfd2".toColorInt() // gray_300
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
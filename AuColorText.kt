@@ -0,0 +1,41 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Text Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.textDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.text_brand_primary -> if (isDay) "#ff391004".toColorInt() else "#fffdf5ef".toColorInt() // brand_900 -> brand_50
+        R.color.text_brand_quaternary -> "#ffe35728".toColorInt() // brand_500
+        R.color.text_brand_quaternary_alt -> "#ffe35728".toColorInt() // brand_500
+        R.color.text_brand_secondary -> if (isDay) "#ffb1311d".toColorInt() else "#fff6cbb2".toColorInt() // brand_700 -> brand_200
+        R.color.text_brand_secondary_hover -> if (isDay) "#ff8d291f".toColorInt() else "#fffbe7d9".toColorInt() // brand_800 -> brand_100
+        R.color.text_brand_tertiary -> if (isDay) "#ffd54221".toColorInt() else "#ffe97b4e".toColorInt() // brand_600 -> brand_400
+        R.color.text_brand_tertiary_alt -> if (isDay) "#ffd54221".toColorInt() else "#ffe97b4e".toColorInt() // brand_600 -> brand_400
+        R.color.text_disabled -> "#ff85888e".toColorInt() // #ff85888e -> gray_500
+        R.color.text_editor_icon_fg -> if (isDay) "#ffa4a7ae".toColorInt() else "#ff94979c".toColorInt() // gray_400
+        R.color.text_editor_icon_fg_active -> if (isDay) "#ff717680".toColorInt() else "#ffffffff".toColorInt() // gray_500 -> white
+        R.color.text_error_primary -> if (isDay) "#ffd92d20".toColorInt() else "#fff97066".toColorInt() // error_600 -> error_400
+        R.color.text_error_primary_hover -> if (isDay) "#ffb42318".toColorInt() else "#fffda29b".toColorInt() // error_700 -> error_300
+        R.color.text_inverse -> if (isDay) "#ffffffff".toColorInt() else "#ff000000".toColorInt() // white -> black
+        R.color.text_placeholder -> "#ff85888e".toColorInt() // #ff85888e -> gray_500
+        R.color.text_placeholder_subtle -> if (isDay) "#ffcecfd2".toColorInt() else "#ff373a41".toColorInt() // #ffcecfd2 -> gray_700
+        R.color.text_primary -> if (isDay) "#ff13161b".toColorInt() else "#fff7f7f7".toColorInt() // #ff13161b -> gray_50
+        R.color.text_primary_on_brand -> if (isDay) "#ffffffff".toColorInt() else "#fff7f7f7".toColorInt() // white -> gray_50
+        R.color.text_quaternary -> if (isDay) "#ff717680".toColorInt() else "#ff94979c".toColorInt() // gray_500 -> gray_400
+        R.color.text_quaternary_on_brand -> if (isDay) "#fff0a881".toColorInt() else "#ff94979c".toColorInt() // brand_300 -> gray_400
+        R.color.text_secondary -> if (isDay) "#ff373a41".toColorInt() else "#ffcecfd2".toColorInt() // #ff373a41 -> gray_300
+        R.color.text_secondary_hover -> if (isDay) "#ff22262f".toColorInt() else "#ffececed".toColorInt() // #ff22262f -> gray_200
+        R.color.text_secondary_on_brand -> if (isDay) "#fff6cbb2".toColorInt() else "#ffcecfd2".toColorInt() // brand_200 -> gray_300
+        R.color.text_success_primary -> if (isDay) "#ff079455".toColorInt() else "#ff47cd89".toColorInt() // success_600 -> success_400
+        R.color.text_tertiary -> if (isDay) "#ff61656c".toColorInt() else "#ff94979c".toColorInt() // #ff61656c -> gray_400
+        R.color.text_tertiary_hover -> if (isDay) "#ff373a41".toColorInt() else "#ffcecfd2".toColorInt() // #ff373a41 -> gray_300
+        R.color.text_tertiary_on_brand -> if (isDay) "#fff6cbb2".toColorInt() else "#ff94979c".toColorInt() // brand_200 -> gray_400
+        R.color.text_warning_primary -> if (isDay) "#ffdc6803".toColorInt() else "#fffdb022".toColorInt() // warning_600 -> warning_400
+        R.color.text_white -> "#ffffffff".toColorInt() // white
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
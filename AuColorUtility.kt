@@ -0,0 +1,173 @@
+package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * Utility Colors 的默认颜色
+ * 资源ID不属于该分类时返回 NO_DEFAULT_COLOR，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.utilityDefaultColor(isDay: Boolean): Int {
+    return when (this) {
+        R.color.utility_blue_100 -> if (isDay) "#ffd1e9ff".toColorInt() else "#ff194185".toColorInt() // blue_100 -> blue_900
+        R.color.utility_blue_200 -> if (isDay) "#ffb2ddff".toColorInt() else "#ff1849a9".toColorInt() // blue_200 -> blue_800
+        R.color.utility_blue_300 -> if (isDay) "#ff84caff".toColorInt() else "#ff175cd3".toColorInt() // blue_300 -> blue_700
+        R.color.utility_blue_400 -> if (isDay) "#ff53b1fd".toColorInt() else "#ff1570ef".toColorInt() // blue_400 -> blue_600
+        R.color.utility_blue_50 -> if (isDay) "#ffeff8ff".toColorInt() else "#ff102a56".toColorInt() // blue_50 -> blue_950
+        R.color.utility_blue_500 -> "#ff2e90fa".toColorInt() // blue_500
+        R.color.utility_blue_600 -> if (isDay) "#ff1570ef".toColorInt() else "#ff53b1fd".toColorInt() // blue_600 -> blue_400
+        R.color.utility_blue_700 -> if (isDay) "#ff175cd3".toColorInt() else "#ff84caff".toColorInt() // blue_700 -> blue_300
+        R.color.utility_blue_dark_100 -> if (isDay) "#ffd1e0ff".toColorInt() else "#ff00359e".toColorInt() // blue_dark_100 -> blue_dark_900
+        R.color.utility_blue_dark_200 -> if (isDay) "#ffb2ccff".toColorInt() else "#ff0040c1".toColorInt() // blue_dark_200 -> blue_dark_800
+        R.color.utility_blue_dark_300 -> if (isDay) "#ff84adff".toColorInt() else "#ff004eeb".toColorInt() // blue_dark_300 -> blue_dark_700
+        R.color.utility_blue_dark_400 -> if (isDay) "#ff528bff".toColorInt() else "#ff155eef".toColorInt() // blue_dark_400 -> blue_dark_600
+        R.color.utility_blue_dark_50 -> if (isDay) "#ffeff4ff".toColorInt() else "#ff002266".toColorInt() // blue_dark_50 -> blue_dark_950
+        R.color.utility_blue_dark_500 -> "#ff2970ff".toColorInt() // blue_dark_500
+        R.color.utility_blue_dark_600 -> if (isDay) "#ff155eef".toColorInt() else "#ff528bff".toColorInt() // blue_dark_600 -> blue_dark_400
+        R.color.utility_blue_dark_700 -> if (isDay) "#ff004eeb".toColorInt() else "#ff84adff".toColorInt() // blue_dark_700 -> blue_dark_300
+        R.color.utility_blue_light_100 -> if (isDay) "#ffe0f2fe".toColorInt() else "#ff0b4a6f".toColorInt() // blue_light_100 -> blue_light_900
+        R.color.utility_blue_light_200 -> if (isDay) "#ffb9e6fe".toColorInt() else "#ff065986".toColorInt() // blue_light_200 -> blue_light_800
+        R.color.utility_blue_light_300 -> if (isDay) "#ff7cd4fd".toColorInt() else "#ff026aa2".toColorInt() // blue_light_300 -> blue_light_700
+        R.color.utility_blue_light_400 -> if (isDay) "#ff36bffa".toColorInt() else "#ff0086c9".toColorInt() // blue_light_400 -> blue_light_600
+        R.color.utility_blue_light_50 -> if (isDay) "#fff0f9ff".toColorInt() else "#ff062c41".toColorInt() // blue_light_50 -> blue_light_950
+        R.color.utility_blue_light_500 -> "#ff0ba5ec".toColorInt() // blue_light_500
+        R.color.utility_blue_light_600 -> if (isDay) "#ff0086c9".toColorInt() else "#ff36bffa".toColorInt() // blue_light_600 -> blue_light_400
+        R.color.utility_blue_light_700 -> if (isDay) "#ff026aa2".toColorInt() else "#ff7cd4fd".toColorInt() // blue_light_700 -> blue_light_300
+        R.color.utility_brand_100 -> if (isDay) "#fffbe7d9".toColorInt() else "#ff391004".toColorInt() // brand_100 -> brand_900
+        R.color.utility_brand_100_alt -> if (isDay) "#fffbe7d9".toColorInt() else "#ff22262f".toColorInt() // brand_100 -> gray_800
+        R.color.utility_brand_200 -> if (isDay) "#fff6cbb2".toColorInt() else "#ff8d291f".toColorInt() // brand_200 -> brand_800
+        R.color.utility_brand_200_alt -> if (isDay) "#fff6cbb2".toColorInt() else "#ff373a41".toColorInt() // brand_200 -> gray_700
+        R.color.utility_brand_300 -> if (isDay) "#fff0a881".toColorInt() else "#ffb1311d".toColorInt() // brand_300 -> brand_700
+        R.color.utility_brand_300_alt -> if (isDay) "#fff0a881".toColorInt() else "#ff373a41".toColorInt() // brand_300 -> gray_700
+        R.color.utility_brand_400 -> if (isDay) "#ffe97b4e".toColorInt() else "#ffd54221".toColorInt() // brand_400 -> brand_600
+        R.color.utility_brand_400_alt -> if (isDay) "#ffe97b4e".toColorInt() else "#ff61656c".toColorInt() // brand_400 -> gray_600
+        R.color.utility_brand_50 -> if (isDay) "#fffdf5ef".toColorInt() else "#ff290902".toColorInt() // brand_50 -> brand_950
+        R.color.utility_brand_500 -> "#ffe35728".toColorInt() // brand_500
+        R.color.utility_brand_500_alt -> if (isDay) "#ffe35728".toColorInt() else "#ff85888e".toColorInt() // brand_500 -> gray_500
+        R.color.utility_brand_50_alt -> if (isDay) "#fffdf5ef".toColorInt() else "#ff13161b".toColorInt() // brand_50 -> gray_900
+        R.color.utility_brand_600 -> if (isDay) "#ffd54221".toColorInt() else "#ffe97b4e".toColorInt() // brand_600 -> brand_400
+        R.color.utility_brand_600_alt -> if (isDay) "#ffd54221".toColorInt() else "#ff94979c".toColorInt() // brand_600 -> gray_400
+        R.color.utility_brand_700 -> if (isDay) "#ffb1311d".toColorInt() else "#fff0a881".toColorInt() // brand_700 -> brand_300
+        R.color.utility_brand_700_alt -> if (isDay) "#ffb1311d".toColorInt() else "#ffcecfd2".toColorInt() // brand_700 -> gray_300
+        R.color.utility_brand_800 -> if (isDay) "#ff8d291f".toColorInt() else "#fff6cbb2".toColorInt() // brand_800 -> brand_200
+        R.color.utility_brand_800_alt -> if (isDay) "#ff8d291f".toColorInt() else "#ffececed".toColorInt() // brand_800 -> gray_200
+        R.color.utility_brand_900 -> if (isDay) "#ff391004".toColorInt() else "#fffbe7d9".toColorInt() // brand_900 -> brand_100
+        R.color.utility_brand_900_alt -> if (isDay) "#ff391004".toColorInt() else "#fff0f0f1".toColorInt() // brand_900 -> gray_100
+        R.color.utility_error_100 -> if (isDay) "#fffee4e2".toColorInt() else "#ff7a271a".toColorInt() // error_100 -> error_900
+        R.color.utility_error_200 -> if (isDay) "#fffecdca".toColorInt() else "#ff912018".toColorInt() // error_200 -> error_800
+        R.color.utility_error_300 -> if (isDay) "#fffda29b".toColorInt() else "#ffb42318".toColorInt() // error_300 -> error_700
+        R.color.utility_error_400 -> if (isDay) "#fff97066".toColorInt() else "#ffd92d20".toColorInt() // error_400 -> error_600
+        R.color.utility_error_50 -> if (isDay) "#fffef3f2".toColorInt() else "#ff55160c".toColorInt() // error_50 -> error_950
+        R.color.utility_error_500 -> "#fff04438".toColorInt() // error_500
+        R.color.utility_error_600 -> if (isDay) "#ffd92d20".toColorInt() else "#fff97066".toColorInt() // error_600 -> error_400
+        R.color.utility_error_700 -> if (isDay) "#ffb42318".toColorInt() else "#fffda29b".toColorInt() // error_700 -> error_300
+        R.color.utility_fuchsia_100 -> if (isDay) "#fffbe8ff".toColorInt() else "#ff6f1877".toColorInt() // fuchsia_100 -> fuchsia_900
+        R.color.utility_fuchsia_200 -> if (isDay) "#fff6d0fe".toColorInt() else "#ff821890".toColorInt() // fuchsia_200 -> fuchsia_800
+        R.color.utility_fuchsia_300 -> if (isDay) "#ffeeaafd".toColorInt() else "#ff9f1ab1".toColorInt() // fuchsia_300 -> fuchsia_700
+        R.color.utility_fuchsia_400 -> if (isDay) "#ffe478fa".toColorInt() else "#ffba24d5".toColorInt() // fuchsia_400 -> fuchsia_600
+        R.color.utility_fuchsia_50 -> if (isDay) "#fffdf4ff".toColorInt() else "#ff47104c".toColorInt() // fuchsia_50 -> fuchsia_950
+        R.color.utility_fuchsia_500 -> "#ffd444f1".toColorInt() // fuchsia_500
+        R.color.utility_fuchsia_600 -> if (isDay) "#ffba24d5".toColorInt() else "#ffe478fa".toColorInt() // fuchsia_600 -> fuchsia_400
+        R.color.utility_fuchsia_700 -> if (isDay) "#ff9f1ab1".toColorInt() else "#ffeeaafd".toColorInt() // fuchsia_700 -> fuchsia_300
+        R.color.utility_gray_100 -> if (isDay) "#fff5f5f5".toColorInt() else "#ff22262f".toColorInt() // gray_100 -> gray_800
+        R.color.utility_gray_100_same -> "#fff5f5f5".toColorInt() // gray_100 -> #fff5f5f5
+        R.color.utility_gray_200 -> if (isDay) "#ffe9eaeb".toColorInt() else "#ff373a41".toColorInt() // gray_200 -> gray_700
+        R.color.utility_gray_200_same -> "#ffe9eaeb".toColorInt() // gray_200 -> #ffe9eaeb
+        R.color.utility_gray_300 -> if (isDay) "#ffd5d7da".toColorInt() else "#ff373a41".toColorInt() // gray_300 -> gray_700
+        R.color.utility_gray_300_same -> "#ffd5d7da".toColorInt() // gray_300 -> #ffd5d7da
+        R.color.utility_gray_400 -> if (isDay) "#ffa4a7ae".toColorInt() else "#ff61656c".toColorInt() // gray_400 -> gray_600
+        R.color.utility_gray_400_same -> "#ffa4a7ae".toColorInt() // gray_400 -> #ffa4a7ae
+        R.color.utility_gray_50 -> if (isDay) "#fffafafa".toColorInt() else "#ff13161b".toColorInt() // gray_50 -> gray_900
+        R.color.utility_gray_500 -> if (isDay) "#ff717680".toColorInt() else "#ff85888e".toColorInt() // gray_500
+        R.color.utility_gray_500_same -> "#ff717680".toColorInt() // gray_500 -> #ff717680
+        R.color.utility_gray_50_same -> "#fffafafa".toColorInt() // gray_50 -> #fffafafa
+        R.color.utility_gray_600 -> if (isDay) "#ff535862".toColorInt() else "#ff94979c".toColorInt() // gray_600 -> gray_400
+        R.color.utility_gray_600_same -> "#ff535862".toColorInt() // gray_600 -> #ff535862
+        R.color.utility_gray_700 -> if (isDay) "#ff414651".toColorInt() else "#ffcecfd2".toColorInt() // gray_700 -> gray_300
+        R.color.utility_gray_700_same -> "#ff414651".toColorInt() // gray_700 -> #ff414651
+        R.color.utility_gray_800 -> if (isDay) "#ff252b37".toColorInt() else "#ffececed".toColorInt() // gray_800 -> gray_200
+        R.color.utility_gray_800_same -> "#ff252b37".toColorInt() // gray_800 -> #ff252b37
+        R.color.utility_gray_900 -> if (isDay) "#ff181d27".toColorInt() else "#fff0f0f1".toColorInt() // gray_900 -> gray_100
+        R.color.utility_gray_900_same -> "#ff181d27".toColorInt() // gray_900 -> #ff181d27
+        R.color.utility_gray_blue_100 -> if (isDay) "#ffeaecf5".toColorInt() else "#ff101323".toColorInt() // gray_blue_100 -> gray_blue_900
+        R.color.utility_gray_blue_200 -> if (isDay) "#ffd5d9eb".toColorInt() else "#ff293056".toColorInt() // gray_blue_200 -> gray_blue_800
+        R.color.utility_gray_blue_300 -> if (isDay) "#ffb3b8db".toColorInt() else "#ff363f72".toColorInt() // gray_blue_300 -> gray_blue_700
+        R.color.utility_gray_blue_400 -> if (isDay) "#ff717bbc".toColorInt() else "#ff3e4784".toColorInt() // gray_blue_400 -> gray_blue_600
+        R.color.utility_gray_blue_50 -> if (isDay) "#fff8f9fc".toColorInt() else "#ff0d0f1c".toColorInt() // gray_blue_50 -> gray_blue_950
+        R.color.utility_gray_blue_500 -> "#ff4e5ba6".toColorInt() // gray_blue_500
+        R.color.utility_gray_blue_600 -> if (isDay) "#ff3e4784".toColorInt() else "#ff717bbc".toColorInt() // gray_blue_600 -> gray_blue_400
+        R.color.utility_gray_blue_700 -> if (isDay) "#ff363f72".toColorInt() else "#ffb3b8db".toColorInt() // gray_blue_700 -> gray_blue_300
+        R.color.utility_green_100 -> if (isDay) "#ffd3f8df".toColorInt() else "#ff084c2e".toColorInt() // green_100 -> green_900
+        R.color.utility_green_200 -> if (isDay) "#ffaaf0c4".toColorInt() else "#ff095c37".toColorInt() // green_200 -> green_800
+        R.color.utility_green_300 -> if (isDay) "#ff73e2a3".toColorInt() else "#ff087443".toColorInt() // green_300 -> green_700
+        R.color.utility_green_400 -> if (isDay) "#ff3ccb7f".toColorInt() else "#ff099250".toColorInt() // green_400 -> green_600
+        R.color.utility_green_50 -> if (isDay) "#ffedfcf2".toColorInt() else "#ff052e1c".toColorInt() // green_50 -> green_950
+        R.color.utility_green_500 -> "#ff16b364".toColorInt() // green_500
+        R.color.utility_green_600 -> if (isDay) "#ff099250".toColorInt() else "#ff3ccb7f".toColorInt() // green_600 -> green_400
+        R.color.utility_green_700 -> if (isDay) "#ff087443".toColorInt() else "#ff73e2a3".toColorInt() // green_700 -> green_300
+        R.color.utility_indigo_100 -> if (isDay) "#ffe0eaff".toColorInt() else "#ff2d3282".toColorInt() // indigo_100 -> indigo_900
+        R.color.utility_indigo_200 -> if (isDay) "#ffc7d7fe".toColorInt() else "#ff2d31a6".toColorInt() // indigo_200 -> indigo_800
+        R.color.utility_indigo_300 -> if (isDay) "#ffa4bcfd".toColorInt() else "#ff3538cd".toColorInt() // indigo_300 -> indigo_700
+        R.color.utility_indigo_400 -> if (isDay) "#ff8098f9".toColorInt() else "#ff444ce7".toColorInt() // indigo_400 -> indigo_600
+        R.color.utility_indigo_50 -> if (isDay) "#ffeef4ff".toColorInt() else "#ff1f235b".toColorInt() // indigo_50 -> indigo_950
+        R.color.utility_indigo_500 -> "#ff6172f3".toColorInt() // indigo_500
+        R.color.utility_indigo_600 -> if (isDay) "#ff444ce7".toColorInt() else "#ff8098f9".toColorInt() // indigo_600 -> indigo_400
+        R.color.utility_indigo_700 -> if (isDay) "#ff3538cd".toColorInt() else "#ffa4bcfd".toColorInt() // indigo_700 -> indigo_300
+        R.color.utility_orange_100 -> if (isDay) "#fffdead7".toColorInt() else "#ff772917".toColorInt() // orange_100 -> orange_900
+        R.color.utility_orange_200 -> if (isDay) "#fff9dbaf".toColorInt() else "#ff932f19".toColorInt() // orange_200 -> orange_800
+        R.color.utility_orange_300 -> if (isDay) "#fff7b27a".toColorInt() else "#ffb93815".toColorInt() // orange_300 -> orange_700
+        R.color.utility_orange_400 -> if (isDay) "#fff38744".toColorInt() else "#ffe04f16".toColorInt() // orange_400 -> orange_600
+        R.color.utility_orange_50 -> if (isDay) "#fffef6ee".toColorInt() else "#ff511c10".toColorInt() // orange_50 -> orange_950
+        R.color.utility_orange_500 -> "#ffef6820".toColorInt() // orange_500
+        R.color.utility_orange_600 -> if (isDay) "#ffe04f16".toColorInt() else "#fff38744".toColorInt() // orange_600 -> orange_400
+        R.color.utility_orange_700 -> if (isDay) "#ffb93815".toColorInt() else "#fff7b27a".toColorInt() // orange_700 -> orange_300
+        R.color.utility_orange_dark_100 -> if (isDay) "#ffffe6d5".toColorInt() else "#ff771a0d".toColorInt() // orange_dark_100 -> orange_dark_900
+        R.color.utility_orange_dark_200 -> if (isDay) "#ffffd6ae".toColorInt() else "#ff97180c".toColorInt() // orange_dark_200 -> orange_dark_800
+        R.color.utility_orange_dark_300 -> if (isDay) "#ffff9c66".toColorInt() else "#ffbc1b06".toColorInt() // orange_dark_300 -> orange_dark_700
+        R.color.utility_orange_dark_400 -> if (isDay) "#ffff692e".toColorInt() else "#ffe62e05".toColorInt() // orange_dark_400 -> orange_dark_600
+        R.color.utility_orange_dark_50 -> if (isDay) "#fffff4ed".toColorInt() else "#ff57130a".toColorInt() // orange_dark_50 -> orange_dark_950
+        R.color.utility_orange_dark_500 -> "#ffff4405".toColorInt() // orange_dark_500
+        R.color.utility_orange_dark_600 -> if (isDay) "#ffe62e05".toColorInt() else "#ffff692e".toColorInt() // orange_dark_600 -> orange_dark_400
+        R.color.utility_orange_dark_700 -> if (isDay) "#ffbc1b06".toColorInt() else "#ffff9c66".toColorInt() // orange_dark_700 -> orange_dark_300
+        R.color.utility_pink_100 -> if (isDay) "#fffce7f6".toColorInt() else "#ff851651".toColorInt() // pink_100 -> pink_900
+        R.color.utility_pink_200 -> if (isDay) "#fffcceee".toColorInt() else "#ff9e165f".toColorInt() // pink_200 -> pink_800
+        R.color.utility_pink_300 -> if (isDay) "#fffaa7e0".toColorInt() else "#ffc11574".toColorInt() // pink_300 -> pink_700
+        R.color.utility_pink_400 -> if (isDay) "#fff670c7".toColorInt() else "#ffdd2590".toColorInt() // pink_400 -> pink_600
+        R.color.utility_pink_50 -> if (isDay) "#fffdf2fa".toColorInt() else "#ff4e0d30".toColorInt() // pink_50 -> pink_950
+        R.color.utility_pink_500 -> "#ffee46bc".toColorInt() // pink_500
+        R.color.utility_pink_600 -> if (isDay) "#ffdd2590".toColorInt() else "#fff670c7".toColorInt() // pink_600 -> pink_400
+        R.color.utility_pink_700 -> if (isDay) "#ffc11574".toColorInt() else "#fffaa7e0".toColorInt() // pink_700 -> pink_300
+        R.color.utility_purple_100 -> if (isDay) "#ffebe9fe".toColorInt() else "#ff3e1c96".toColorInt() // purple_100 -> purple_900
+        R.color.utility_purple_200 -> if (isDay) "#ffd9d6fe".toColorInt() else "#ff4a1fb8".toColorInt() // purple_200 -> purple_800
+        R.color.utility_purple_300 -> if (isDay) "#ffbdb4fe".toColorInt() else "#ff5925dc".toColorInt() // purple_300 -> purple_700
+        R.color.utility_purple_400 -> if (isDay) "#ff9b8afb".toColorInt() else "#ff6938ef".toColorInt() // purple_400 -> purple_600
+        R.color.utility_purple_50 -> if (isDay) "#fff4f3ff".toColorInt() else "#ff27115f".toColorInt() // purple_50 -> purple_950
+        R.color.utility_purple_500 -> "#ff7a5af8".toColorInt() // purple_500
+        R.color.utility_purple_600 -> if (isDay) "#ff6938ef".toColorInt() else "#ff9b8afb".toColorInt() // purple_600 -> purple_400
+        R.color.utility_purple_700 -> if (isDay) "#ff5925dc".toColorInt() else "#ffbdb4fe".toColorInt() // purple_700 -> purple_300
+        R.color.utility_success_100 -> if (isDay) "#ffdcfae6".toColorInt() else "#ff074d31".toColorInt() // success_100 -> success_900
+        R.color.utility_success_200 -> if (isDay) "#ffabefc6".toColorInt() else "#ff085d3a".toColorInt() // success_200 -> success_800
+        R.color.utility_success_300 -> if (isDay) "#ff75e0a7".toColorInt() else "#ff067647".toColorInt() // success_300 -> success_700
+        R.color.utility_success_400 -> if (isDay) "#ff47cd89".toColorInt() else "#ff079455".toColorInt() // success_400 -> success_600
+        R.color.utility_success_50 -> if (isDay) "#ffecfdf3".toColorInt() else "#ff053321".toColorInt() // success_50 -> success_950
+        R.color.utility_success_500 -> "#ff17b26a".toColorInt() // success_500
+        R.color.utility_success_600 -> if (isDay) "#ff079455".toColorInt() else "#ff47cd89".toColorInt() // success_600 -> success_400
+        R.color.utility_success_700 -> if (isDay) "#ff067647".toColorInt() else "#ff75e0a7".toColorInt() // success_700 -> success_300
+        R.color.utility_warning_100 -> if (isDay) "#fffef0c7".toColorInt() else "#ff7a2e0e".toColorInt() // warning_100 -> warning_900
+        R.color.utility_warning_200 -> if (isDay) "#fffedf89".toColorInt() else "#ff93370d".toColorInt() // warning_200 -> warning_800
+        R.color.utility_warning_300 -> if (isDay) "#fffec84b".toColorInt() else "#ffb54708".toColorInt() // warning_300 -> warning_700
+        R.color.utility_warning_400 -> if (isDay) "#fffdb022".toColorInt() else "#ffdc6803".toColorInt() // warning_400 -> warning_600
+        R.color.utility_warning_50 -> if (isDay) "#fffffaeb".toColorInt() else "#ff4e1d09".toColorInt() // warning_50 -> warning_950
+        R.color.utility_warning_500 -> "#fff79009".toColorInt() // warning_500
+        R.color.utility_warning_600 -> if (isDay) "#ffdc6803".toColorInt() else "#fffdb022".toColorInt() // warning_600 -> warning_400
+        R.color.utility_warning_700 -> if (isDay) "#ffb54708".toColorInt() else "#fffec84b".toColorInt() // warning_700 -> warning_300
+        R.color.utility_yellow_100 -> if (isDay) "#fffef7c3".toColorInt() else "#ff713b12".toColorInt() // yellow_100 -> yellow_900
+        R.color.utility_yellow_200 -> if (isDay) "#fffeee95".toColorInt() else "#ff854a0e".toColorInt() // yellow_200 -> yellow_800
+        R.color.utility_yellow_300 -> if (isDay) "#fffde272".toColorInt() else "#ffa15c07".toColorInt() // yellow_300 -> yellow_700
+        R.color.utility_yellow_400 -> if (isDay) "#fffac515".toColorInt() else "#ffca8504".toColorInt() // yellow_400 -> yellow_600
+        R.color.utility_yellow_50 -> if (isDay) "#fffefbe8".toColorInt() else "#ff542c0d".toColorInt() // yellow_50 -> yellow_950
+        R.color.utility_yellow_500 -> "#ffeaaa08".toColorInt() // yellow_500
+        R.color.utility_yellow_600 -> if (isDay) "#ffca8504".toColorInt() else "#fffac515".toColorInt() // yellow_600 -> yellow_400
+        R.color.utility_yellow_700 -> if (isDay) "#ffa15c07".toColorInt() else "#fffde272".toColorInt() // yellow_700 -> yellow_300
+        else -> NO_DEFAULT_COLOR
+    }
+}
\ No newline at end of file
@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import xml.etree.ElementTree as ET
 import re
 import os
 
+from color_utils import SEMANTIC_CATEGORIES, color_resource_files, parse_hex_color, semantic_category
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from token_snapshot import load_color_maps
+
+def iter_color_elements(file_path):
+    """遍历颜色XML中的color元素，按分类分片生成时依次读取所有分片"""
+    for path in color_resource_files(file_path) or [file_path]:
+        yield from ET.parse(path).getroot().findall('color')
+
 def read_semantic_colors(day_file_path, night_file_path):
     """读取日间和夜间的semantic_color.xml文件，获取颜色映射关系"""
     # 读取日间模式
-    day_tree = ET.parse(day_file_path)
-    day_root = day_tree.getroot()
-    
     day_semantic_colors = {}
-    for color in day_root.findall('color'):
+    for color in iter_color_elements(day_file_path):
         name = color.get('name')
         value = color.text
         if value and value.startswith('@color/'):
@@ -24,11 +31,8 @@ def read_semantic_colors(day_file_path, night_file_path):
             day_semantic_colors[name] = value
     
     # 读取夜间模式
-    night_tree = ET.parse(night_file_path)
-    night_root = night_tree.getroot()
-    
     night_semantic_colors = {}
-    for color in night_root.findall('color'):
+    for color in iter_color_elements(night_file_path):
         name = color.get('name')
         value = color.text
         if value and value.startswith('@color/'):
@@ -41,13 +45,20 @@ def read_semantic_colors(day_file_path, night_file_path):
     
     return day_semantic_colors, night_semantic_colors
 
+def strip_color_references(colors):
+    """将 @color/ 引用转换为primitive颜色名，与 read_semantic_colors 的结果格式相同"""
+    return {name: value.replace('@color/', '') if value.startswith('@color/') else value
+            for name, value in colors.items()}
+
+def read_colors_from_snapshot(snapshot_path):
+    """从tokens.py写出的令牌快照读取颜色，返回值与XML读取函数的格式相同"""
+    day_semantic, night_semantic, primitive_day, primitive_night = load_color_maps(snapshot_path)
+    return strip_color_references(day_semantic), strip_color_references(night_semantic), primitive_day, primitive_night
+
 def read_primitive_colors(primitive_file_path):
     """读取primitive_color.xml文件，获取具体颜色值"""
-    tree = ET.parse(primitive_file_path)
-    root = tree.getroot()
-    
     primitive_colors = {}
-    for color in root.findall('color'):
+    for color in iter_color_elements(primitive_file_path):
         name = color.get('name')
         value = color.text
         if value:
@@ -78,11 +89,22 @@ def get_final_color_value(day_semantic_colors, night_semantic_colors, primitive_
     
     return day_color, night_color, day_primitive_name, night_primitive_name
 
-def generate_kt_content(day_semantic_colors, night_semantic_colors, primitive_colors_day, primitive_colors_night):
-    """生成ExtAuColor.kt文件内容"""
-    
-    # 文件头部
-    header = '''package com.vau.ui
+# 各分类在生成代码中的注释标题
+CATEGORY_TITLES = {
+    'text': 'Text Colors',
+    'bg': 'Background Colors',
+    'border': 'Border Colors',
+    'fg': 'Foreground Colors',
+    'button': 'Button Colors',
+    'icon': 'Icon Colors',
+    'utility': 'Utility Colors',
+    'other': 'Other Colors',
+}
+
+MAIN_KT_FILE = "AuColor.kt"
+
+# 文件头部：公开的 asColor 扩展，拆分和不拆分时相同
+KT_FILE_HEADER = '''package com.vau.ui
 
 import android.content.res.Configuration
 import android.graphics.Color
@@ -102,30 +124,34 @@ fun Int.asColor(): Int {
         getDefaultColor()
     }
 }
+'''
 
-/**
- * 根据资源ID提供默认颜色
- * 使用从XML文件中提取的实际颜色值，支持日间和夜间模式
- */
-private fun Int.getDefaultColor(isDay: Boolean = true): Int {
-    return when (this) {'''
-    
-    # 生成颜色映射部分
-    color_mappings = []
-    
-    # 按类别分组处理颜色
-    categories = {
-        'text': [],
-        'bg': [],
-        'border': [],
-        'fg': [],
-        'button': [],
-        'icon': [],
-        'utility': [],
-        'other': []
-    }
+# 分类查找函数在资源ID不属于该分类时返回的哨兵值，用原始Int代替 Int? 避免装箱
+NO_DEFAULT_COLOR = "NO_DEFAULT_COLOR"
+
+def choose_missing_sentinel(palette):
+    """选择不在调色板中的哨兵颜色值：从 0x00000001 开始的全透明颜色中取第一个未使用的值"""
+    for sentinel in range(0x00000001, 0x01000000):
+        if sentinel not in palette:
+            return sentinel
+    raise ValueError("No free ARGB value for the missing color sentinel")
+
+def category_kt_file(category):
+    """分类颜色映射所在的文件名，如 AuColorText.kt"""
+    return f"AuColor{category.capitalize()}.kt"
+
+def category_function(category):
+    """分类颜色映射的查找函数名，如 textDefaultColor"""
+    return f"{category}DefaultColor"
+
+def collect_color_mappings(day_semantic_colors, night_semantic_colors, primitive_colors_day, primitive_colors_night,
+                           palette=None):
+    """按分类生成 when 分支，返回 分类 -> 分支代码行（空分类不出现）
+
+    传入 palette 集合时，同时收集生成代码中出现的所有ARGB值
+    """
+    categories = {category: [] for category in SEMANTIC_CATEGORIES}
     
-    # 将颜色按类别分组
     for semantic_name in sorted(day_semantic_colors.keys()):
         day_color, night_color, day_primitive_name, night_primitive_name = get_final_color_value(
             day_semantic_colors, night_semantic_colors, primitive_colors_day, primitive_colors_night, semantic_name)
@@ -139,51 +165,37 @@ private fun Int.getDefaultColor(isDay: Boolean = true): Int {
         else:
             comment_info = f"{day_primitive_name} -> {night_primitive_name}"
         
-        if semantic_name.startswith('text_'):
-            categories['text'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
-        elif semantic_name.startswith('bg_'):
-            categories['bg'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
-        elif semantic_name.startswith('border_'):
-            categories['border'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
-        elif semantic_name.startswith('fg_'):
-            categories['fg'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
-        elif semantic_name.startswith('button_'):
-            categories['button'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
-        elif 'icon' in semantic_name:
-            categories['icon'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
-        elif semantic_name.startswith('utility_'):
-            categories['utility'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
+        if palette is not None:
+            palette.update(argb & 0xFFFFFFFF for argb in map(parse_hex_color, (day_color, night_color))
+                           if argb is not None)
+        
+        # 如果日夜间颜色值相同，直接使用颜色值；否则生成判断逻辑
+        if day_color == night_color:
+            line = f'        {r_color_name} -> "{day_color}".toColorInt() // {comment_info}'
         else:
-            categories['other'].append((r_color_name, day_color, night_color, comment_info, semantic_name))
+            line = f'        {r_color_name} -> if (isDay) "{day_color}".toColorInt() else "{night_color}".toColorInt() // {comment_info}'
+        categories[semantic_category(semantic_name)].append(line)
+    
+    return {category: lines for category, lines in categories.items() if lines}
+
+def generate_kt_content(day_semantic_colors, night_semantic_colors, primitive_colors_day, primitive_colors_night):
+    """生成ExtAuColor.kt文件内容（所有分类在同一个 when 中）"""
+    
+    header = KT_FILE_HEADER + '''
+/**
+ * 根据资源ID提供默认颜色
+ * 使用从XML文件中提取的实际颜色值，支持日间和夜间模式
+ */
+private fun Int.getDefaultColor(isDay: Boolean = true): Int {
+    return when (this) {'''
     
     # 生成分类注释和映射
-    for category_name, colors in categories.items():
-        if colors:
-            if category_name == 'text':
-                color_mappings.append("        // Text Colors")
-            elif category_name == 'bg':
-                color_mappings.append("        // Background Colors") 
-            elif category_name == 'border':
-                color_mappings.append("        // Border Colors")
-            elif category_name == 'fg':
-                color_mappings.append("        // Foreground Colors")
-            elif category_name == 'button':
-                color_mappings.append("        // Button Colors")
-            elif category_name == 'icon':
-                color_mappings.append("        // Icon Colors")
-            elif category_name == 'utility':
-                color_mappings.append("        // Utility Colors")
-            elif category_name == 'other':
-                color_mappings.append("        // Other Colors")
-            
-            for r_color_name, day_color, night_color, comment_info, semantic_name in colors:
-                # 如果日夜间颜色值相同，直接使用颜色值；否则生成判断逻辑
-                if day_color == night_color:
-                    color_mappings.append(f'        {r_color_name} -> "{day_color}".toColorInt() // {comment_info}')
-                else:
-                    color_mappings.append(f'        {r_color_name} -> if (isDay) "{day_color}".toColorInt() else "{night_color}".toColorInt() // {comment_info}')
-            
-            color_mappings.append("")  # 添加空行分隔
+    color_mappings = []
+    for category_name, lines in collect_color_mappings(day_semantic_colors, night_semantic_colors,
+                                                       primitive_colors_day, primitive_colors_night).items():
+        color_mappings.append(f"        // {CATEGORY_TITLES[category_name]}")
+        color_mappings.extend(lines)
+        color_mappings.append("")  # 添加空行分隔
     
     # 文件尾部
     footer = '''        // 默认颜色
@@ -196,61 +208,165 @@ private fun Int.getDefaultColor(isDay: Boolean = true): Int {
     
     return full_content
 
-def main():
+def generate_category_kt_content(category, lines):
+    """生成单个分类的Kotlin文件内容：一个只包含该分类资源ID的小查找函数"""
+    return f'''package com.vau.ui
+
+import androidx.core.graphics.toColorInt
+
+/**
+ * {CATEGORY_TITLES[category]} 的默认颜色
+ * 资源ID不属于该分类时返回 {NO_DEFAULT_COLOR}，由 AuColor.kt 中的 getDefaultColor 依次查找
+ */
+internal fun Int.{category_function(category)}(isDay: Boolean): Int {{
+    return when (this) {{
+''' + "\n".join(lines) + f'''
+        else -> {NO_DEFAULT_COLOR}
+    }}
+}}'''
+
+def generate_kt_files(day_semantic_colors, night_semantic_colors, primitive_colors_day, primitive_colors_night):
+    """按分类拆分生成Kotlin文件，返回 文件名 -> 内容
+
+    AuColor.kt 只保留 asColor 和按分类依次查找的 getDefaultColor，
+    每个分类的映射位于各自的 AuColor<分类>.kt，颜色变化时只有所在分类的文件内容改变。
+    """
+    palette = set()
+    mappings = collect_color_mappings(day_semantic_colors, night_semantic_colors,
+                                      primitive_colors_day, primitive_colors_night, palette)
+    files = {category_kt_file(category): generate_category_kt_content(category, lines)
+             for category, lines in mappings.items()}
+    
+    # 哨兵值必须不同于任何生成的颜色，否则该颜色会被当作"不属于该分类"而继续查找
+    sentinel = choose_missing_sentinel(palette)
+    lookups = "".join(f"    {category_function(category)}(isDay).let {{ if (it != {NO_DEFAULT_COLOR}) return it }}\n"
+                      for category in mappings)
+    files[MAIN_KT_FILE] = KT_FILE_HEADER + f'''
+/**
+ * 分类查找函数表示"资源ID不属于该分类"的返回值，生成时已确认不在调色板中
+ */
+internal const val {NO_DEFAULT_COLOR} = 0x{sentinel:08X}
+
+/**
+ * 根据资源ID提供默认颜色
+ * 使用从XML文件中提取的实际颜色值，支持日间和夜间模式；各分类的映射见 AuColor<分类>.kt
+ */
+private fun Int.getDefaultColor(isDay: Boolean = true): Int {{
+{lookups}    return "#000000".toColorInt() // black
+}}'''
+    return files
+
+def write_kt_file(output_file, kt_content):
+    """写入Kotlin文件"""
+    with tracer.span('emit', file=output_file):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(kt_content)
+    tracer.count_written(kt_content)
+
+def write_kt_files(output_dir, kt_files):
+    """写入 generate_kt_files 生成的文件，返回实际写入的文件名
+
+    内容未变化的文件不重写，避免触发Kotlin增量编译；
+    不再生成的分类文件（分类变空或改为单文件输出）会被删除。
+    """
+    written = []
+    for file_name, kt_content in kt_files.items():
+        output_file = os.path.join(output_dir, file_name)
+        if os.path.exists(output_file):
+            with open(output_file, 'r', encoding='utf-8') as f:
+                if f.read() == kt_content:
+                    continue
+        write_kt_file(output_file, kt_content)
+        written.append(file_name)
+    
+    for category in SEMANTIC_CATEGORIES:
+        stale_file = os.path.join(output_dir, category_kt_file(category))
+        if category_kt_file(category) not in kt_files and os.path.exists(stale_file):
+            os.remove(stale_file)
+            print(f"Removed stale file: {stale_file}")
+    return written
+
+def main(argv=None):
     """主函数"""
+    parser = argparse.ArgumentParser(description='Generate AuColor.kt from semantic and primitive colors')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='Read colors from a token snapshot written by tokens.py --snapshot instead of the XML files')
+    parser.add_argument('--single-file', action='store_true',
+                        help='Write all mappings into one AuColor.kt instead of one file per color category')
+    parser.add_argument('--res-dir', default='.',
+                        help='Directory containing values/ and values-night/ (default: current directory)')
+    parser.add_argument('--output-dir', default='.',
+                        help='Directory that receives AuColor*.kt (default: current directory)')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
     # 文件路径
-    semantic_file_day = "/Users/bjsttlp312/android_color_resources/values/semantic_color.xml"
-    semantic_file_night = "/Users/bjsttlp312/android_color_resources/values-night/semantic_color.xml"
-    primitive_file_day = "/Users/bjsttlp312/android_color_resources/values/primitive_color.xml"
-    primitive_file_night = "/Users/bjsttlp312/android_color_resources/values-night/primitive_color.xml"
-    output_file = "/Users/bjsttlp312/android_color_resources/AuColor.kt"
+    semantic_file_day = os.path.join(args.res_dir, "values", "semantic_color.xml")
+    semantic_file_night = os.path.join(args.res_dir, "values-night", "semantic_color.xml")
+    primitive_file_day = os.path.join(args.res_dir, "values", "primitive_color.xml")
+    primitive_file_night = os.path.join(args.res_dir, "values-night", "primitive_color.xml")
+    output_dir = args.output_dir
     
     # 检查文件是否存在
-    if not os.path.exists(semantic_file_day):
-        print(f"错误: 文件不存在 {semantic_file_day}")
-        return
-        
-    if not os.path.exists(semantic_file_night):
-        print(f"错误: 文件不存在 {semantic_file_night}")
-        return
-    
-    if not os.path.exists(primitive_file_day):
-        print(f"错误: 文件不存在 {primitive_file_day}")
-        return
-        
-    if not os.path.exists(primitive_file_night):
-        print(f"错误: 文件不存在 {primitive_file_night}")
-        return
+    if not args.snapshot:
+        for file_path in (semantic_file_day, semantic_file_night, primitive_file_day, primitive_file_night):
+            if not color_resource_files(file_path):
+                print(f"错误: 文件不存在 {file_path}")
+                return
     
     try:
-        # 读取XML文件
-        print("正在读取日间和夜间模式的semantic_color.xml...")
-        day_semantic_colors, night_semantic_colors = read_semantic_colors(semantic_file_day, semantic_file_night)
-        print(f"读取到 {len(day_semantic_colors)} 个日间语义颜色和 {len(night_semantic_colors)} 个夜间语义颜色")
-        
-        print("正在读取日间模式primitive_color.xml...")
-        primitive_colors_day = read_primitive_colors(primitive_file_day)
-        print(f"读取到 {len(primitive_colors_day)} 个日间基础颜色")
-        
-        print("正在读取夜间模式primitive_color.xml...")
-        primitive_colors_night = read_primitive_colors(primitive_file_night)
-        print(f"读取到 {len(primitive_colors_night)} 个夜间基础颜色")
+        if args.snapshot:
+            print(f"正在读取令牌快照 {args.snapshot}...")
+            try:
+                with tracer.span('load', file=args.snapshot):
+                    (day_semantic_colors, night_semantic_colors,
+                     primitive_colors_day, primitive_colors_night) = read_colors_from_snapshot(args.snapshot)
+            except (OSError, ValueError) as e:
+                # 快照不存在、格式无效或已过期时不使用旧数据生成
+                print(f"错误: {e}")
+                return
+            print(f"读取到 {len(day_semantic_colors)} 个日间语义颜色和 {len(night_semantic_colors)} 个夜间语义颜色")
+        else:
+            # 读取XML文件
+            print("正在读取日间和夜间模式的semantic_color.xml...")
+            with tracer.span('load', module='semantic colors'):
+                day_semantic_colors, night_semantic_colors = read_semantic_colors(semantic_file_day, semantic_file_night)
+            print(f"读取到 {len(day_semantic_colors)} 个日间语义颜色和 {len(night_semantic_colors)} 个夜间语义颜色")
+            
+            print("正在读取日间模式primitive_color.xml...")
+            with tracer.span('load', file=primitive_file_day):
+                primitive_colors_day = read_primitive_colors(primitive_file_day)
+            print(f"读取到 {len(primitive_colors_day)} 个日间基础颜色")
+            
+            print("正在读取夜间模式primitive_color.xml...")
+            with tracer.span('load', file=primitive_file_night):
+                primitive_colors_night = read_primitive_colors(primitive_file_night)
+            print(f"读取到 {len(primitive_colors_night)} 个夜间基础颜色")
         
         # 生成Kotlin代码
         print("正在生成AuColor.kt内容...")
-        kt_content = generate_kt_content(day_semantic_colors, night_semantic_colors, primitive_colors_day, primitive_colors_night)
+        with tracer.span('resolve'):
+            if args.single_file:
+                kt_files = {MAIN_KT_FILE: generate_kt_content(day_semantic_colors, night_semantic_colors,
+                                                              primitive_colors_day, primitive_colors_night)}
+            else:
+                kt_files = generate_kt_files(day_semantic_colors, night_semantic_colors,
+                                             primitive_colors_day, primitive_colors_night)
         
-        # 写入文件
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(kt_content)
+        # 写入文件，内容未变化的文件保持不动
+        os.makedirs(output_dir, exist_ok=True)
+        written = write_kt_files(output_dir, kt_files)
         
-        print(f"成功生成 AuColor.kt")
+        print(f"成功生成 {len(kt_files)} 个Kotlin文件，其中 {len(written)} 个有变化: {', '.join(written) or '无'}")
         print(f"生成的文件包含 {len(day_semantic_colors)} 个颜色映射")
         
     except Exception as e:
         print(f"生成过程中发生错误: {e}")
         import traceback
         traceback.print_exc()
+    
+    finish_from_args(args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+生成流水线基准测试：按1×/10×/100×规模合成设计令牌JSON和SVG图标集，
+在独立的子进程中依次运行 tokens / theme / aucolorKt / svg 各阶段，
+记录耗时与峰值内存（RSS），结果写入JSON，便于在不同提交之间比较。
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import re
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_DIR = Path(__file__).resolve().parent
+SOURCE_JSON = "design-tokens.tokens(5).json"
+SOURCE_SVG_DIR = "svgs"
+
+STAGES = ['tokens', 'theme', 'aucolorKt', 'svg']
+DEFAULT_SCALES = [1, 10, 100]
+
+# 名称末尾的括号部分，如 "text-primary (900)"、"display 2xl（72）"
+TRAILING_BRACKET = re.compile(r'^(.*?)(\s*[（(][^)）]*[)）])?$')
+
+
+def is_token(node: Any) -> bool:
+    """判断节点是否为一个令牌（叶子节点或字体样式这类复合令牌）"""
+    if not isinstance(node, dict):
+        return False
+    if 'type' in node:
+        return True
+    return 'fontSize' in node and all(isinstance(v, dict) and 'type' in v for v in node.values())
+
+
+def copy_name(name: str, index: int) -> str:
+    """生成副本名称，后缀插在末尾括号之前，保证生成的资源名唯一且可解析"""
+    if name.isdigit():
+        # 色阶节点（如 gray.500）只有数字名才会保留父节点名称，副本也需保持纯数字
+        return f"{name}{index:03d}"
+    base, bracket = TRAILING_BRACKET.match(name).groups()
+    return f"{base}-x{index}{bracket or ''}"
+
+
+def scale_tokens(node: Dict[str, Any], scale: int) -> int:
+    """将每个令牌复制为scale份（原地修改），返回令牌总数"""
+    count = 0
+    for key in list(node.keys()):
+        child = node[key]
+        if is_token(child):
+            count += scale
+            for index in range(2, scale + 1):
+                node[copy_name(key, index)] = copy.deepcopy(child)
+        elif isinstance(child, dict):
+            count += scale_tokens(child, scale)
+    return count
+
+
+def make_workdir(root: Path, scale: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """创建某一规模的工作目录，写入合成的JSON和SVG，返回规模信息"""
+    workdir = root / f"x{scale}"
+    workdir.mkdir(parents=True)
+
+    scaled = copy.deepcopy(data)
+    token_count = scale_tokens(scaled, scale)
+    json_path = workdir / SOURCE_JSON
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(scaled, f, ensure_ascii=False, indent=2)
+
+    # tokens.py 从 static/ 读取字体信息
+    static_dir = REPO_DIR / "static"
+    if static_dir.is_dir():
+        os.symlink(static_dir, workdir / "static")
+
+    svg_out = workdir / "svgs"
+    svg_out.mkdir()
+    svg_files = sorted((REPO_DIR / SOURCE_SVG_DIR).glob('*.svg'))
+    for index in range(1, scale + 1):
+        for svg_file in svg_files:
+            shutil.copyfile(svg_file, svg_out / f"{svg_file.stem}_x{index}.svg")
+
+    return {
+        'scale': scale,
+        'workdir': str(workdir),
+        'tokens': token_count,
+        'json_bytes': json_path.stat().st_size,
+        'svg_files': len(svg_files) * scale,
+    }
+
+
+def run_stage(stage: str) -> None:
+    """在当前目录运行单个阶段（子进程内调用）"""
+    if stage == 'tokens':
+        import tokens
+        tokens.main([])
+    elif stage == 'theme':
+        import theme
+        theme.main([])
+    elif stage == 'aucolorKt':
+        import aucolorKt
+        aucolorKt.main([])
+    elif stage == 'svg':
+        from svg_to_vector import SvgToVectorConverter
+        SvgToVectorConverter().convert_directory("svgs", "vectors")
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+
+
+def peak_rss_kb() -> int:
+    """返回当前进程的峰值RSS（KB）
+
+    Linux上读取 /proc/self/status 的 VmHWM：getrusage 的 ru_maxrss 会继承
+    fork 前父进程的峰值，无法反映阶段本身的内存占用。
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss 在Linux上单位是KB，在macOS上是字节
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss // 1024 if sys.platform == 'darwin' else max_rss
+
+
+def measure_stage(stage: str, workdir: str) -> Dict[str, float]:
+    """在子进程中运行一个阶段，返回耗时（秒）和峰值RSS（KB）"""
+    fd, result_file = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(REPO_DIR), env.get('PYTHONPATH')]))
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+
+    try:
+        process = subprocess.run(
+            [sys.executable, str(REPO_DIR / "benchmark.py"), '--run-stage', stage, '--result', result_file],
+            cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if process.returncode != 0:
+            raise RuntimeError(f"Stage {stage} failed in {workdir}:\n{process.stderr.decode('utf-8', 'replace')}")
+
+        with open(result_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(result_file)
+
+
+def git_revision() -> str:
+    """返回当前提交，不在git仓库中时返回空字符串"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_benchmarks(scales: List[int], stages: List[str], repeat: int, keep: bool) -> Dict[str, Any]:
+    """运行所有规模和阶段的基准测试"""
+    with open(REPO_DIR / SOURCE_JSON, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    root = Path(tempfile.mkdtemp(prefix='token_bench_'))
+    results = []
+    try:
+        for scale in scales:
+            info = make_workdir(root, scale, data)
+            print(f"Scale {scale}x: {info['tokens']} tokens, {info['json_bytes']:,} bytes JSON, "
+                  f"{info['svg_files']} SVG files")
+
+            for stage in stages:
+                runs = [measure_stage(stage, info['workdir']) for _ in range(repeat)]
+                times = [run['elapsed'] for run in runs]
+                result = {
+                    'stage': stage,
+                    'scale': scale,
+                    'tokens': info['tokens'],
+                    'json_bytes': info['json_bytes'],
+                    'svg_files': info['svg_files'],
+                    'runs': times,
+                    'min': min(times),
+                    'median': statistics.median(times),
+                    'peak_rss_kb': max(run['peak_rss_kb'] for run in runs),
+                }
+                results.append(result)
+                print(f"  {stage:<10} min {result['min'] * 1000:9.1f} ms  "
+                      f"median {result['median'] * 1000:9.1f} ms  "
+                      f"peak RSS {result['peak_rss_kb'] / 1024:7.1f} MB")
+    finally:
+        if keep:
+            print(f"Work directories kept in {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Benchmark the token-to-resource pipeline')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help='Token/SVG multipliers to benchmark (default: 1 10 100)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES,
+                        help='Stages to run, in order (default: all)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per stage and scale (default: 3)')
+    parser.add_argument('--output', '-o', default='benchmark_results.json',
+                        help='Result JSON file (default: benchmark_results.json)')
+    parser.add_argument('--keep', action='store_true',
+                        help='Keep the generated work directories')
+    parser.add_argument('--run-stage', choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_stage:
+        start = time.perf_counter()
+        run_stage(args.run_stage)
+        elapsed = time.perf_counter() - start
+        with open(args.result, 'w', encoding='utf-8') as f:
+            json.dump({'elapsed': elapsed, 'peak_rss_kb': peak_rss_kb()}, f)
+        return
+
+    report = run_benchmarks(args.scales, args.stages, max(args.repeat, 1), args.keep)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+多品牌生成：按配置文件为每个白标品牌生成一套独立的日夜间资源。
+设计令牌JSON只加载一次，原子颜色、间距、渐变、圆角、字体样式等与品牌无关的层在主进程中
+解析一次后共享给工作进程；各品牌只替换自己的色阶和原子颜色覆盖、选择自己的语义颜色集合，
+再并行解析语义颜色并写出资源、主题和AuColor.kt。
+品牌语义颜色集合中的所有模式都会解析，日夜间以外的模式按 --mode-qualifier 写入各自的资源目录。
+
+配置示例（brands.example.json）：
+    {
+      "tokens": "design-tokens.tokens(5).json",
+      "output_dir": "brands",
+      "brands": {
+        "aui": {"light_theme": "AUIAppTheme", "dark_theme": "TintAUIAppTheme"},
+        "indigo": {"ramps": {"brand": "indigo"}, "primitives": {"brand_600": "#3538CD"}}
+      }
+    }
+"""
+
+import argparse
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Dict, List, Optional, Tuple
+
+import aucolorKt
+from color_utils import check_semantic_contrast, parse_hex_color
+from export_targets import export_targets
+from generate_android_fonts import build_font_weight_indexes
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from name_registry import NameRegistry, DEFAULT_REGISTRY_FILE
+from palette_dedupe import DEFAULT_MERGE_MAP_FILE
+from theme import generate_theme_files
+from tokens import (LIGHT_MODE, DARK_MODE, load_json_file, discover_modes, parse_mode_qualifiers,
+                    process_primitive_modes, process_shared_layers, resolve_token_model)
+
+DEFAULT_CONFIG = "brands.json"
+DEFAULT_COLOR_MODES = "1. color modes"
+
+BRAND_KEYS = {'color_modes', 'ramps', 'primitives', 'light_theme', 'dark_theme'}
+
+# 色阶中的颜色名，如 brand_500
+RAMP_STEP = re.compile(r'^(.+)_(\d+)$')
+
+
+class BrandConfig:
+    """单个品牌的配置
+
+    Attributes:
+        name: 品牌名，同时是输出子目录名
+        color_modes: 使用的语义颜色集合（JSON顶层节点名）
+        ramps: 色阶替换，如 {"brand": "indigo"} 表示 brand_* 使用 indigo_* 的颜色
+        primitives: 单个原子颜色的覆盖值，如 {"brand_600": "#3538CD"}
+        light_theme: 日间主题名
+        dark_theme: 夜间主题名
+    """
+
+    __slots__ = ('name', 'color_modes', 'ramps', 'primitives', 'light_theme', 'dark_theme')
+
+    def __init__(self, name: str, color_modes: str = DEFAULT_COLOR_MODES,
+                 ramps: Optional[Dict[str, str]] = None, primitives: Optional[Dict[str, str]] = None,
+                 light_theme: Optional[str] = None, dark_theme: Optional[str] = None):
+        self.name = name
+        self.color_modes = color_modes
+        self.ramps = ramps or {}
+        self.primitives = primitives or {}
+        self.light_theme = light_theme or f"{name.capitalize()}AppTheme"
+        self.dark_theme = dark_theme or f"Tint{name.capitalize()}AppTheme"
+
+    @classmethod
+    def from_dict(cls, name: str, config: Dict[str, Any]) -> 'BrandConfig':
+        unknown = set(config) - BRAND_KEYS
+        if unknown:
+            raise ValueError(f"Brand '{name}': unknown keys {', '.join(sorted(unknown))}")
+        for color_name, value in config.get('primitives', {}).items():
+            if parse_hex_color(value) is None:
+                raise ValueError(f"Brand '{name}': invalid color for '{color_name}': {value}")
+        return cls(name, **config)
+
+
+def load_config(file_path: str) -> Tuple[str, str, List[BrandConfig]]:
+    """读取品牌配置，返回 (令牌JSON路径, 输出根目录, 品牌列表)"""
+    config = load_json_file(file_path)
+    brands = config.get('brands')
+    if not brands:
+        raise ValueError(f"No brands defined in {file_path}")
+    return (config.get('tokens', 'design-tokens.tokens(5).json'),
+            config.get('output_dir', 'brands'),
+            [BrandConfig.from_dict(name, brand) for name, brand in brands.items()])
+
+
+def build_shared_layer(data: Dict[str, Any], static_dir: str = "static",
+                       registry_file: Optional[str] = DEFAULT_REGISTRY_FILE, source: str = '',
+                       merge_map_file: Optional[str] = DEFAULT_MERGE_MAP_FILE) -> Dict[str, Any]:
+    """解析与品牌无关的令牌层，所有品牌共用
+
+    名称注册表只读取不写回，各品牌的语义颜色沿用主流水线登记的资源名。
+    原子颜色按所有语义颜色集合中出现过的模式解析，每个品牌再取自己集合中的模式。
+    """
+    modes = tuple(dict.fromkeys(mode for key in data if 'color modes' in key.lower()
+                                for mode in discover_modes(brand_view(data, key))))
+    return {
+        'source': source,
+        'primitives_by_mode': process_primitive_modes(data, modes),
+        'layers': process_shared_layers(data),
+        'font_indexes': build_font_weight_indexes(static_dir),
+        'name_registry': NameRegistry(registry_file),
+        'merge_map_file': merge_map_file,
+    }
+
+
+def apply_brand_primitives(colors: Dict[str, str], brand: BrandConfig) -> Dict[str, str]:
+    """返回套用品牌色阶替换和覆盖值后的原子颜色，资源名保持不变"""
+    if not brand.ramps and not brand.primitives:
+        return colors
+
+    result = dict(colors)
+    if brand.ramps:
+        for name in colors:
+            match = RAMP_STEP.match(name)
+            if match and match.group(1) in brand.ramps:
+                source = f"{brand.ramps[match.group(1)]}_{match.group(2)}"
+                if source in colors:
+                    result[name] = colors[source]
+    for name, value in brand.primitives.items():
+        if name in result:
+            result[name] = value
+        else:
+            print(f"Warning: brand '{brand.name}' overrides unknown primitive color '{name}'")
+    return result
+
+
+def brand_view(data: Dict[str, Any], color_modes: str) -> Dict[str, Any]:
+    """构造只包含品牌语义颜色集合的浅拷贝，其余节点与原数据共享
+
+    tokens.py 按 '1. color modes' 解析集合内的相互引用，所以所选集合统一挂在这个名称下。
+    """
+    if color_modes not in data:
+        raise ValueError(f"Color modes collection '{color_modes}' not found in JSON")
+    view = {key: value for key, value in data.items() if 'color modes' not in key.lower()}
+    view[DEFAULT_COLOR_MODES] = data[color_modes]
+    return view
+
+
+def write_brand_resources(data: Dict[str, Any], shared: Dict[str, Any], brand: BrandConfig,
+                          output_dir: str, mode_qualifiers: Optional[Dict[str, str]] = None) -> Tuple[int, int]:
+    """生成一个品牌的全部资源，返回 (语义颜色数量, 对比度不足的组合数)
+
+    Args:
+        mode_qualifiers: 模式 -> 资源目录，日夜间以外没有目录的模式不生成
+    """
+    view = brand_view(data, brand.color_modes)
+    primitives_by_mode = {mode: apply_brand_primitives(shared['primitives_by_mode'][mode], brand)
+                          for mode in discover_modes(view)}
+
+    # 与 tokens.py 相同的解析步骤（合并映射、夜间颜色推导），只替换原子颜色
+    model = resolve_token_model(view, shared['source'], shared['name_registry'], shared['merge_map_file'],
+                                shared['font_indexes'], primitives_by_mode, shared['layers'],
+                                save_registry=False)
+    # 与 tokens.py 相同的 android 导出目标：values/、values-night/ 以及其他模式的资源目录
+    export_targets(model, ['android'], output_dir, {'mode_qualifiers': mode_qualifiers or {}})
+
+    light_semantic, dark_semantic = model.semantic(LIGHT_MODE), model.semantic(DARK_MODE)
+    light_colors, dark_colors = dict(model.primitives(LIGHT_MODE)), dict(model.primitives(DARK_MODE))
+    light_values = {name: token.value for name, token in light_semantic.items()}
+    dark_values = {name: token.value for name, token in dark_semantic.items()}
+    values_dir = os.path.join(output_dir, "values")
+    generate_theme_files(light_values, dark_values, light_colors, dark_colors,
+                         os.path.join(values_dir, "semantic_color_attrs.xml"),
+                         os.path.join(values_dir, "themes.xml"),
+                         brand.light_theme, brand.dark_theme)
+
+    kt_files = aucolorKt.generate_kt_files(aucolorKt.strip_color_references(light_values),
+                                           aucolorKt.strip_color_references(dark_values),
+                                           light_colors, dark_colors)
+    aucolorKt.write_kt_files(output_dir, kt_files)
+
+    failures = check_semantic_contrast(light_semantic, dark_semantic, light_colors, dark_colors)
+    return len(light_semantic), len(failures)
+
+
+# 工作进程内共享的令牌数据和品牌无关层，由进程池初始化时设置一次
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(data: Dict[str, Any], shared: Dict[str, Any], mode_qualifiers: Dict[str, str]) -> None:
+    _worker_state['data'] = data
+    _worker_state['shared'] = shared
+    _worker_state['mode_qualifiers'] = mode_qualifiers
+
+
+def generate_brand(brand: BrandConfig, output_dir: str) -> Tuple[str, Tuple[int, int], float, str]:
+    """在工作进程中生成一个品牌，输出先缓存再由主进程按顺序打印，避免交错
+
+    Returns:
+        (品牌名, (语义颜色数量, 对比度不足的组合数), 耗时秒, 日志)
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    with redirect_stdout(log):
+        counts = write_brand_resources(_worker_state['data'], _worker_state['shared'], brand, output_dir,
+                                       _worker_state['mode_qualifiers'])
+    return brand.name, counts, time.perf_counter() - start, log.getvalue()
+
+
+def generate_brands(data: Dict[str, Any], shared: Dict[str, Any], brands: List[BrandConfig],
+                    output_root: str, jobs: Optional[int] = None,
+                    mode_qualifiers: Optional[Dict[str, str]] = None) -> List[Tuple[str, Tuple[int, int], float, str]]:
+    """并行生成所有品牌，jobs为1时在当前进程中依次生成"""
+    output_dirs = [os.path.join(output_root, brand.name) for brand in brands]
+    initargs = (data, shared, mode_qualifiers or {})
+    if jobs == 1 or len(brands) == 1:
+        _init_worker(*initargs)
+        return [generate_brand(brand, output_dir) for brand, output_dir in zip(brands, output_dirs)]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=initargs) as executor:
+        return list(executor.map(generate_brand, brands, output_dirs))
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Generate one Android resource set per brand from a shared token file')
+    parser.add_argument('config', nargs='?', default=DEFAULT_CONFIG,
+                        help=f'Brand config JSON (default: {DEFAULT_CONFIG})')
+    parser.add_argument('--brand', action='append', default=[],
+                        help='Only generate this brand; repeat for several (default: all)')
+    parser.add_argument('--static-dir', default='static', help='Font directory (default: static)')
+    parser.add_argument('--jobs', type=int,
+                        help='Number of worker processes (default: CPU count, 1 = sequential)')
+    parser.add_argument('--log', action='store_true', help='Print the full generator output of every brand')
+    parser.add_argument('--mode-qualifier', action='append', default=[], metavar='MODE=DIR',
+                        help="Resource directory for an extra mode in every brand, e.g. "
+                             "'high contrast mode=values-v31' (see tokens.py --mode-qualifier)")
+    parser.add_argument('--merge-map', default=DEFAULT_MERGE_MAP_FILE, metavar='FILE',
+                        help=f'Primitive merge map applied to every brand, as in tokens.py '
+                             f'(default: {DEFAULT_MERGE_MAP_FILE})')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    try:
+        mode_qualifiers = parse_mode_qualifiers(args.mode_qualifier)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    try:
+        json_file, output_root, brands = load_config(args.config)
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.config}")
+        return
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    if args.brand:
+        unknown = set(args.brand) - {brand.name for brand in brands}
+        if unknown:
+            print(f"Error: unknown brand(s): {', '.join(sorted(unknown))}")
+            return
+        brands = [brand for brand in brands if brand.name in args.brand]
+
+    start = time.perf_counter()
+    print(f"Loading {json_file}...")
+    with tracer.span('load', file=json_file):
+        data = load_json_file(json_file)
+    with tracer.span('walk', module='shared layer'):
+        shared = build_shared_layer(data, args.static_dir, source=json_file,
+                                    merge_map_file=args.merge_map)
+    for brand in brands:
+        if brand.color_modes not in data:
+            print(f"Error: brand '{brand.name}' uses unknown color modes collection '{brand.color_modes}'")
+            return
+
+    print(f"\nGenerating {len(brands)} brand(s) into {output_root}/...")
+    with tracer.span('emit', brands=len(brands)):
+        results = generate_brands(data, shared, brands, output_root, args.jobs, mode_qualifiers)
+
+    for name, (count, failures), elapsed, log in results:
+        if args.log:
+            print(f"\n--- {name} ---\n{log}")
+        print(f"  {name:<20} {count} semantic colors, {failures} contrast warnings  "
+              f"{elapsed * 1000:8.1f} ms  -> {os.path.join(output_root, name)}")
+    print(f"\nDone in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    finish_from_args(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+栅格断点：将 grid（mobile / tablet / desktop 的列栅格）、4. widths 和 5. containers 转换为
+values-w<N>dp 限定的栅格尺寸和 Kotlin 断点对象 ktClass/AppBreakpoints.kt。
+断点按当前窗口宽度（w<N>dp）划分，与 WindowSizeClass 相同；分屏、自由窗口下窗口宽度小于屏幕最小宽度，
+不使用 sw<N>dp。
+每个断点的列宽、边距和内容宽度在生成时算好，布局直接读取常量，自定义栅格控件不必在每次测量时计算。
+
+窗口尺寸类别按 Material 的划分：compact (<600dp) 使用 mobile 栅格，medium (600~839dp) 使用 tablet 栅格，
+expanded (>=840dp) 使用 desktop 栅格。Figma 中的栅格边距是在设计画板宽度下量得的，实际边距取它与
+容器内边距令牌中的较小值，内容宽度不超过 container-max-width 减去两侧内边距。
+"""
+
+import argparse
+import math
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from tokens import KOTLIN_PACKAGE, load_json_file, write_resource_xml
+
+# 窗口尺寸类别：(名称, 最小宽度dp, 使用的栅格, 容器内边距令牌)
+WINDOW_SIZE_CLASSES: List[Tuple[str, int, str, str]] = [
+    ('compact', 0, 'mobile', 'container_padding_mobile'),
+    ('medium', 600, 'tablet', 'container_padding_desktop'),
+    ('expanded', 840, 'desktop', 'container_padding_desktop'),
+]
+
+CONTAINER_MAX_WIDTH = 'container_max_width_desktop'
+
+# 令牌名前的括号数值，如 (320)width-xxs
+NAME_PREFIX = re.compile(r'^\([^)]*\)\s*')
+
+# 引用中的像素值，如 {primitives.mode 1.spacing.80 (320px)}、(1,280px)
+PIXEL_VALUE = re.compile(r'\(([\d,.]+)px\)')
+
+
+class GridSpec:
+    """Figma 列栅格
+
+    Attributes:
+        name: 栅格名，如 mobile
+        columns: 列数
+        gutter: 列间距（dp）
+        offset: 设计画板上的左右边距（dp）
+    """
+
+    __slots__ = ('name', 'columns', 'gutter', 'offset')
+
+    def __init__(self, name: str, columns: int, gutter: float, offset: float):
+        self.name = name
+        self.columns = columns
+        self.gutter = gutter
+        self.offset = offset
+
+    def __repr__(self):
+        return f"GridSpec({self.name!r}, columns={self.columns}, gutter={self.gutter}, offset={self.offset})"
+
+
+class GridLayout:
+    """某个断点宽度下算好的栅格"""
+
+    __slots__ = ('min_width', 'size_class', 'grid', 'margin', 'content_width', 'column_width')
+
+    def __init__(self, min_width: int, size_class: str, grid: GridSpec, margin: float,
+                 content_width: float, column_width: float):
+        self.min_width = min_width
+        self.size_class = size_class
+        self.grid = grid
+        self.margin = margin
+        self.content_width = content_width
+        self.column_width = column_width
+
+
+def parse_dimension_token(key: str, node: Dict[str, Any]) -> Tuple[str, Optional[float]]:
+    """返回 (资源名, dp值)，值取自引用中的像素值，没有时取名称前缀中的数值"""
+    name = NAME_PREFIX.sub('', key).strip().lower()
+    name = re.sub(r'[^a-z0-9]+', '_', name).strip('_')
+    value = node.get('value')
+    match = PIXEL_VALUE.search(value) if isinstance(value, str) else None
+    if match:
+        return name, float(match.group(1).replace(',', ''))
+    if isinstance(value, (int, float)):
+        return name, float(value)
+    prefix = re.match(r'^\(([\d,.]+)\)', key)
+    return name, float(prefix.group(1).replace(',', '')) if prefix else None
+
+
+def process_dimension_group(data: Dict[str, Any], key_part: str) -> Dict[str, float]:
+    """提取 4. widths / 5. containers 这类按名称前缀数值组织的尺寸令牌"""
+    group_key = next((key for key in data if key_part in key.lower()), None)
+    if group_key is None:
+        print(f"Warning: '{key_part}' not found in JSON")
+        return {}
+    values: Dict[str, float] = {}
+    for key, node in data[group_key].items():
+        if isinstance(node, dict) and node.get('type') == 'dimension':
+            name, value = parse_dimension_token(key, node)
+            if value is None:
+                print(f"Warning: cannot resolve dimension {group_key}.{key}")
+            else:
+                values[name] = value
+    return values
+
+
+def process_grids(data: Dict[str, Any]) -> Dict[str, GridSpec]:
+    """提取 grid 中 'grid <名称>' 的拉伸列栅格，居中参考线和行栅格不参与计算"""
+    grids: Dict[str, GridSpec] = {}
+    for key, node in data.get('grid', {}).items():
+        match = re.match(r'^grid\s+(.+)$', key.strip().lower())
+        if not match or not isinstance(node, dict):
+            continue
+        for child in node.values():
+            if not isinstance(child, dict) or child.get('type') != 'custom-grid':
+                continue
+            value = child.get('value', {})
+            if value.get('pattern') == 'columns' and value.get('alignment') == 'stretch':
+                grids[match.group(1)] = GridSpec(match.group(1), int(value.get('count', 1)),
+                                                 float(value.get('gutterSize', 0)), float(value.get('offset', 0)))
+                break
+    return grids
+
+
+def size_class_for(width: int) -> Tuple[str, int, str, str]:
+    """返回宽度所属的窗口尺寸类别"""
+    result = WINDOW_SIZE_CLASSES[0]
+    for entry in WINDOW_SIZE_CLASSES:
+        if width >= entry[1]:
+            result = entry
+    return result
+
+
+def compute_layout(width: int, grids: Dict[str, GridSpec], containers: Dict[str, float],
+                   min_width: Optional[int] = None) -> Optional[GridLayout]:
+    """计算宽度为 width 时的栅格；min_width 为资源限定符使用的断点，默认与 width 相同"""
+    size_class, _, grid_name, padding_name = size_class_for(width)
+    grid = grids.get(grid_name)
+    if grid is None:
+        return None
+    padding = min(grid.offset, containers.get(padding_name, grid.offset))
+    content = width - 2 * padding
+    if CONTAINER_MAX_WIDTH in containers:
+        content = min(content, containers[CONTAINER_MAX_WIDTH] - 2 * padding)
+    column = (content - grid.gutter * (grid.columns - 1)) / grid.columns
+    return GridLayout(width if min_width is None else min_width, size_class, grid,
+                      (width - content) / 2, content, column)
+
+
+def build_layouts(widths: Dict[str, float], grids: Dict[str, GridSpec],
+                  containers: Dict[str, float]) -> List[GridLayout]:
+    """为每个断点计算栅格
+
+    断点为 width-* 令牌和窗口尺寸类别的边界，按宽度排序。每个断点区间按区间下限计算，
+    保证区间内任意宽度下列宽都不会溢出；最小的断点同时作为不带限定符的默认值。
+    """
+    points = sorted({int(value) for name, value in widths.items() if name.startswith('width_')}
+                    | {entry[1] for entry in WINDOW_SIZE_CLASSES if entry[1] > 0})
+    if not points:
+        return []
+    layouts = []
+    for index, point in enumerate(points):
+        layout = compute_layout(point, grids, containers, 0 if index == 0 else point)
+        if layout is None:
+            print(f"Warning: no grid for {size_class_for(point)[0]} at {point}dp")
+            continue
+        layouts.append(layout)
+    return layouts
+
+
+def format_dp(value: float) -> str:
+    """向下保留两位小数，避免列宽四舍五入后总宽度超出"""
+    return f"{math.floor(value * 100 + 1e-6) / 100:g}"
+
+
+def qualifier_dir(min_width: int) -> str:
+    return "values" if min_width == 0 else f"values-w{min_width}dp"
+
+
+def generate_grid_dimens(layouts: List[GridLayout], output_dir: str) -> List[str]:
+    """每个断点写一个 grid_dimens.xml，返回生成的目录名；删除已不存在的断点留下的旧文件"""
+    generated = []
+    for layout in layouts:
+        xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
+        xml_content += f'<!-- {layout.size_class} ({layout.grid.name} grid), {layout.grid.columns} columns -->\n'
+        xml_content += '<resources>\n'
+        xml_content += f'    <integer name="grid_columns">{layout.grid.columns}</integer>\n'
+        xml_content += f'    <dimen name="grid_gutter">{format_dp(layout.grid.gutter)}dp</dimen>\n'
+        xml_content += f'    <dimen name="grid_margin">{format_dp(layout.margin)}dp</dimen>\n'
+        xml_content += f'    <dimen name="grid_content_width">{format_dp(layout.content_width)}dp</dimen>\n'
+        xml_content += f'    <dimen name="grid_column_width">{format_dp(layout.column_width)}dp</dimen>\n'
+        xml_content += '</resources>'
+        directory = qualifier_dir(layout.min_width)
+        write_resource_xml(xml_content, os.path.join(output_dir, directory), "grid_dimens.xml")
+        generated.append(directory)
+
+    if os.path.isdir(output_dir):
+        for entry in os.listdir(output_dir):
+            stale = os.path.join(output_dir, entry, "grid_dimens.xml")
+            # 也清理改用窗口宽度限定符之前生成的 values-sw<N>dp
+            if re.match(r'^values-s?w\d+dp$', entry) and entry not in generated and os.path.exists(stale):
+                os.remove(stale)
+                print(f"Removed: {stale}")
+                if not os.listdir(os.path.join(output_dir, entry)):
+                    os.rmdir(os.path.join(output_dir, entry))
+    return generated
+
+
+def generate_width_dimens(widths: Dict[str, float], containers: Dict[str, float], output_dir: str) -> None:
+    """写出宽度和容器尺寸令牌"""
+    xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
+    xml_content += '<resources>\n'
+    for name, value in sorted(widths.items(), key=lambda item: (item[1], item[0])):
+        xml_content += f'    <dimen name="{name}">{format_dp(value)}dp</dimen>\n'
+    for name, value in containers.items():
+        xml_content += f'    <dimen name="{name}">{format_dp(value)}dp</dimen>\n'
+    xml_content += '</resources>'
+    write_resource_xml(xml_content, os.path.join(output_dir, "values"), "width_dimens.xml")
+
+
+def kotlin_float(value: float) -> str:
+    return f"{format_dp(value)}f" if '.' in format_dp(value) else f"{format_dp(value)}.0f"
+
+
+def generate_breakpoints_kotlin(layouts: List[GridLayout], widths: Dict[str, float],
+                                containers: Dict[str, float], output_dir: str) -> None:
+    """生成 ktClass/AppBreakpoints.kt，gridFor 在断点数组上二分查找"""
+    lines = [
+        f"package {KOTLIN_PACKAGE}",
+        "",
+        "// Generated by breakpoints.py from the grid, \"4. widths\" and \"5. containers\" tokens. Do not edit by hand.",
+        "",
+        "enum class WindowSizeClass(val minWidthDp: Int) {",
+    ]
+    for index, (name, min_width, _, _) in enumerate(WINDOW_SIZE_CLASSES):
+        terminator = ';' if index == len(WINDOW_SIZE_CLASSES) - 1 else ','
+        lines.append(f"    {name.upper()}({min_width}){terminator}")
+    lines += [
+        "",
+        "    companion object {",
+        "        fun fromWidth(widthDp: Int): WindowSizeClass = when {",
+    ]
+    for name, min_width, _, _ in reversed(WINDOW_SIZE_CLASSES[1:]):
+        lines.append(f"            widthDp >= {min_width} -> {name.upper()}")
+    lines += [
+        f"            else -> {WINDOW_SIZE_CLASSES[0][0].upper()}",
+        "        }",
+        "    }",
+        "}",
+        "",
+        "/** Grid metrics for widths from [minWidthDp] up to the next breakpoint, computed at [minWidthDp]. */",
+        "class GridSpec(",
+        "    val minWidthDp: Int,",
+        "    val sizeClass: WindowSizeClass,",
+        "    val columns: Int,",
+        "    val gutterDp: Float,",
+        "    val marginDp: Float,",
+        "    val contentWidthDp: Float,",
+        "    val columnWidthDp: Float",
+        ") {",
+        "    /** Width of a cell spanning [span] columns, including the gutters between them. */",
+        "    fun spanWidthDp(span: Int): Float = columnWidthDp * span + gutterDp * (span - 1)",
+        "}",
+        "",
+        "object AppBreakpoints {",
+    ]
+    for name, value in sorted(widths.items(), key=lambda item: (item[1], item[0])):
+        lines.append(f"    const val {name.upper()} = {int(value)}")
+    for name, value in containers.items():
+        lines.append(f"    const val {name.upper()} = {int(value)}")
+    lines += [
+        "",
+        f"    private val MIN_WIDTHS = intArrayOf({', '.join(str(layout.min_width) for layout in layouts)})",
+        "",
+        "    val GRIDS = arrayOf(",
+    ]
+    for layout in layouts:
+        lines.append(f"        GridSpec({layout.min_width}, WindowSizeClass.{layout.size_class.upper()}, "
+                     f"{layout.grid.columns}, {kotlin_float(layout.grid.gutter)}, {kotlin_float(layout.margin)}, "
+                     f"{kotlin_float(layout.content_width)}, {kotlin_float(layout.column_width)}),")
+    lines += [
+        "    )",
+        "",
+        "    /** Grid for the given window width, matching the values-w<N>dp grid_dimens resources. */",
+        "    fun gridFor(widthDp: Int): GridSpec {",
+        "        val index = MIN_WIDTHS.binarySearch(widthDp)",
+        "        return GRIDS[if (index >= 0) index else maxOf(-index - 2, 0)]",
+        "    }",
+        "}",
+    ]
+    content = '\n'.join(lines) + '\n'
+
+    kt_dir = os.path.join(output_dir, "ktClass")
+    os.makedirs(kt_dir, exist_ok=True)
+    file_path = os.path.join(kt_dir, "AppBreakpoints.kt")
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    tracer.count_written(content)
+    print(f"Generated: {file_path} ({len(layouts)} breakpoints)")
+
+
+def generate_breakpoints(data: Dict[str, Any], output_dir: str) -> List[GridLayout]:
+    """解析栅格、宽度和容器令牌并写出全部断点资源"""
+    with tracer.span('walk', module='grid'):
+        widths = process_dimension_group(data, 'widths')
+        containers = process_dimension_group(data, 'containers')
+        grids = process_grids(data)
+        layouts = build_layouts(widths, grids, containers)
+    if not layouts:
+        print("Warning: no grid breakpoints generated")
+        return []
+    with tracer.span('emit', module='grid'):
+        generate_width_dimens(widths, containers, output_dir)
+        generate_grid_dimens(layouts, output_dir)
+        generate_breakpoints_kotlin(layouts, widths, containers, output_dir)
+    return layouts
+
+
+def print_layouts(layouts: List[GridLayout]) -> None:
+    print(f"\n{'min width':>10}  {'class':<9} {'grid':<8} {'cols':>4} {'margin':>8} {'column':>8}")
+    for layout in layouts:
+        print(f"{layout.min_width:>8}dp  {layout.size_class:<9} {layout.grid.name:<8} {layout.grid.columns:>4} "
+              f"{format_dp(layout.margin):>8} {format_dp(layout.column_width):>8}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Generate values-w<N>dp grid dimens and a Kotlin breakpoint '
+                                                 'object from the grid, widths and containers tokens')
+    parser.add_argument('--tokens', default='design-tokens.tokens(5).json',
+                        help='Design token JSON (default: design-tokens.tokens(5).json)')
+    parser.add_argument('--output-dir', default='.', help='Output root directory (default: current directory)')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    try:
+        with tracer.span('load', file=args.tokens):
+            data = load_json_file(args.tokens)
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.tokens}")
+        return
+
+    layouts = generate_breakpoints(data, args.output_dir)
+    print_layouts(layouts)
+
+    finish_from_args(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+颜色工具模块：统一颜色值的解析与格式转换，将日夜间颜色打包为紧凑数组，
+并批量计算语义颜色对的WCAG对比度，标记不满足可访问性要求的组合
+"""
+
+import os
+import re
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+
+from token_model import ColorToken
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 颜色值：XML中读取的字符串、带行内注释的元组，或 tokens.py 解析出的令牌
+ColorData = Union[str, Tuple[str, str], ColorToken]
+
+# WCAG 2.x 对比度阈值
+WCAG_AA_TEXT = 4.5
+WCAG_AA_NON_TEXT = 3.0
+
+# 命名颜色（SVG中常见的几种）
+NAMED_COLORS = {
+    'black': 0xFF000000,
+    'white': 0xFFFFFFFF,
+    'red': 0xFFFF0000,
+    'green': 0xFF00FF00,
+    'blue': 0xFF0000FF,
+    'transparent': 0x00000000
+}
+
+
+def _build_linear_lut() -> array:
+    """预计算sRGB通道值(0-255)到线性亮度的查找表"""
+    lut = array('d')
+    for i in range(256):
+        c = i / 255.0
+        lut.append(c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4)
+    return lut
+
+
+SRGB_TO_LINEAR = _build_linear_lut()
+
+
+def figma_to_android_hex(value: str) -> str:
+    """将Figma导出的#RRGGBBAA转换为Android的#AARRGGBB格式，其他格式原样返回"""
+    if len(value) == 9 and value.startswith('#'):
+        return '#' + value[7:9] + value[1:7]
+    return value
+
+
+def to_android_argb_hex(color: str) -> str:
+    """将SVG颜色（#RGB、#RRGGBB、命名颜色）转换为Android的#AARRGGBB格式"""
+    if not color or color == 'none':
+        return '#00000000'  # 透明
+
+    if color.startswith('#'):
+        if len(color) == 4:  # #RGB
+            color = '#' + ''.join([c * 2 for c in color[1:]])
+        if len(color) == 7:  # #RRGGBB
+            color = '#FF' + color[1:]  # 添加Alpha通道
+        return color
+
+    return f"#{NAMED_COLORS.get(color.lower(), 0xFF000000):08X}"
+
+
+def to_opaque_rgb_hex(color: str) -> str:
+    """补全#前缀，并去掉Figma #RRGGBBAA 中的透明度，返回#RRGGBB"""
+    if not color.startswith('#'):
+        color = f"#{color}"
+    if len(color) == 9:
+        color = color[:7]
+    return color
+
+
+def parse_hex_color(value: str, alpha_last: bool = False) -> Optional[int]:
+    """将十六进制颜色字符串解析为ARGB整数
+
+    Args:
+        value: 颜色字符串，支持 #RGB、#ARGB、#RRGGBB、#AARRGGBB
+        alpha_last: 为True时8位颜色按Figma的#RRGGBBAA解析
+
+    Returns:
+        ARGB整数，无法解析时返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if not value.startswith('#'):
+        return NAMED_COLORS.get(value.lower())
+
+    digits = value[1:]
+    if len(digits) in (3, 4):
+        digits = ''.join(c * 2 for c in digits)
+    try:
+        raw = int(digits, 16)
+    except ValueError:
+        return None
+
+    if len(digits) == 6:
+        return 0xFF000000 | raw
+    if len(digits) == 8:
+        if alpha_last:
+            return ((raw & 0xFF) << 24) | (raw >> 8)
+        return raw
+    return None
+
+
+def argb_to_hex(argb: int, with_alpha: bool = True) -> str:
+    """将ARGB整数格式化为Android颜色字符串"""
+    if with_alpha:
+        return f"#{argb & 0xFFFFFFFF:08x}"
+    return f"#{argb & 0xFFFFFF:06x}"
+
+
+def relative_luminance(argb: int) -> float:
+    """计算颜色的WCAG相对亮度（忽略透明度）"""
+    lut = SRGB_TO_LINEAR
+    return (0.2126 * lut[(argb >> 16) & 0xFF]
+            + 0.7152 * lut[(argb >> 8) & 0xFF]
+            + 0.0722 * lut[argb & 0xFF])
+
+
+def argb_to_oklab(argb: int) -> Tuple[float, float, float]:
+    """将ARGB颜色转换为OKLab感知颜色空间 (L, a, b)，忽略透明度"""
+    lut = SRGB_TO_LINEAR
+    r = lut[(argb >> 16) & 0xFF]
+    g = lut[(argb >> 8) & 0xFF]
+    b = lut[argb & 0xFF]
+
+    l_ = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m_ = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s_ = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+
+    return (0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+            1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+            0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_)
+
+
+def delta_e_ok(lab_a: Tuple[float, float, float], lab_b: Tuple[float, float, float]) -> float:
+    """OKLab空间的色差，放大100倍使其与常见ΔE量级接近（约2为可察觉差异）"""
+    return 100.0 * ((lab_a[0] - lab_b[0]) ** 2
+                    + (lab_a[1] - lab_b[1]) ** 2
+                    + (lab_a[2] - lab_b[2]) ** 2) ** 0.5
+
+
+def composite_over(fg: int, bg: int) -> int:
+    """将带透明度的前景色叠加到不透明背景色上，返回不透明ARGB"""
+    alpha = (fg >> 24) & 0xFF
+    if alpha == 0xFF:
+        return fg
+    a = alpha / 255.0
+    r = round(((fg >> 16) & 0xFF) * a + ((bg >> 16) & 0xFF) * (1 - a))
+    g = round(((fg >> 8) & 0xFF) * a + ((bg >> 8) & 0xFF) * (1 - a))
+    b = round((fg & 0xFF) * a + (bg & 0xFF) * (1 - a))
+    return 0xFF000000 | (r << 16) | (g << 8) | b
+
+
+def contrast_ratio(lum_a: float, lum_b: float) -> float:
+    """根据两个相对亮度计算WCAG对比度"""
+    if lum_a < lum_b:
+        lum_a, lum_b = lum_b, lum_a
+    return (lum_a + 0.05) / (lum_b + 0.05)
+
+
+def resolve_color_data(color_data: ColorData, primitive_colors: Dict[str, str],
+                       max_depth: int = 8) -> Optional[int]:
+    """将颜色值或@color/引用解析为ARGB整数"""
+    if isinstance(color_data, ColorToken):
+        if color_data.argb is not None:
+            return color_data.argb
+        color_data = color_data.value
+    elif isinstance(color_data, tuple):
+        color_data = color_data[0]
+    value = color_data.strip()
+    depth = 0
+    while value.startswith('@color/') and depth < max_depth:
+        name = value[7:]
+        if name not in primitive_colors:
+            return None
+        value = primitive_colors[name].strip()
+        depth += 1
+    return parse_hex_color(value)
+
+
+class ColorTable:
+    """日夜间颜色的紧凑存储
+
+    颜色按 (模式, 名称) 顺序排列在同一个 array('I') 中，亮度存放在并行的
+    array('d') 中，名称通过字典映射到下标，避免在批量计算时反复解析字符串；
+    两个数组可以不经复制地作为 NumPy 数组读取。
+    """
+
+    def __init__(self, modes: List[str]):
+        self.modes = list(modes)
+        self.names: List[str] = []
+        self.index: Dict[Tuple[str, str], int] = {}
+        self.argb = array('I')
+        self.luminance = array('d')
+
+    def add(self, mode: str, name: str, argb: int) -> int:
+        """添加（或覆盖）一个颜色，返回其下标"""
+        key = (mode, name)
+        if key in self.index:
+            idx = self.index[key]
+            self.argb[idx] = argb
+            self.luminance[idx] = relative_luminance(argb)
+            return idx
+        idx = len(self.argb)
+        self.index[key] = idx
+        self.names.append(name)
+        self.argb.append(argb)
+        self.luminance.append(relative_luminance(argb))
+        return idx
+
+    def get(self, mode: str, name: str) -> Optional[int]:
+        """返回颜色的ARGB值，不存在时返回None"""
+        idx = self.index.get((mode, name))
+        return None if idx is None else self.argb[idx]
+
+    def __len__(self) -> int:
+        return len(self.argb)
+
+    @classmethod
+    def from_modes(cls, semantic_by_mode: Dict[str, Dict[str, ColorData]],
+                   primitive_by_mode: Dict[str, Dict[str, str]]) -> 'ColorTable':
+        """从各模式的语义颜色和原子颜色构建颜色表，引用会被解析为最终颜色"""
+        table = cls(list(semantic_by_mode.keys()))
+        for mode, semantic in semantic_by_mode.items():
+            primitive = primitive_by_mode.get(mode, {})
+            for name, color_data in semantic.items():
+                argb = resolve_color_data(color_data, primitive)
+                if argb is not None:
+                    table.add(mode, name, argb)
+        return table
+
+
+# 语义颜色分类，顺序即 AuColor.kt 和分片资源文件中的分组顺序
+SEMANTIC_CATEGORIES = ('text', 'bg', 'border', 'fg', 'button', 'icon', 'utility', 'other')
+
+# 分片颜色文件中的标记注释，用于识别和清理本工具生成的分片
+SHARD_MARKER = '<!-- color shard: '
+
+
+def semantic_category(name: str) -> str:
+    """语义颜色所属的分类，只由名称决定，分片和分组在多次生成之间保持稳定"""
+    for prefix in ('text', 'bg', 'border', 'fg', 'button'):
+        if name.startswith(prefix + '_'):
+            return prefix
+    if 'icon' in name:
+        return 'icon'
+    if name.startswith('utility_'):
+        return 'utility'
+    return 'other'
+
+
+def primitive_group(name: str) -> str:
+    """原子颜色所属的色阶，如 gray_blue_500 -> gray_blue；不带色阶序号的颜色归入 base"""
+    match = re.match(r'^(.+)_\d+$', name)
+    return match.group(1) if match else 'base'
+
+
+def color_resource_files(file_path: str) -> List[str]:
+    """颜色XML文件路径；未生成单个文件而是按分类分片时，返回同目录下的所有分片"""
+    if os.path.exists(file_path):
+        return [file_path]
+    directory, file_name = os.path.split(file_path)
+    stem = os.path.splitext(file_name)[0]
+    if not os.path.isdir(directory or '.'):
+        return []
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory or '.'))
+            if name.startswith(stem + '_') and name.endswith('.xml') and is_color_shard(os.path.join(directory, name))]
+
+
+def is_color_shard(file_path: str) -> bool:
+    """判断文件是否为生成的颜色分片"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return SHARD_MARKER in f.read(256)
+
+
+def is_text_token(name: str) -> bool:
+    """判断是否为文字颜色"""
+    return name.startswith('text_')
+
+
+def is_exempt_token(name: str) -> bool:
+    """禁用态与占位符颜色不要求满足对比度（WCAG 1.4.3 例外）"""
+    return 'disabled' in name or 'placeholder' in name
+
+
+def build_default_pairs(names: List[str]) -> List[Tuple[str, str, float]]:
+    """根据命名约定生成需要检查的 (前景, 背景, 阈值) 组合
+
+    - on_brand 及 white 文字/图标放在品牌实色背景上
+    - 其他文字放在主、次背景上，阈值4.5
+    - fg_ 图标色放在主、次背景上，阈值3.0
+    """
+    name_set = set(names)
+    brand_bgs = [bg for bg in ('bg_brand_solid',) if bg in name_set]
+    surface_bgs = [bg for bg in ('bg_primary', 'bg_secondary') if bg in name_set]
+
+    pairs = []
+    for name in sorted(name_set):
+        if is_exempt_token(name):
+            continue
+        if is_text_token(name):
+            threshold = WCAG_AA_TEXT
+        elif name.startswith('fg_'):
+            threshold = WCAG_AA_NON_TEXT
+        else:
+            continue
+
+        if name.endswith('_on_brand') or name in ('text_white', 'fg_white_same'):
+            backgrounds = brand_bgs
+        elif 'inverse' in name:
+            continue
+        else:
+            backgrounds = surface_bgs
+
+        for bg in backgrounds:
+            pairs.append((name, bg, threshold))
+    return pairs
+
+
+def contrast_ratios_numpy(table: ColorTable, fg_idx: array, bg_idx: array) -> List[float]:
+    """用 NumPy 按下标数组批量计算对比度，结果与逐对计算的 contrast_ratio 相同"""
+    argb = np.frombuffer(table.argb, dtype=np.dtype(f'u{table.argb.itemsize}')).astype(np.int64)
+    lum = np.frombuffer(table.luminance, dtype=np.float64)
+    fg_i = np.frombuffer(fg_idx, dtype=np.dtype(f'u{fg_idx.itemsize}'))
+    bg_i = np.frombuffer(bg_idx, dtype=np.dtype(f'u{bg_idx.itemsize}'))
+
+    fg = argb[fg_i]
+    fg_lum = lum[fg_i]
+    bg_lum = lum[bg_i]
+
+    # 半透明前景色先叠加到背景上（同 composite_over），再取亮度
+    translucent = (fg >> 24) != 0xFF
+    if translucent.any():
+        front = fg[translucent]
+        back = argb[bg_i[translucent]]
+        a = (front >> 24) / 255.0
+        r, g, b = (np.round(((front >> shift) & 0xFF) * a + ((back >> shift) & 0xFF) * (1 - a)).astype(np.int64)
+                   for shift in (16, 8, 0))
+        lut = np.asarray(SRGB_TO_LINEAR)
+        fg_lum = fg_lum.copy()
+        fg_lum[translucent] = 0.2126 * lut[r] + 0.7152 * lut[g] + 0.0722 * lut[b]
+
+    return ((np.maximum(fg_lum, bg_lum) + 0.05) / (np.minimum(fg_lum, bg_lum) + 0.05)).tolist()
+
+
+def compute_contrast(table: ColorTable,
+                     pairs: List[Tuple[str, str, float]]) -> List[Tuple[str, str, str, float, float]]:
+    """在所有模式上一次性计算颜色对的对比度
+
+    先把 (模式, 前景, 背景) 展开为并行的下标数组，安装了 NumPy 时向量化计算，
+    否则在一次遍历中完成，半透明前景色会先叠加到背景上再取亮度。
+
+    Returns:
+        [(模式, 前景, 背景, 对比度, 阈值), ...]
+    """
+    fg_idx = array('I')
+    bg_idx = array('I')
+    thresholds = array('d')
+    labels = []
+    for mode in table.modes:
+        for fg, bg, threshold in pairs:
+            i = table.index.get((mode, fg))
+            j = table.index.get((mode, bg))
+            if i is None or j is None:
+                continue
+            fg_idx.append(i)
+            bg_idx.append(j)
+            thresholds.append(threshold)
+            labels.append((mode, fg, bg))
+
+    if np is not None and fg_idx:
+        ratios = contrast_ratios_numpy(table, fg_idx, bg_idx)
+    else:
+        argb = table.argb
+        lum = table.luminance
+        ratios = array('d', [
+            contrast_ratio(lum[i] if (argb[i] >> 24) == 0xFF
+                           else relative_luminance(composite_over(argb[i], argb[j])),
+                           lum[j])
+            for i, j in zip(fg_idx, bg_idx)
+        ])
+
+    return [(mode, fg, bg, ratio, threshold)
+            for (mode, fg, bg), ratio, threshold in zip(labels, ratios, thresholds)]
+
+
+def find_contrast_failures(results: List[Tuple[str, str, str, float, float]]
+                           ) -> List[Tuple[str, str, str, float, float]]:
+    """筛选出对比度低于阈值的组合"""
+    return [r for r in results if r[3] < r[4]]
+
+
+def check_semantic_contrast(light_semantic: Dict[str, ColorData],
+                            dark_semantic: Dict[str, ColorData],
+                            light_primitive: Dict[str, str],
+                            dark_primitive: Dict[str, str]) -> List[Tuple[str, str, str, float, float]]:
+    """检查日夜间语义颜色的对比度，打印并返回不满足要求的组合"""
+    table = ColorTable.from_modes(
+        {'light mode': light_semantic, 'dark mode': dark_semantic},
+        {'light mode': light_primitive, 'dark mode': dark_primitive}
+    )
+    pairs = build_default_pairs(list(light_semantic.keys()) + list(dark_semantic.keys()))
+    results = compute_contrast(table, pairs)
+    failures = find_contrast_failures(results)
+
+    print(f"Contrast check: {len(results)} pairs, {len(failures)} below WCAG AA")
+    for mode, fg, bg, ratio, threshold in failures:
+        print(f"  - [{mode}] {fg} on {bg}: {ratio:.2f} < {threshold}")
+
+    return failures
+
+
+def main():
+    """读取生成的颜色XML文件，输出对比度检查结果"""
+    from theme import parse_color_xml
+
+    files = {
+        'light_semantic': "values/semantic_color.xml",
+        'dark_semantic': "values-night/semantic_color.xml",
+        'light_primitive': "values/primitive_color.xml",
+        'dark_primitive': "values-night/primitive_color.xml",
+    }
+
+    for path in files.values():
+        if not color_resource_files(path):
+            print(f"Error: Color file not found: {path}")
+            return
+
+    colors = {key: parse_color_xml(path) for key, path in files.items()}
+    check_semantic_contrast(colors['light_semantic'], colors['dark_semantic'],
+                            colors['light_primitive'], colors['dark_primitive'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+夜间颜色推导：为只在日间模式定义的语义颜色推导夜间值，避免夜间资源缺失时静默回退到日间颜色或黑色。
+
+所有缺失颜色在一次 NumPy 计算中完成：转换到 OKLCH 后翻转亮度（L -> 1 - L，保留色度和色相），
+再在预先计算好的夜间原子颜色 OKLab 索引中查找最近的颜色，结果写为对该原子颜色的 @color/ 引用。
+推导出的颜色会检查对比度，并在XML行尾标注 derived 注释，便于设计评审后补回 Figma。
+需要 NumPy（pip install numpy），未安装时只打印缺失的颜色。
+"""
+
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+from color_utils import (SRGB_TO_LINEAR, ColorData, ColorTable, build_default_pairs, color_resource_files,
+                         compute_contrast, parse_hex_color, resolve_color_data)
+from token_model import ColorToken
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DARK_MODE = 'dark mode'
+
+# 线性sRGB -> LMS，LMS立方根 -> OKLab（与 color_utils.argb_to_oklab 相同的系数）
+LINEAR_TO_LMS = ((0.4122214708, 0.5363325363, 0.0514459929),
+                 (0.2119034982, 0.6806995451, 0.1073969566),
+                 (0.0883024619, 0.2817188376, 0.6299787005))
+LMS_TO_OKLAB = ((0.2104542553, 0.7936177850, -0.0040720468),
+                (1.9779984951, -2.4285922050, 0.4505937099),
+                (0.0259040371, 0.7827717662, -0.8086757660))
+
+
+class DerivedColor:
+    """推导出的夜间颜色
+
+    Attributes:
+        name: 语义颜色资源名
+        light_argb: 日间颜色
+        lightness: (日间L, 翻转后的目标L)
+        primitive: 吸附到的夜间原子颜色名
+        argb: 该原子颜色的值
+        delta_e: 目标颜色与原子颜色的色差（ΔE_OK×100）
+        contrast: 涉及该颜色的最低对比度及阈值，没有需要检查的组合时为None
+    """
+
+    __slots__ = ('name', 'light_argb', 'lightness', 'primitive', 'argb', 'delta_e', 'contrast')
+
+    def __init__(self, name: str, light_argb: int, lightness: Tuple[float, float],
+                 primitive: str, argb: int, delta_e: float):
+        self.name = name
+        self.light_argb = light_argb
+        self.lightness = lightness
+        self.primitive = primitive
+        self.argb = argb
+        self.delta_e = delta_e
+        self.contrast: Optional[Tuple[float, float]] = None
+
+    @property
+    def value(self) -> str:
+        return f"@color/{self.primitive}"
+
+    @property
+    def passes_contrast(self) -> bool:
+        return self.contrast is None or self.contrast[0] >= self.contrast[1]
+
+    def comment(self) -> str:
+        """XML行尾的标注，标明颜色为推导结果"""
+        note = f"derived: L {self.lightness[0]:.2f} -> {self.lightness[1]:.2f}, ΔE {self.delta_e:.1f}"
+        if not self.passes_contrast:
+            note += f", contrast {self.contrast[0]:.2f} < {self.contrast[1]}"
+        return f"  <!-- {note} -->"
+
+    def to_token(self, provenance: str = '') -> ColorToken:
+        """转换为 tokens.py 使用的夜间令牌"""
+        return ColorToken(self.name, DARK_MODE, '', self.value, argb=self.argb, alias=self.primitive,
+                          comment=self.comment(), provenance=provenance)
+
+
+def argb_array_to_oklab(argb: 'np.ndarray') -> 'np.ndarray':
+    """批量将ARGB转换为OKLab，返回 (N, 3)，忽略透明度"""
+    lut = np.asarray(SRGB_TO_LINEAR)
+    argb = argb.astype(np.uint32)
+    linear = np.stack([lut[(argb >> 16) & 0xFF], lut[(argb >> 8) & 0xFF], lut[argb & 0xFF]], axis=1)
+    lms = np.cbrt(linear @ np.asarray(LINEAR_TO_LMS).T)
+    return lms @ np.asarray(LMS_TO_OKLAB).T
+
+
+def invert_lightness(lab: 'np.ndarray') -> 'np.ndarray':
+    """在OKLCH中翻转亮度，色度和色相不变；OKLab 的 a、b 即 C·cos(h)、C·sin(h)，直接保留"""
+    inverted = lab.copy()
+    inverted[:, 0] = 1.0 - lab[:, 0]
+    return inverted
+
+
+class PrimitiveIndex:
+    """夜间原子颜色的 OKLab 索引，按透明度分组，一次构建后批量查询最近颜色"""
+
+    def __init__(self, primitive_colors: Dict[str, str]):
+        self.names: List[str] = []
+        argb = []
+        for name in sorted(primitive_colors):
+            value = parse_hex_color(primitive_colors[name])
+            if value is not None:
+                self.names.append(name)
+                argb.append(value)
+        self.argb = np.array(argb, dtype=np.uint32)
+        self.alpha = self.argb >> 24
+        self.lab = argb_array_to_oklab(self.argb) if argb else np.zeros((0, 3))
+
+    def nearest(self, lab: 'np.ndarray', alpha: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+        """为每个目标颜色查找最近的原子颜色，优先选择透明度相同的颜色
+
+        Returns:
+            (原子颜色下标, 色差 ΔE_OK×100)
+        """
+        distance = np.linalg.norm(lab[:, None, :] - self.lab[None, :, :], axis=2)
+        same_alpha = alpha[:, None] == self.alpha[None, :]
+        has_same_alpha = same_alpha.any(axis=1, keepdims=True)
+        distance = np.where(same_alpha | ~has_same_alpha, distance, np.inf)
+        indexes = distance.argmin(axis=1)
+        return indexes, 100.0 * distance[np.arange(len(indexes)), indexes]
+
+
+def find_missing_dark(light_semantic: Dict[str, ColorData],
+                      dark_semantic: Dict[str, ColorData]) -> List[str]:
+    """日间有定义而夜间缺失的语义颜色"""
+    return sorted(set(light_semantic) - set(dark_semantic))
+
+
+def check_derived_contrast(derived: Dict[str, DerivedColor], dark_semantic: Dict[str, ColorData],
+                           dark_primitive: Dict[str, str]) -> None:
+    """在补全后的夜间颜色上检查涉及推导颜色的组合，记录每个推导颜色的最低对比度"""
+    semantic = dict(dark_semantic)
+    semantic.update({name: color.value for name, color in derived.items()})
+    table = ColorTable.from_modes({DARK_MODE: semantic}, {DARK_MODE: dark_primitive})
+    pairs = [pair for pair in build_default_pairs(list(semantic))
+             if pair[0] in derived or pair[1] in derived]
+    for _, fg, bg, ratio, threshold in compute_contrast(table, pairs):
+        for name in (fg, bg):
+            color = derived.get(name)
+            if color is not None and (color.contrast is None or ratio < color.contrast[0]):
+                color.contrast = (ratio, threshold)
+
+
+def derive_missing_dark(light_semantic: Dict[str, ColorData], dark_semantic: Dict[str, ColorData],
+                        light_primitive: Dict[str, str],
+                        dark_primitive: Dict[str, str]) -> Dict[str, DerivedColor]:
+    """推导夜间缺失的语义颜色
+
+    Returns:
+        名称 -> 推导结果；NumPy 未安装或没有可用的夜间原子颜色时返回空字典
+    """
+    missing = find_missing_dark(light_semantic, dark_semantic)
+    if not missing:
+        return {}
+    if np is None:
+        print(f"Warning: {len(missing)} colors missing in dark mode; "
+              f"deriving them requires NumPy (pip install numpy): {', '.join(missing)}")
+        return {}
+
+    names, light_argb = [], []
+    for name in missing:
+        argb = resolve_color_data(light_semantic[name], light_primitive)
+        if argb is None:
+            print(f"Warning: cannot derive dark value for {name}: unresolved light value")
+            continue
+        names.append(name)
+        light_argb.append(argb)
+
+    index = PrimitiveIndex(dark_primitive)
+    if not names or not index.names:
+        return {}
+
+    light_argb = np.array(light_argb, dtype=np.uint32)
+    light_lab = argb_array_to_oklab(light_argb)
+    target_lab = invert_lightness(light_lab)
+    indexes, delta_e = index.nearest(target_lab, light_argb >> 24)
+
+    derived = {}
+    for i, name in enumerate(names):
+        j = int(indexes[i])
+        derived[name] = DerivedColor(name, int(light_argb[i]),
+                                     (float(light_lab[i, 0]), float(target_lab[i, 0])),
+                                     index.names[j], int(index.argb[j]), float(delta_e[i]))
+    check_derived_contrast(derived, dark_semantic, dark_primitive)
+    return derived
+
+
+def print_derived(derived: Dict[str, DerivedColor]) -> None:
+    """打印推导结果，供设计评审"""
+    if not derived:
+        return
+    failures = sum(1 for color in derived.values() if not color.passes_contrast)
+    print(f"Derived {len(derived)} dark mode colors ({failures} below WCAG AA), review before release:")
+    for color in derived.values():
+        line = (f"  - {color.name}: #{color.light_argb & 0xFFFFFFFF:08x} -> @color/{color.primitive} "
+                f"(L {color.lightness[0]:.2f} -> {color.lightness[1]:.2f}, ΔE {color.delta_e:.1f})")
+        if color.contrast is not None:
+            mark = "ok" if color.passes_contrast else "FAIL"
+            line += f", contrast {color.contrast[0]:.2f}/{color.contrast[1]} {mark}"
+        print(line)
+
+
+def apply_derived_tokens(dark_semantic: Dict[str, ColorToken], derived: Dict[str, DerivedColor],
+                         light_semantic: Dict[str, ColorToken]) -> None:
+    """将推导结果作为带 derived 注释的夜间令牌加入 dark_semantic"""
+    for name, color in derived.items():
+        light = light_semantic.get(name)
+        provenance = f"{light.provenance} (derived)" if light is not None else 'derived'
+        dark_semantic[name] = color.to_token(provenance)
+
+
+def fill_missing_dark_tokens(light_semantic: Dict[str, ColorToken], dark_semantic: Dict[str, ColorToken],
+                             light_primitive: Dict[str, str],
+                             dark_primitive: Dict[str, str]) -> Dict[str, DerivedColor]:
+    """tokens.py / watch.py / brands.py 使用：推导并补全夜间令牌，打印评审报告"""
+    derived = derive_missing_dark(light_semantic, dark_semantic, light_primitive, dark_primitive)
+    apply_derived_tokens(dark_semantic, derived, light_semantic)
+    print_derived(derived)
+    return derived
+
+
+def main(argv: Optional[List[str]] = None):
+    """读取生成的颜色XML，报告夜间缺失颜色的推导结果（不修改文件）"""
+    from theme import parse_color_xml
+
+    parser = argparse.ArgumentParser(description='Derive candidate dark mode values for semantic colors '
+                                                 'that only exist in light mode')
+    parser.add_argument('--values-dir', default='values', help='Light resource directory (default: values)')
+    parser.add_argument('--night-dir', default='values-night',
+                        help='Dark resource directory (default: values-night)')
+    args = parser.parse_args(argv)
+
+    files = {
+        'light_semantic': f"{args.values_dir}/semantic_color.xml",
+        'dark_semantic': f"{args.night_dir}/semantic_color.xml",
+        'light_primitive': f"{args.values_dir}/primitive_color.xml",
+        'dark_primitive': f"{args.night_dir}/primitive_color.xml",
+    }
+    for path in files.values():
+        if not color_resource_files(path):
+            print(f"Error: Color file not found: {path}")
+            return
+
+    colors = {key: parse_color_xml(path) for key, path in files.items()}
+    missing = find_missing_dark(colors['light_semantic'], colors['dark_semantic'])
+    print(f"{len(missing)} colors missing in dark mode")
+    derived = derive_missing_dark(colors['light_semantic'], colors['dark_semantic'],
+                                  colors['light_primitive'], colors['dark_primitive'])
+    print_derived(derived)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+导出目标注册表：同一份解析后的令牌模型（token_model.ResolvedTokens）渲染为多种产物，
+其他使用方不必再用各自的脚本重新解析 Figma JSON。
+
+内置目标：
+    android   Android 资源XML（values/、values-night/、渐变、圆角等，与 tokens.py 原有输出相同）
+    compose   Jetpack Compose 的 AppColors.kt（按语义分类分组的日夜间配色）和 AppDimens.kt
+    manifest  扁平的已解析令牌JSON清单（引用全部解析为最终颜色值）
+    material3 Material 3 颜色角色主题和 ThemeOverlay（与 material_theme.py 的输出相同）
+
+新目标通过 @register_target('名称') 注册，渲染函数签名为 (model, output_dir, options) -> 写入的文件列表。
+所有目标在线程池中并发渲染，共享同一个只读模型，并分别记录耗时。
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from color_utils import SEMANTIC_CATEGORIES, argb_to_hex, resolve_color_data, semantic_category
+from instrumentation import tracer
+from theme import to_camel_case
+from token_model import ColorToken, ResolvedTokens
+
+LIGHT_MODE = 'light mode'
+DARK_MODE = 'dark mode'
+
+KOTLIN_PACKAGE = "com.example.design.tokens"
+MANIFEST_FILE = "tokens.manifest.json"
+MANIFEST_VERSION = 1
+
+# (模型, 输出目录, 选项) -> 写入的文件路径
+TargetRenderer = Callable[[ResolvedTokens, str, Dict[str, Any]], List[str]]
+
+EXPORT_TARGETS: Dict[str, TargetRenderer] = {}
+
+DEFAULT_TARGETS = ('android',)
+
+
+def register_target(name: str) -> Callable[[TargetRenderer], TargetRenderer]:
+    """注册导出目标的装饰器，同名目标会被覆盖"""
+    def decorator(renderer: TargetRenderer) -> TargetRenderer:
+        EXPORT_TARGETS[name] = renderer
+        return renderer
+    return decorator
+
+
+def write_if_changed(file_path: str, content: str) -> bool:
+    """内容与已有文件相同时不重写，返回是否写入"""
+    if os.path.exists(file_path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    tracer.count_written(content)
+    return True
+
+
+def resolve_semantic_argb(model: ResolvedTokens, mode: str) -> Dict[str, int]:
+    """语义颜色 -> 最终ARGB，引用按该模式的原子颜色解析"""
+    primitives = model.primitives(mode)
+    resolved = {}
+    for name, token in model.semantic(mode).items():
+        argb = resolve_color_data(token, primitives)
+        if argb is not None:
+            resolved[name] = argb
+    return resolved
+
+
+@register_target('android')
+def render_android(model: ResolvedTokens, output_dir: str, options: Dict[str, Any]) -> List[str]:
+    """Android 资源XML，即 tokens.py 一直以来的输出"""
+    from tokens import generate_mode_xml_files, write_token_resources
+
+    write_token_resources(output_dir, model.primitives(LIGHT_MODE), model.primitives(DARK_MODE),
+                          model.semantic(LIGHT_MODE), model.semantic(DARK_MODE),
+                          model.dimensions, model.semantic_dimensions, model.gradients, model.radius_values,
+                          model.typography_styles, model.text_sizes, model.font_indexes,
+                          options.get('shard_colors', False))
+    generated_modes = generate_mode_xml_files(model.primitives_by_mode, model.semantic_by_mode,
+                                              options.get('mode_qualifiers', {}), output_dir,
+                                              options.get('shard_colors', False))
+    outputs = [os.path.join(output_dir, directory) for directory in ("values", "values-night", "gradients")]
+    outputs += [os.path.join(output_dir, options['mode_qualifiers'][mode]) for mode in generated_modes]
+    return outputs
+
+
+def kotlin_color(argb: int) -> str:
+    return f"Color(0x{argb & 0xFFFFFFFF:08X})"
+
+
+def compose_category_class(category: str) -> str:
+    """分类配色类名，如 text -> AppTextColors"""
+    return f"App{category.capitalize()}Colors"
+
+
+def generate_compose_colors(light: Mapping[str, int], dark: Mapping[str, int]) -> str:
+    """生成 AppColors.kt
+
+    语义颜色有三百多个，超过JVM方法255个参数的限制，因此按语义分类拆成多个 @Immutable 类，
+    AppColors 只持有各分类的实例；日夜间各一组实例，通过 LocalAppColors 提供。
+    """
+    categories: Dict[str, List[str]] = {category: [] for category in SEMANTIC_CATEGORIES}
+    for name in sorted(light):
+        categories[semantic_category(name)].append(name)
+    categories = {category: names for category, names in categories.items() if names}
+
+    lines = [f"package {KOTLIN_PACKAGE}", "",
+             "import androidx.compose.runtime.Immutable",
+             "import androidx.compose.runtime.staticCompositionLocalOf",
+             "import androidx.compose.ui.graphics.Color", "",
+             "// Generated by tokens.py --target compose from the resolved semantic colors. Do not edit by hand.", ""]
+
+    for category, names in categories.items():
+        lines.append("@Immutable")
+        lines.append(f"class {compose_category_class(category)}(")
+        lines.extend(f"    val {to_camel_case(name)}: Color," for name in names)
+        lines.append(")")
+        lines.append("")
+
+    lines.append("@Immutable")
+    lines.append("class AppColors(")
+    lines.extend(f"    val {category}: {compose_category_class(category)}," for category in categories)
+    lines.append(")")
+
+    for prefix, colors in (("Light", light), ("Dark", dark)):
+        lines.append("")
+        lines.append(f"val {prefix}AppColors = AppColors(")
+        for category, names in categories.items():
+            lines.append(f"    {category} = {compose_category_class(category)}(")
+            # 夜间缺失时使用日间颜色，与Android资源的回退行为一致
+            lines.extend(f"        {to_camel_case(name)} = {kotlin_color(colors.get(name, light[name]))},"
+                         for name in names)
+            lines.append("    ),")
+        lines.append(")")
+
+    lines.append("")
+    lines.append("val LocalAppColors = staticCompositionLocalOf { LightAppColors }")
+    return "\n".join(lines) + "\n"
+
+
+def generate_compose_dimens(dimensions: Tuple[Tuple[str, int], ...], text_sizes: Mapping[str, int]) -> str:
+    """生成 AppDimens.kt：间距为 Dp，文字大小为 TextUnit"""
+    lines = [f"package {KOTLIN_PACKAGE}", "",
+             "import androidx.compose.ui.unit.dp",
+             "import androidx.compose.ui.unit.sp", "",
+             "// Generated by tokens.py --target compose from the spacing and font size tokens. Do not edit by hand.", "",
+             "object AppSpacing {"]
+    lines.extend(f"    val {to_camel_case(name)} = {value}.dp" for name, value in dimensions)
+    lines.append("}")
+    lines.append("")
+    lines.append("object AppTextSizes {")
+    # 文字大小名称以字母开头（如 xs_12），属性名加 size 前缀以保持可读
+    lines.extend(f"    val {to_camel_case('size_' + name)} = {value}.sp" for name, value in sorted(text_sizes.items()))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+@register_target('compose')
+def render_compose(model: ResolvedTokens, output_dir: str, options: Dict[str, Any]) -> List[str]:
+    """Jetpack Compose 配色和尺寸，写入 ktClass/"""
+    kt_dir = os.path.join(output_dir, "ktClass")
+    light = resolve_semantic_argb(model, LIGHT_MODE)
+    dark = resolve_semantic_argb(model, DARK_MODE)
+    files = {
+        os.path.join(kt_dir, "AppColors.kt"): generate_compose_colors(light, dark),
+        os.path.join(kt_dir, "AppDimens.kt"): generate_compose_dimens(model.dimensions, model.text_sizes),
+    }
+    for path, content in files.items():
+        print(f"{'Generated' if write_if_changed(path, content) else 'Unchanged'}: {path}")
+    return list(files)
+
+
+def semantic_entry(token: Optional[ColorToken], argb: Optional[int]) -> Optional[Dict[str, Any]]:
+    if token is None or argb is None:
+        return None
+    entry: Dict[str, Any] = {'value': argb_to_hex(argb)}
+    if token.alias:
+        entry['alias'] = token.alias
+    if token.comment and 'derived' in token.comment:
+        entry['derived'] = True
+    return entry
+
+
+def build_manifest(model: ResolvedTokens) -> Dict[str, Any]:
+    """扁平的令牌清单：每个令牌一条记录，颜色均为解析后的 #AARRGGBB"""
+    tokens: List[Dict[str, Any]] = []
+    modes = list(model.primitives_by_mode)
+
+    for name in sorted({name for colors in model.primitives_by_mode.values() for name in colors}):
+        values = {mode: model.primitives(mode)[name] for mode in modes if name in model.primitives(mode)}
+        tokens.append({'name': name, 'type': 'primitive_color', 'values': values})
+
+    resolved = {mode: resolve_semantic_argb(model, mode) for mode in model.semantic_by_mode}
+    for name in sorted({name for semantic in model.semantic_by_mode.values() for name in semantic}):
+        values = {}
+        for mode in model.semantic_by_mode:
+            entry = semantic_entry(model.semantic(mode).get(name), resolved[mode].get(name))
+            if entry is not None:
+                values[mode] = entry
+        tokens.append({'name': name, 'type': 'semantic_color', 'values': values,
+                       'category': semantic_category(name)})
+
+    for name, value in model.dimensions:
+        tokens.append({'name': name, 'type': 'dimen', 'value': value, 'unit': 'dp'})
+    for name, value in model.semantic_dimensions:
+        tokens.append({'name': name, 'type': 'semantic_dimen', 'value': value})
+    for name, value in model.radius_values.items():
+        tokens.append({'name': name, 'type': 'radius', 'value': value})
+    for name, value in sorted(model.text_sizes.items()):
+        tokens.append({'name': name, 'type': 'text_size', 'value': value, 'unit': 'sp'})
+    for name, gradient in model.gradients.items():
+        tokens.append({'name': name, 'type': 'gradient', 'rotation': gradient.rotation,
+                       'start': gradient.start_color, 'end': gradient.end_color})
+    for name, style in model.typography_styles.items():
+        tokens.append({'name': name, 'type': 'typography',
+                       'value': {key: value for key, value in style.items()}})
+
+    return {'version': MANIFEST_VERSION, 'source': os.path.basename(model.source),
+            'modes': modes, 'tokens': tokens}
+
+
+@register_target('manifest')
+def render_manifest(model: ResolvedTokens, output_dir: str, options: Dict[str, Any]) -> List[str]:
+    """已解析令牌的JSON清单"""
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    content = json.dumps(build_manifest(model), ensure_ascii=False, indent=2) + "\n"
+    print(f"{'Generated' if write_if_changed(path, content) else 'Unchanged'}: {path}")
+    return [path]
+
+
+@register_target('material3')
+def render_material3(model: ResolvedTokens, output_dir: str, options: Dict[str, Any]) -> List[str]:
+    """Material 3 颜色角色主题，角色引用 @color/语义颜色"""
+    from material_theme import generate_material3_files
+
+    light = {name: token.value for name, token in model.semantic(LIGHT_MODE).items()}
+    dark = {name: token.value for name, token in model.semantic(DARK_MODE).items()}
+    theme_path = os.path.join(output_dir, "values", "themes_material3.xml")
+    readme_path = os.path.join(output_dir, "material3_readme.md")
+    generate_material3_files(light, dark, dict(model.primitives(LIGHT_MODE)), dict(model.primitives(DARK_MODE)),
+                             theme_path, readme_path)
+    return [theme_path, readme_path]
+
+
+def render_target(name: str, model: ResolvedTokens, output_dir: str,
+                  options: Dict[str, Any]) -> Tuple[str, List[str], float]:
+    """渲染单个目标，返回 (目标名, 写入的文件, 耗时秒)"""
+    start = time.perf_counter()
+    with tracer.span('emit', target=name):
+        outputs = EXPORT_TARGETS[name](model, output_dir, options)
+    return name, outputs, time.perf_counter() - start
+
+
+def export_targets(model: ResolvedTokens, targets: List[str], output_dir: str,
+                   options: Optional[Dict[str, Any]] = None) -> List[Tuple[str, List[str], float]]:
+    """并发渲染多个目标
+
+    模型只读，目标之间不共享可变状态，因此使用线程池：模型不需要复制或序列化到子进程，
+    各目标的文件写入可以重叠。只有一个目标时直接在当前线程渲染。
+    """
+    unknown = [name for name in targets if name not in EXPORT_TARGETS]
+    if unknown:
+        raise ValueError(f"Unknown export target(s): {', '.join(unknown)} "
+                         f"(available: {', '.join(sorted(EXPORT_TARGETS))})")
+    options = options or {}
+    if len(targets) == 1:
+        return [render_target(targets[0], model, output_dir, options)]
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = [executor.submit(render_target, name, model, output_dir, options) for name in targets]
+        return [future.result() for future in futures]
+
+
+def print_timings(results: List[Tuple[str, List[str], float]]) -> None:
+    """打印每个目标的耗时"""
+    print("Export targets:")
+    for name, outputs, elapsed in results:
+        print(f"  - {name}: {elapsed * 1000:.1f} ms ({len(outputs)} outputs)")
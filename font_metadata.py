@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Font Metadata Reader
+Read weight, italic and family names from the OS/2 and name tables of TrueType/OpenType fonts,
+plus the variation axes from fvar. Files are memory-mapped and only the table directory and
+these tables are touched.
+"""
+
+import mmap
+import struct
+from typing import Dict, Optional, Tuple
+
+# fsSelection flags
+FS_SELECTION_ITALIC = 1 << 0
+FS_SELECTION_BOLD = 1 << 5
+FS_SELECTION_OBLIQUE = 1 << 9
+
+# name table IDs
+NAME_ID_FAMILY = 1
+NAME_ID_SUBFAMILY = 2
+NAME_ID_FULL_NAME = 4
+NAME_ID_TYPOGRAPHIC_FAMILY = 16
+NAME_ID_TYPOGRAPHIC_SUBFAMILY = 17
+
+# Windows, English (US)
+WINDOWS_PLATFORM_ID = 3
+MAC_PLATFORM_ID = 1
+WINDOWS_LANGUAGE_EN_US = 0x409
+
+# Subfamily spellings that map onto the standard weight names
+WEIGHT_ALIASES = {
+    '': 'regular',
+    'normal': 'regular',
+    'book': 'regular',
+    'hairline': 'thin',
+    'ultralight': 'extralight',
+    'demibold': 'semibold',
+    'ultrabold': 'extrabold',
+    'heavy': 'black'
+}
+
+class FontMetadata:
+    """Font properties read from the font tables"""
+
+    __slots__ = ('family', 'subfamily', 'full_name', 'weight_class', 'is_italic', 'axes')
+
+    def __init__(self, family: str, subfamily: str, full_name: str, weight_class: int, is_italic: bool,
+                 axes: Optional[Dict[str, Tuple[float, float, float]]] = None):
+        self.family = family
+        self.subfamily = subfamily
+        self.full_name = full_name
+        self.weight_class = weight_class
+        self.is_italic = is_italic
+        # Variation axes: tag -> (min, default, max), empty for static fonts
+        self.axes = axes or {}
+
+    @property
+    def is_variable(self) -> bool:
+        """Whether the font has a weight axis"""
+        return 'wght' in self.axes
+
+    def weight_name(self, weight_map: Dict[str, int]) -> str:
+        """Map the font to a key of weight_map
+
+        The subfamily name is checked first because some fonts store legacy
+        usWeightClass values (e.g. 250 for both Thin and ExtraLight); the
+        nearest usWeightClass is used when the subfamily is not a known weight.
+        """
+        style = self.subfamily.lower()
+        for word in ('italic', 'oblique', ' ', '-', '_'):
+            style = style.replace(word, '')
+        style = WEIGHT_ALIASES.get(style, style)
+        if style in weight_map:
+            return style
+        return min(weight_map, key=lambda name: abs(weight_map[name] - self.weight_class))
+
+    def __str__(self):
+        axes = f", Axes: {', '.join(sorted(self.axes))}" if self.axes else ""
+        return f"{self.full_name} - Family: {self.family}, Weight: {self.weight_class}, Italic: {self.is_italic}{axes}"
+
+def _read_table_directory(data: mmap.mmap, font_offset: int = 0) -> Dict[bytes, Tuple[int, int]]:
+    """Read the sfnt table directory, returning tag -> (offset, length)"""
+    num_tables = struct.unpack_from('>H', data, font_offset + 4)[0]
+    tables = {}
+    for i in range(num_tables):
+        tag, _, offset, length = struct.unpack_from('>4sIII', data, font_offset + 12 + 16 * i)
+        tables[tag] = (offset, length)
+    return tables
+
+def _read_os2(data: mmap.mmap, offset: int, length: int) -> Tuple[int, int]:
+    """Read usWeightClass and fsSelection from the OS/2 table"""
+    weight_class = struct.unpack_from('>H', data, offset + 4)[0]
+    fs_selection = struct.unpack_from('>H', data, offset + 62)[0] if length >= 64 else 0
+    return weight_class, fs_selection
+
+def _read_fvar(data: mmap.mmap, offset: int) -> Dict[str, Tuple[float, float, float]]:
+    """Read the variation axes from the fvar table"""
+    axes_offset, _, axis_count, axis_size = struct.unpack_from('>HHHH', data, offset + 4)
+    axes = {}
+    for i in range(axis_count):
+        tag, min_value, default_value, max_value = struct.unpack_from(
+            '>4siii', data, offset + axes_offset + axis_size * i)
+        axes[tag.decode('latin-1')] = (min_value / 65536.0, default_value / 65536.0, max_value / 65536.0)
+    return axes
+
+def _read_names(data: mmap.mmap, offset: int) -> Dict[int, str]:
+    """Read the name records we care about, preferring Windows English names"""
+    _, count, string_offset = struct.unpack_from('>HHH', data, offset)
+    wanted = {NAME_ID_FAMILY, NAME_ID_SUBFAMILY, NAME_ID_FULL_NAME,
+              NAME_ID_TYPOGRAPHIC_FAMILY, NAME_ID_TYPOGRAPHIC_SUBFAMILY}
+    names: Dict[int, str] = {}
+    priorities: Dict[int, int] = {}
+
+    for i in range(count):
+        platform_id, _, language_id, name_id, length, str_offset = struct.unpack_from(
+            '>HHHHHH', data, offset + 6 + 12 * i)
+        if name_id not in wanted:
+            continue
+
+        if platform_id == WINDOWS_PLATFORM_ID:
+            priority = 2 if language_id == WINDOWS_LANGUAGE_EN_US else 1
+            encoding = 'utf-16-be'
+        elif platform_id == MAC_PLATFORM_ID:
+            priority = 0
+            encoding = 'mac_roman'
+        else:
+            continue
+
+        if priority <= priorities.get(name_id, -1):
+            continue
+
+        start = offset + string_offset + str_offset
+        raw = data[start:start + length]
+        try:
+            names[name_id] = raw.decode(encoding)
+            priorities[name_id] = priority
+        except UnicodeDecodeError:
+            continue
+
+    return names
+
+def read_font_metadata(font_path: str) -> Optional[FontMetadata]:
+    """Read font metadata, returning None if the file is not a readable sfnt font"""
+    try:
+        with open(font_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                font_offset = 0
+                if data[:4] == b'ttcf':
+                    # TrueType Collection: use the first font
+                    font_offset = struct.unpack_from('>I', data, 12)[0]
+
+                tables = _read_table_directory(data, font_offset)
+                if b'OS/2' not in tables or b'name' not in tables:
+                    return None
+
+                weight_class, fs_selection = _read_os2(data, *tables[b'OS/2'])
+                names = _read_names(data, tables[b'name'][0])
+                axes = _read_fvar(data, tables[b'fvar'][0]) if b'fvar' in tables else {}
+    except (OSError, ValueError, struct.error):
+        return None
+
+    family = names.get(NAME_ID_TYPOGRAPHIC_FAMILY) or names.get(NAME_ID_FAMILY, '')
+    subfamily = names.get(NAME_ID_TYPOGRAPHIC_SUBFAMILY) or names.get(NAME_ID_SUBFAMILY, '')
+    full_name = names.get(NAME_ID_FULL_NAME, f"{family} {subfamily}".strip())
+    is_italic = bool(fs_selection & (FS_SELECTION_ITALIC | FS_SELECTION_OBLIQUE))
+
+    return FontMetadata(family, subfamily, full_name, weight_class, is_italic, axes)
+
+def main():
+    """Main function"""
+    import argparse
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description='Print font metadata from OS/2 and name tables')
+    parser.add_argument('--static-dir', default='static',
+                       help='Directory containing font files (default: static)')
+
+    args = parser.parse_args()
+
+    font_extensions = {'.ttf', '.otf', '.ttc'}
+    for file_path in sorted(Path(args.static_dir).iterdir()):
+        if file_path.suffix.lower() in font_extensions:
+            metadata = read_font_metadata(str(file_path))
+            print(f"{file_path.name}: {metadata if metadata else 'unreadable'}")
+
+if __name__ == '__main__':
+    main()
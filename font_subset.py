@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Font Subsetter
+Drop glyphs and tables the app never uses from the static font files.
+The character set comes from literal text and/or the app's string resources.
+Subsetting uses fontTools (pip install fonttools) and runs one process per font.
+"""
+
+import hashlib
+import os
+import shutil
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+from instrumentation import tracer, CACHE_HITS
+
+# Tables that are never needed on Android
+DROP_TABLES = ['DSIG', 'hdmx', 'VDMX', 'LTSH', 'PCLT', 'vhea', 'vmtx']
+
+# Android string resource escapes
+ANDROID_ESCAPES = {'\\n': '\n', '\\t': '\t', "\\'": "'", '\\"': '"', '\\@': '@', '\\?': '?'}
+
+def collect_strings_charset(strings_dir: str) -> Set[str]:
+    """Collect the characters used by string resources (values*/strings*.xml) under a directory"""
+    chars: Set[str] = set()
+    for xml_path in Path(strings_dir).rglob('*.xml'):
+        if not xml_path.parent.name.startswith('values'):
+            continue
+        try:
+            root = ET.parse(xml_path).getroot()
+        except ET.ParseError:
+            continue
+        if root.tag != 'resources':
+            continue
+        for element in root.iter():
+            if element.tag in ('string', 'item'):
+                text = ''.join(element.itertext())
+                for escape, char in ANDROID_ESCAPES.items():
+                    text = text.replace(escape, char)
+                chars.update(text)
+    return chars
+
+def build_charset(text: Optional[str] = None, strings_dir: Optional[str] = None) -> Set[str]:
+    """Combine literal text and string resources into one character set"""
+    chars: Set[str] = set(text or '')
+    if strings_dir:
+        chars |= collect_strings_charset(strings_dir)
+    # Whitespace/control characters are never drawn, but keep the space glyph for layout
+    chars = {c for c in chars if c.isprintable()}
+    chars.add(' ')
+    return chars
+
+def file_sha256(file_path: str) -> str:
+    """Hash a file in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def charset_sha256(chars: Iterable[str]) -> str:
+    """Hash a character set independent of order"""
+    return hashlib.sha256(''.join(sorted(chars)).encode('utf-8')).hexdigest()
+
+def _subset_font(job: Tuple[str, str, Tuple[int, ...]]) -> Tuple[str, int, int, bool]:
+    """Subset one font into the cache (runs in a worker process)
+
+    Returns:
+        (font path, original size, subset size, cache hit)
+    """
+    font_path, cache_path, unicodes = job
+    original_size = os.path.getsize(font_path)
+
+    if os.path.exists(cache_path):
+        return font_path, original_size, os.path.getsize(cache_path), True
+
+    from fontTools import subset
+
+    options = subset.Options()
+    options.layout_features = ['*']
+    options.drop_tables = subset.Options().drop_tables + DROP_TABLES
+    options.notdef_outline = True
+    options.name_IDs = [1, 2, 4, 6, 16, 17]
+    options.hinting = False
+
+    font = subset.load_font(font_path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+
+    # Write to a temp file first so an interrupted run never leaves a broken cache entry
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    subset.save_font(font, tmp_path, options)
+    font.close()
+    os.replace(tmp_path, cache_path)
+
+    return font_path, original_size, os.path.getsize(cache_path), False
+
+class FontSubsetter:
+    """Subset font files in parallel with a content-addressed cache"""
+
+    def __init__(self, output_dir: str, cache_dir: str = ".font_subset_cache", jobs: Optional[int] = None):
+        self.output_dir = Path(output_dir)
+        self.cache_dir = Path(cache_dir)
+        self.jobs = jobs
+
+    def subset(self, font_paths: List[str], chars: Set[str]) -> List[Tuple[str, int, int, bool]]:
+        """Subset fonts and copy them into the output directory
+
+        Returns:
+            [(font path, original size, subset size, cache hit), ...]
+        """
+        try:
+            import fontTools  # noqa: F401
+        except ImportError:
+            print("Error: font subsetting requires fontTools (pip install fonttools)")
+            return []
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        unicodes = tuple(sorted(ord(c) for c in chars))
+        chars_hash = charset_sha256(chars)
+
+        jobs = []
+        for font_path in font_paths:
+            font_hash = file_sha256(font_path)
+            suffix = Path(font_path).suffix.lower()
+            cache_path = self.cache_dir / f"{font_hash[:16]}_{chars_hash[:16]}{suffix}"
+            jobs.append((font_path, str(cache_path), unicodes))
+
+        print(f"Subsetting {len(jobs)} font files to {len(chars)} characters...")
+
+        with tracer.span('subset', fonts=len(jobs)):
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                results = list(executor.map(_subset_font, jobs))
+        tracer.count(CACHE_HITS, sum(1 for result in results if result[3]))
+
+        for font_path, cache_path, _ in jobs:
+            shutil.copyfile(cache_path, self.output_dir / Path(font_path).name)
+
+        self.print_report(results)
+        return results
+
+    def print_report(self, results: List[Tuple[str, int, int, bool]]):
+        """Print size saved per file"""
+        total_before = 0
+        total_after = 0
+        for font_path, before, after, cached in results:
+            total_before += before
+            total_after += after
+            saved = before - after
+            percent = saved * 100.0 / before if before else 0.0
+            source = " (cached)" if cached else ""
+            print(f"  {Path(font_path).name}: {before:,} -> {after:,} bytes, "
+                  f"saved {saved:,} ({percent:.1f}%){source}")
+
+        if total_before:
+            saved = total_before - total_after
+            print(f"Total: {total_before:,} -> {total_after:,} bytes, "
+                  f"saved {saved:,} ({saved * 100.0 / total_before:.1f}%)")
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """
 Android Font XML Generator
-Generate Android font family XML files from font files in static directory
+Generate Android font family XML files from font files in static directory.
+When a variable font (one with a 'wght' axis) is found or passed in, the API 26+
+font family maps every weight onto that single file; the static files are then
+only used by the pre-26 font family.
 """
 
 import os
-from typing import Dict, List
+import shutil
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
+from font_metadata import read_font_metadata
+from font_subset import FontSubsetter, build_charset
+
 class FontWeightMapper:
     """Map font weights to Android font weight values"""
     
@@ -35,13 +42,18 @@ class FontFile:
         self.filepath = filepath
         self.filename = os.path.basename(filepath)
         self.name, self.extension = os.path.splitext(self.filename)
-        self.is_italic = 'italic' in self.name.lower()
+        self.metadata = read_font_metadata(filepath)
+        self.is_italic = self.metadata.is_italic if self.metadata else 'italic' in self.name.lower()
         self.weight_name = self._extract_weight_name()
         self.weight_value = FontWeightMapper.get_weight(self.weight_name)
         self.font_family = self._extract_font_family()
+        self.is_variable = bool(self.metadata and self.metadata.is_variable)
     
     def _extract_weight_name(self) -> str:
-        """Extract weight name from filename"""
+        """Extract weight name from the OS/2 and name tables, falling back to the filename"""
+        if self.metadata:
+            return self.metadata.weight_name(FontWeightMapper.WEIGHT_MAP)
+
         name = self.name.lower()
         
         # Remove italic suffix if present
@@ -60,7 +72,10 @@ class FontFile:
         return 'regular'  # default
     
     def _extract_font_family(self) -> str:
-        """Extract font family name from filename"""
+        """Extract font family name from the name table, falling back to the filename"""
+        if self.metadata and self.metadata.family:
+            return self.metadata.family.replace(' ', '').replace('-', '').title()
+
         name = self.name.lower()
         
         # Extract family from filename (intertight_weight)
@@ -72,17 +87,94 @@ class FontFile:
         
         return 'InterTight'
     
+    @property
+    def weight_range(self) -> Tuple[int, int]:
+        """Weight axis range of a variable font (the single weight for static fonts)"""
+        if not self.is_variable:
+            return self.weight_value, self.weight_value
+        min_weight, _, max_weight = self.metadata.axes['wght']
+        return int(min_weight), int(max_weight)
+
+    @property
+    def resource_name(self) -> str:
+        """Android resource name for a variable font copied into font-v26"""
+        suffix = '_italic' if self.is_italic else ''
+        return f"{self.font_family.lower()}_variable{suffix}"
+
     def __str__(self):
+        if self.is_variable:
+            min_weight, max_weight = self.weight_range
+            return f"{self.filename} - Family: {self.font_family}, Variable weight: {min_weight}-{max_weight}, Italic: {self.is_italic}"
         return f"{self.filename} - Family: {self.font_family}, Weight: {self.weight_name}({self.weight_value}), Italic: {self.is_italic}"
 
+class FontWeightIndex:
+    """Precomputed (weight, italic) -> font resource lookup for one font family"""
+
+    WEIGHTS = range(100, 1000, 100)
+
+    def __init__(self, family_name: str, font_files: List[FontFile], variable: bool = False):
+        self.family_name = family_name
+        self.family_resource = f"@font/{family_name.lower()}_font_family"
+        # font-v26 maps this family onto a variable font, so API 26+ styles can use the family directly
+        self.variable = variable
+        self.faces: Dict[Tuple[int, bool], str] = {}
+
+        available = {(f.weight_value, f.is_italic): f.name for f in font_files}
+        if not available:
+            return
+
+        # Resolve every weight step to its nearest available face once, so a lookup is a dict hit
+        for italic in (False, True):
+            keys = [k for k in available if k[1] == italic] or list(available)
+            for weight in self.WEIGHTS:
+                nearest = min(keys, key=lambda k: (abs(k[0] - weight), k[0]))
+                self.faces[(weight, italic)] = f"@font/{available[nearest]}"
+
+    def lookup(self, weight: int, italic: bool = False) -> str:
+        """Get the font resource for a weight, snapping to the nearest 100"""
+        step = min(max(int(round(weight / 100.0)) * 100, 100), 900)
+        return self.faces.get((step, italic), self.family_resource)
+
+def build_font_weight_indexes(static_dir: str = "static",
+                              variable_fonts: Optional[List[str]] = None) -> Dict[str, FontWeightIndex]:
+    """Scan font files and build a weight index per family, keyed by lowercase family name
+
+    Families with a variable font (in static_dir or passed via --variable-font) are flagged so
+    typography styles for API 26+ can point at the family instead of a static face.
+    """
+    static_path = Path(static_dir)
+    font_extensions = {'.ttf', '.otf'}
+    families: Dict[str, List[FontFile]] = {}
+    variable_families: Set[str] = set()
+
+    paths = sorted(static_path.iterdir()) if static_path.is_dir() else []
+    for file_path in paths:
+        if file_path.suffix.lower() in font_extensions:
+            font_file = FontFile(str(file_path))
+            if font_file.is_variable:
+                variable_families.add(font_file.font_family)
+                continue
+            families.setdefault(font_file.font_family, []).append(font_file)
+
+    for file_path in variable_fonts or []:
+        font_file = FontFile(str(file_path))
+        if font_file.is_variable:
+            variable_families.add(font_file.font_family)
+
+    return {name.lower(): FontWeightIndex(name, families.get(name, []), name in variable_families)
+            for name in sorted(set(families) | variable_families)}
+
 class AndroidFontGenerator:
     """Generate Android font XML files"""
     
-    def __init__(self, static_dir: str = "static", output_dir: str = "font", output_dir_v26: str = "font-v26"):
+    def __init__(self, static_dir: str = "static", output_dir: str = "font", output_dir_v26: str = "font-v26",
+                 variable_fonts: Optional[List[str]] = None):
         self.static_dir = Path(static_dir)
         self.output_dir = Path(output_dir)
         self.output_dir_v26 = Path(output_dir_v26)
         self.font_files: List[FontFile] = []
+        self.variable_font_files: List[FontFile] = []
+        self.variable_font_paths = [Path(p) for p in variable_fonts or []]
         
         # Create output directories if they don't exist
         self.output_dir.mkdir(exist_ok=True)
@@ -97,10 +189,23 @@ class AndroidFontGenerator:
         for file_path in self.static_dir.iterdir():
             if file_path.suffix.lower() in font_extensions:
                 font_file = FontFile(str(file_path))
-                self.font_files.append(font_file)
+                if font_file.is_variable:
+                    self.variable_font_files.append(font_file)
+                else:
+                    self.font_files.append(font_file)
                 print(f"Found: {font_file}")
         
+        for file_path in self.variable_font_paths:
+            font_file = FontFile(str(file_path))
+            if not font_file.is_variable:
+                print(f"Warning: {file_path} has no 'wght' axis, ignoring")
+                continue
+            self.variable_font_files.append(font_file)
+            print(f"Found variable: {font_file}")
+        
         print(f"Total font files found: {len(self.font_files)}")
+        if self.variable_font_files:
+            print(f"Variable font files found: {len(self.variable_font_files)}")
     
     def group_by_family(self) -> Dict[str, List[FontFile]]:
         """Group font files by font family"""
@@ -114,6 +219,57 @@ class AndroidFontGenerator:
         
         return families
 
+    def group_variable_by_family(self) -> Dict[str, Dict[bool, FontFile]]:
+        """Group variable font files by font family and italic style"""
+        families: Dict[str, Dict[bool, FontFile]] = {}
+        
+        for font_file in self.variable_font_files:
+            styles = families.setdefault(font_file.font_family, {})
+            if font_file.is_italic in styles:
+                print(f"Warning: duplicate variable font for {font_file.font_family}, ignoring {font_file.filename}")
+                continue
+            styles[font_file.is_italic] = font_file
+        
+        return families
+
+    def variable_weights(self, family_name: str, font_file: FontFile) -> List[int]:
+        """Weights to expose from a variable font: the static weights if any, else every 100 step, within the axis range"""
+        min_weight, max_weight = font_file.weight_range
+        static_weights = {f.weight_value for f in self.font_files if f.font_family == family_name}
+        weights = static_weights or set(FontWeightMapper.WEIGHT_MAP.values())
+        return sorted(w for w in weights if min_weight <= w <= max_weight)
+
+    def create_font_v26_variable_family_xml(self, family_name: str, styles: Dict[bool, FontFile]) -> str:
+        """Create Android font family XML string mapping every weight onto the variable font files"""
+        
+        xml_lines = [
+            '<?xml version="1.0" encoding="utf-8"?>',
+            '<font-family xmlns:android="http://schemas.android.com/apk/res/android"',
+            '    xmlns:app="http://schemas.android.com/apk/res-auto">',
+        ]
+        
+        # Add one font element per weight and style, all pointing at the same file
+        for italic in sorted(styles):
+            font_file = styles[italic]
+            style = 'italic' if italic else 'normal'
+            font_path = f"@font/{font_file.resource_name}"
+            
+            for weight in self.variable_weights(family_name, font_file):
+                variation_setting = f"'wght' {weight}"
+                xml_lines.append(f'    <font')
+                xml_lines.append(f'        android:fontStyle="{style}"')
+                xml_lines.append(f'        android:fontWeight="{weight}"')
+                xml_lines.append(f'        android:fontVariationSettings="{variation_setting}"')
+                xml_lines.append(f'        android:font="{font_path}"')
+                xml_lines.append(f'        app:fontStyle="{style}"')
+                xml_lines.append(f'        app:fontWeight="{weight}"')
+                xml_lines.append(f'        app:fontVariationSettings="{variation_setting}"')
+                xml_lines.append(f'        app:font="{font_path}" />')
+        
+        xml_lines.append('</font-family>')
+        
+        return '\n'.join(xml_lines)
+
     def create_font_v26_family_xml(self, family_name: str, font_files: List[FontFile]) -> str:
         """Create Android font family XML string"""
         
@@ -197,6 +353,9 @@ class AndroidFontGenerator:
         """Create predefined font styles XML string for API 26+"""
         
         families = self.group_by_family()
+        variable_families = self.group_variable_by_family()
+        for family_name in variable_families:
+            families.setdefault(family_name, [])
         
         xml_lines = [
             '<?xml version="1.0" encoding="utf-8"?>',
@@ -208,7 +367,11 @@ class AndroidFontGenerator:
             xml_lines.append(f'    <array name="{family_name.lower()}_font_weights_v26">')
             
             # Add weight values with variation settings
-            weights = sorted(set(f.weight_value for f in font_files))
+            if family_name in variable_families:
+                weights = sorted(set(w for f in variable_families[family_name].values()
+                                     for w in self.variable_weights(family_name, f)))
+            else:
+                weights = sorted(set(f.weight_value for f in font_files))
             for weight in weights:
                 xml_lines.append(f'        <item>{weight}</item>')
             
@@ -261,10 +424,19 @@ class AndroidFontGenerator:
         
         # Group by family
         families = self.group_by_family()
+        variable_families = self.group_variable_by_family()
         
         # Generate font family XML files for v26
-        for family_name, font_files in families.items():
-            xml_content = self.create_font_v26_family_xml(family_name, font_files)
+        for family_name in sorted(set(families) | set(variable_families)):
+            if family_name in variable_families:
+                styles = variable_families[family_name]
+                for font_file in styles.values():
+                    font_output = self.output_dir_v26 / f"{font_file.resource_name}{font_file.extension.lower()}"
+                    shutil.copyfile(font_file.filepath, font_output)
+                    print(f"Copied v26: {font_file.filename} -> {font_output}")
+                xml_content = self.create_font_v26_variable_family_xml(family_name, styles)
+            else:
+                xml_content = self.create_font_v26_family_xml(family_name, families[family_name])
             
             # Write to font-v26 directory
             output_file = self.output_dir_v26 / f"{family_name.lower()}_font_family.xml"
@@ -381,8 +553,15 @@ This directory contains Android font XML files generated for API 26+ with variab
         
         readme_content += """## Font Files\n\nThe following font files are referenced by the XML files:\n\n"""
         
+        variable_families = self.group_variable_by_family()
         for font_file in self.font_files:
+            if font_file.font_family in variable_families:
+                continue
             readme_content += f"- `{font_file.filename}` - {font_file.font_family} {font_file.weight_name.title()} {'Italic' if font_file.is_italic else 'Regular'}\n"
+        for styles in variable_families.values():
+            for font_file in styles.values():
+                min_weight, max_weight = font_file.weight_range
+                readme_content += f"- `{font_file.resource_name}{font_file.extension.lower()}` - {font_file.font_family} Variable {min_weight}-{max_weight} {'Italic' if font_file.is_italic else 'Regular'} (from `{font_file.filename}`)\n"
         
         readme_content += "\n## API 26+ Features\n\n"
         readme_content += "- **Font Variation Settings**: Support for variable fonts with `android:fontVariationSettings`\n"
@@ -404,12 +583,15 @@ This directory contains Android font XML files generated for API 26+ with variab
         # Scan for font files
         self.scan_font_files()
         
-        if not self.font_files:
+        if not self.font_files and not self.variable_font_files:
             print("No font files found!")
             return
         
         # Generate XML files for regular version
-        self.generate_xml_files()
+        if self.font_files:
+            self.generate_xml_files()
+        else:
+            print("Warning: no static font files, skipping pre-26 font family XML")
         
         # Generate XML files for API 26+ version
         self.generate_xml_files_v26()
@@ -417,6 +599,13 @@ This directory contains Android font XML files generated for API 26+ with variab
         print("\nFont XML generation completed!")
         print(f"Regular output directory: {self.output_dir}")
         print(f"API 26+ output directory: {self.output_dir_v26}")
+    
+    def subset_fonts(self, chars: Set[str], output_dir: str, cache_dir: str = ".font_subset_cache",
+                     jobs: Optional[int] = None):
+        """Subset the scanned font files down to the given characters"""
+        print("\nSubsetting font files...")
+        subsetter = FontSubsetter(output_dir, cache_dir, jobs)
+        subsetter.subset([f.filepath for f in self.font_files], chars)
 
 def main():
     """Main function"""
@@ -429,12 +618,31 @@ def main():
                        help='Output directory for XML files (default: font)')
     parser.add_argument('--output-dir-v26', default='font-v26', 
                        help='Output directory for API 26+ XML files (default: font-v26)')
+    parser.add_argument('--variable-font', action='append', default=[],
+                       help='Variable font file (with a wght axis) to use for API 26+; repeat for the italic file '
+                            '(default: auto-detect in --static-dir)')
+    parser.add_argument('--subset-text', 
+                       help='Subset fonts to the characters in this text')
+    parser.add_argument('--subset-strings-dir', 
+                       help='Subset fonts to the characters used by values*/strings.xml under this directory')
+    parser.add_argument('--subset-output-dir', 
+                       help='Output directory for subset font files (default: same as --output-dir)')
+    parser.add_argument('--subset-cache-dir', default='.font_subset_cache', 
+                       help='Cache directory for subset font files (default: .font_subset_cache)')
+    parser.add_argument('--jobs', type=int, 
+                       help='Number of worker processes for subsetting (default: CPU count)')
     
     args = parser.parse_args()
     
     # Create generator and run
-    generator = AndroidFontGenerator(args.static_dir, args.output_dir, args.output_dir_v26)
+    generator = AndroidFontGenerator(args.static_dir, args.output_dir, args.output_dir_v26,
+                                     args.variable_font)
     generator.run()
+    
+    if (args.subset_text or args.subset_strings_dir) and generator.font_files:
+        chars = build_charset(args.subset_text, args.subset_strings_dir)
+        generator.subset_fonts(chars, args.subset_output_dir or args.output_dir,
+                               args.subset_cache_dir, args.jobs)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+硬编码颜色迁移：扫描使用方 Android 工程中的 Kotlin/Java/XML 源码，找出 #RRGGBB 字面量、
+Color.parseColor("...")、"...".toColorInt() 和 Compose 的 Color(0xAARRGGBB)，
+在语义颜色的 OKLab 网格索引中查找日间色差不超过阈值的最近令牌，输出匹配报告，
+并可选地改写为 @color/、?attr/ 或 R.color 用法（Kotlin 使用 AuColor.kt 中的 asColor()）。
+字面量在夜间模式下保持不变，因此只有日间、夜间值都在阈值内的令牌才会被改写，
+仅日间匹配的令牌只报告，避免改写后夜间颜色发生变化。
+
+文件由进程池并行扫描，令牌索引在每个工作进程初始化时构建一次；同一颜色值的查询结果在进程内缓存。
+"""
+
+import argparse
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from color_utils import (argb_to_hex, argb_to_oklab, color_resource_files, delta_e_ok, parse_hex_color,
+                         resolve_color_data, semantic_category)
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from palette_dedupe import LabGridIndex
+from theme import parse_color_xml, to_camel_case
+
+# 默认色差阈值（ΔE_OK×100），约2为可察觉差异
+DEFAULT_THRESHOLD = 2.0
+
+SOURCE_EXTENSIONS = ('.kt', '.java', '.xml')
+SKIP_DIRS = {'build', '.git', '.gradle', '.idea', 'node_modules'}
+# 本工具链生成的文件本身就是令牌的定义，不参与扫描
+GENERATED_PREFIXES = ('semantic_color', 'primitive_color', 'semantic_color_attrs', 'themes', 'AuColor')
+
+HEX = r'#[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?'
+KOTLIN_PATTERN = re.compile(
+    rf'Color\.parseColor\(\s*"(?P<parse>{HEX})"\s*\)'
+    rf'|"(?P<to_int>{HEX})"\.toColorInt\(\)'
+    rf'|\bColor\(\s*0[xX](?P<compose>[0-9a-fA-F]{{8}})\s*\)'
+    rf'|"(?P<string>{HEX})"'
+)
+XML_PATTERN = re.compile(
+    r'(?P<attr_name>[\w:]+)="(?P<attr>#[0-9a-fA-F]{3,8})"'
+    r'|>\s*(?P<text>#[0-9a-fA-F]{3,8})\s*<'
+)
+
+# 上下文关键字 -> 优先选择的语义分类（多个令牌颜色相同时用于挑选）
+CONTEXT_HINTS = (
+    ('textcolor', 'text'), ('hintcolor', 'text'),
+    ('background', 'bg'), ('cardbackground', 'bg'),
+    ('stroke', 'border'), ('border', 'border'), ('divider', 'border'),
+    ('tint', 'fg'), ('fillcolor', 'fg'), ('icon', 'icon'),
+)
+
+ASCOLOR_IMPORT = "import com.vau.ui.asColor"
+
+# Kotlin 匹配前的调用接收者或赋值目标，如 view.setTextColor( / textColor =
+KOTLIN_RECEIVER = re.compile(r'([\w.]+)\s*(?:\(|=)\s*$')
+# XML 元素文本所属元素的 name 属性，如 <item name="android:textColor">
+XML_ELEMENT_NAME = re.compile(r'name="([^"]+)"[^<>]*$')
+
+# (行号, 原文, 类型, 令牌, 色差, 替换文本或None, 是否仅日间匹配)
+Match = Tuple[int, str, str, Optional[str], float, Optional[str], bool]
+
+
+def context_hint(text: Optional[str]) -> Optional[str]:
+    """根据属性名/方法名推测语义分类"""
+    if not text:
+        return None
+    lowered = text.lower()
+    for keyword, category in CONTEXT_HINTS:
+        if keyword in lowered:
+            return category
+    return None
+
+
+def match_context(content: str, found: re.Match, line_start: int, is_xml: bool) -> Optional[str]:
+    """取与匹配直接相关的上下文：XML 为属性名或元素的 name 属性，Kotlin 为匹配前的调用接收者，
+    同一行的其他属性不参与推测"""
+    if is_xml and found.lastgroup == 'attr':
+        return found.group('attr_name')
+    prefix = content[line_start:found.start()]
+    context = (XML_ELEMENT_NAME if is_xml else KOTLIN_RECEIVER).search(prefix)
+    return context.group(1) if context else None
+
+
+class TokenIndex:
+    """语义颜色的 OKLab 网格索引（按日间颜色），网格边长等于阈值，一次查询只检查相邻格子"""
+
+    def __init__(self, tokens: Dict[str, Tuple[int, int]], threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.grid = LabGridIndex(threshold)
+        self.colors: Dict[str, Tuple[int, int, Tuple[float, float, float], Tuple[float, float, float]]] = {}
+        for name, (day_argb, night_argb) in tokens.items():
+            lab = argb_to_oklab(day_argb)
+            self.colors[name] = (day_argb, night_argb, lab, argb_to_oklab(night_argb))
+            self.grid.insert(name, lab)
+        self._cache: Dict[Tuple[int, Optional[str]], Optional[Tuple[str, float, bool]]] = {}
+
+    def nearest(self, argb: int, hint: Optional[str] = None) -> Optional[Tuple[str, float, bool]]:
+        """返回 (令牌名, 日间色差, 夜间是否也在阈值内)，阈值内没有透明度相同的令牌时返回None
+
+        优先选择日间、夜间都匹配的令牌；其次按色差（0.1精度）、是否与上下文分类一致、
+        名称长度和名称排序。
+        """
+        key = (argb, hint)
+        if key in self._cache:
+            return self._cache[key]
+        lab = argb_to_oklab(argb)
+        best = None
+        best_key = None
+        for name in self.grid.neighbors(lab):
+            day_argb, night_argb, token_lab, night_lab = self.colors[name]
+            if day_argb >> 24 != argb >> 24:
+                continue
+            distance = delta_e_ok(lab, token_lab)
+            if distance > self.threshold:
+                continue
+            night_match = night_argb >> 24 == argb >> 24 and delta_e_ok(lab, night_lab) <= self.threshold
+            rank = (not night_match, round(distance, 1), hint is not None and semantic_category(name) != hint,
+                    len(name), name)
+            if best_key is None or rank < best_key:
+                best, best_key = (name, distance, night_match), rank
+        self._cache[key] = best
+        return best
+
+
+def load_token_colors(res_dir: str) -> Dict[str, Tuple[int, int]]:
+    """读取生成的颜色XML，返回 语义颜色名 -> (日间ARGB, 夜间ARGB)"""
+    files = {
+        'light_semantic': os.path.join(res_dir, "values", "semantic_color.xml"),
+        'dark_semantic': os.path.join(res_dir, "values-night", "semantic_color.xml"),
+        'light_primitive': os.path.join(res_dir, "values", "primitive_color.xml"),
+        'dark_primitive': os.path.join(res_dir, "values-night", "primitive_color.xml"),
+    }
+    for path in files.values():
+        if not color_resource_files(path):
+            raise FileNotFoundError(path)
+    colors = {key: parse_color_xml(path) for key, path in files.items()}
+
+    tokens = {}
+    for name, value in colors['light_semantic'].items():
+        day_argb = resolve_color_data(value, colors['light_primitive'])
+        night_argb = resolve_color_data(colors['dark_semantic'].get(name, value), colors['dark_primitive'])
+        if day_argb is not None and night_argb is not None:
+            tokens[name] = (day_argb, night_argb)
+    return tokens
+
+
+def is_source_file(file_name: str) -> bool:
+    return file_name.endswith(SOURCE_EXTENSIONS) and not file_name.startswith(GENERATED_PREFIXES)
+
+
+def collect_source_files(root: str) -> List[str]:
+    """收集待扫描的源码文件，跳过构建目录和本工具链生成的文件"""
+    paths = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+        paths.extend(os.path.join(directory, name) for name in sorted(files) if is_source_file(name))
+    return paths
+
+
+def kotlin_replacement(kind: str, token: str) -> Optional[str]:
+    """Kotlin 中的替换文本；普通字符串字面量的用途无法判断，只报告不改写"""
+    if kind in ('parse', 'to_int'):
+        return f"R.color.{token}.asColor()"
+    if kind == 'compose':
+        return f"Color(R.color.{token}.asColor())"
+    return None
+
+
+def xml_replacement(kind: str, token: str, attr_name: Optional[str], xml_style: str) -> Optional[str]:
+    """XML 中的替换文本；<color> 等元素文本不能引用主题属性，总是使用 @color/"""
+    if kind == 'attr':
+        value = f"?attr/{to_camel_case(token)}" if xml_style == 'attr' else f"@color/{token}"
+        return f'{attr_name}="{value}"'
+    return f">@color/{token}<"
+
+
+def scan_content(content: str, extension: str, index: TokenIndex,
+                 xml_style: str = 'color') -> Tuple[List[Match], List[Tuple[int, int, str]]]:
+    """扫描文件内容，Java 文件只报告（asColor() 是 Kotlin 扩展函数）
+
+    Returns:
+        (匹配列表, 需要替换的 (起点, 终点, 替换文本))
+    """
+    is_xml = extension == '.xml'
+    pattern = XML_PATTERN if is_xml else KOTLIN_PATTERN
+    matches: List[Match] = []
+    edits: List[Tuple[int, int, str]] = []
+    for found in pattern.finditer(content):
+        kind = found.lastgroup
+        literal = found.group(kind)
+        argb = parse_hex_color(literal if kind != 'compose' else f"#{literal}")
+        if argb is None:
+            continue
+        line_start = content.rfind('\n', 0, found.start()) + 1
+        line_no = content.count('\n', 0, found.start()) + 1
+
+        result = index.nearest(argb, context_hint(match_context(content, found, line_start, is_xml)))
+        if result is None:
+            matches.append((line_no, found.group(0), kind, None, 0.0, None, False))
+            continue
+        token, distance, night_match = result
+        if not night_match:
+            replacement = None
+        elif is_xml:
+            replacement = xml_replacement(kind, token, found.group('attr_name'), xml_style)
+        elif extension == '.kt':
+            replacement = kotlin_replacement(kind, token)
+        else:
+            replacement = None
+        matches.append((line_no, found.group(0), kind, token, distance, replacement, not night_match))
+        if replacement is not None:
+            edits.append((found.start(), found.end(), replacement))
+    return matches, edits
+
+
+def apply_edits(content: str, edits: List[Tuple[int, int, str]]) -> str:
+    """从后向前应用替换，保持前面的偏移量有效"""
+    for start, end, replacement in sorted(edits, reverse=True):
+        content = content[:start] + replacement + content[end:]
+    return content
+
+
+def ensure_import(content: str, import_line: str) -> str:
+    """在Kotlin文件的最后一个 import（没有时在 package）之后添加 import"""
+    if import_line in content or 'package com.vau.ui\n' in content:
+        return content
+    anchors = list(re.finditer(r'^import .*$', content, re.MULTILINE)) or \
+        list(re.finditer(r'^package .*$', content, re.MULTILINE))
+    if not anchors:
+        return f"{import_line}\n{content}"
+    position = anchors[-1].end()
+    separator = "\n" if anchors[-1].group(0).startswith('import') else "\n\n"
+    return content[:position] + separator + import_line + content[position:]
+
+
+# 工作进程内共享的令牌索引和选项，由进程池初始化时构建一次
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(tokens: Dict[str, Tuple[int, int]], threshold: float, xml_style: str, write: bool) -> None:
+    _worker_state['index'] = TokenIndex(tokens, threshold)
+    _worker_state['xml_style'] = xml_style
+    _worker_state['write'] = write
+
+
+def scan_file(path: str) -> Tuple[str, List[Match], int]:
+    """扫描（并按需改写）一个文件
+
+    Returns:
+        (路径, 匹配列表, 改写数量)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (UnicodeDecodeError, OSError):
+        return path, [], 0
+    if '#' not in content and 'Color(' not in content:
+        return path, [], 0
+
+    extension = os.path.splitext(path)[1]
+    matches, edits = scan_content(content, extension, _worker_state['index'], _worker_state['xml_style'])
+    if not edits or not _worker_state['write']:
+        return path, matches, 0
+
+    updated = apply_edits(content, edits)
+    if extension == '.kt' and any('asColor()' in edit[2] for edit in edits):
+        updated = ensure_import(updated, ASCOLOR_IMPORT)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    return path, matches, len(edits)
+
+
+def scan_tree(paths: List[str], tokens: Dict[str, Tuple[int, int]], threshold: float = DEFAULT_THRESHOLD,
+              xml_style: str = 'color', write: bool = False,
+              jobs: Optional[int] = None) -> List[Tuple[str, List[Match], int]]:
+    """并行扫描所有文件，jobs为1时在当前进程中依次扫描"""
+    initargs = (tokens, threshold, xml_style, write)
+    if jobs == 1 or len(paths) < 2:
+        _init_worker(*initargs)
+        return [scan_file(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=initargs) as executor:
+        return list(executor.map(scan_file, paths, chunksize=max(1, len(paths) // 256)))
+
+
+def print_report(results: List[Tuple[str, List[Match], int]], tokens: Dict[str, Tuple[int, int]],
+                 root: str, list_matches: bool = False) -> None:
+    """按令牌汇总匹配，列出阈值内没有令牌的颜色"""
+    by_token: Dict[str, int] = Counter()
+    unmatched: Dict[str, int] = Counter()
+    rewritable = 0
+    day_only = 0
+    for path, matches, _ in results:
+        for line_no, text, kind, token, distance, replacement, day_only_match in matches:
+            if token is None:
+                unmatched[text] += 1
+                continue
+            by_token[token] += 1
+            rewritable += replacement is not None
+            day_only += day_only_match
+            if list_matches:
+                if replacement:
+                    action = f" -> {replacement}"
+                elif day_only_match:
+                    action = f" (day only, night {argb_to_hex(tokens[token][1])}; report only)"
+                else:
+                    action = " (report only)"
+                print(f"  {os.path.relpath(path, root)}:{line_no}: {text} ~ {token} "
+                      f"(ΔE {distance:.1f}){action}")
+
+    total = sum(by_token.values())
+    print(f"Matched {total} color literals to {len(by_token)} tokens ({rewritable} rewritable, "
+          f"{day_only} day-only matches not rewritten), "
+          f"{sum(unmatched.values())} without a token within threshold")
+    for token, count in by_token.most_common():
+        day_argb, night_argb = tokens[token]
+        print(f"  - {token} ({argb_to_hex(day_argb)} / {argb_to_hex(night_argb)}): {count}")
+    if unmatched:
+        print("Literals without a token:")
+        for text, count in unmatched.most_common(20):
+            print(f"  - {text}: {count}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Map hard-coded color literals in an Android project '
+                                                 'to the nearest semantic color token')
+    parser.add_argument('root', help='Root directory of the Android project to scan')
+    parser.add_argument('--res-dir', default='.',
+                        help='Directory containing the generated values/ and values-night/ (default: .)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Maximum ΔE_OK (x100) between a literal and its token (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--xml-style', choices=['color', 'attr'], default='color',
+                        help='Rewrite XML attributes to @color/name or theme-aware ?attr/name (default: color)')
+    parser.add_argument('--write', action='store_true',
+                        help='Rewrite matched literals in place (default: report only)')
+    parser.add_argument('--jobs', type=int,
+                        help='Number of worker processes (default: CPU count, 1 = sequential)')
+    parser.add_argument('--list', action='store_true', help='List every match with file and line')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    try:
+        with tracer.span('load', module='semantic colors'):
+            tokens = load_token_colors(args.res_dir)
+    except FileNotFoundError as e:
+        print(f"Error: Color file not found: {e}")
+        return
+    if not os.path.isdir(args.root):
+        print(f"Error: Directory not found: {args.root}")
+        return
+
+    start = time.perf_counter()
+    paths = collect_source_files(args.root)
+    with tracer.span('scan', files=len(paths)):
+        results = scan_tree(paths, tokens, args.threshold, args.xml_style, args.write, args.jobs)
+    print(f"Scanned {len(paths)} files against {len(tokens)} tokens in {time.perf_counter() - start:.2f}s")
+
+    print_report(results, tokens, args.root, args.list)
+    if args.write:
+        rewritten = [(path, count) for path, _, count in results if count]
+        print(f"Rewrote {sum(count for _, count in rewritten)} literals in {len(rewritten)} files")
+
+    finish_from_args(args)
+
+
+if __name__ == '__main__':
+    main()
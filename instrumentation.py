@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+流水线埋点：阶段耗时（span）、计数器和分级日志。
+默认关闭，关闭时 span() 返回共享的空上下文、计数直接返回，几乎没有开销；
+开启后可导出 Chrome trace-event JSON（chrome://tracing 或 Perfetto 打开）。
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+# 常用计数器名称
+NODES_VISITED = 'nodes_visited'
+LOOKUPS = 'lookups'
+CACHE_HITS = 'cache_hits'
+BYTES_WRITTEN = 'bytes_written'
+
+
+class _NullSpan:
+    """关闭埋点时使用的空上下文"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """一次计时区间，退出时记录为Chrome trace的完整事件（ph=X）"""
+
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        self.tracer._record(self.name, self.start, end, self.args)
+        return False
+
+
+class Tracer:
+    """收集span和计数器"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def reset(self) -> None:
+        self.events.clear()
+        self.counters.clear()
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name: str, **args):
+        """返回计时上下文，用法: with tracer.span('load', file=path): ..."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def count(self, name: str, value: int = 1) -> None:
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += value
+
+    def count_written(self, content: str) -> None:
+        """按UTF-8字节数累计写出的数据量"""
+        if self.enabled:
+            size = len(content.encode('utf-8'))
+            with self._lock:
+                self.counters[BYTES_WRITTEN] += size
+
+    def _record(self, name: str, start: int, end: int, args: Dict[str, Any]) -> None:
+        event = {
+            'name': name,
+            'cat': 'pipeline',
+            'ph': 'X',
+            'ts': (start - self._origin) / 1000.0,
+            'dur': (end - start) / 1000.0,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if args:
+            event['args'] = {k: str(v) for k, v in args.items()}
+        with self._lock:
+            self.events.append(event)
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        """导出Chrome trace-event JSON，计数器作为结束时刻的计数事件（ph=C）"""
+        events = list(self.events)
+        end_ts = max((e['ts'] + e['dur'] for e in events), default=0.0)
+        if self.counters:
+            events.append({
+                'name': 'counters',
+                'ph': 'C',
+                'ts': end_ts,
+                'pid': os.getpid(),
+                'args': dict(self.counters),
+            })
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def summary(self) -> str:
+        """按span名称汇总耗时和计数器"""
+        totals: Dict[str, float] = defaultdict(float)
+        for event in self.events:
+            totals[event['name']] += event['dur']
+        lines = [f"  {name:<24} {dur / 1000.0:10.2f} ms" for name, dur in totals.items()]
+        lines += [f"  {name:<24} {value:>10,}" for name, value in sorted(self.counters.items())]
+        return '\n'.join(lines)
+
+
+# 进程内共享的tracer
+tracer = Tracer()
+
+
+def configure_logging(verbosity: int = 0) -> None:
+    """配置分级日志：0=WARNING以上（默认），1=INFO，2及以上=DEBUG（逐节点输出）"""
+    level = logging.WARNING
+    if verbosity == 1:
+        level = logging.INFO
+    elif verbosity >= 2:
+        level = logging.DEBUG
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stdout)
+
+
+def add_arguments(parser) -> None:
+    """为命令行添加 --trace 和 -v 参数"""
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Write a Chrome trace-event JSON file with per-stage spans and counters')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Increase log verbosity (-v: info, -vv: per-node debug output)')
+
+
+def setup_from_args(args) -> None:
+    """根据命令行参数开启日志和埋点"""
+    configure_logging(args.verbose)
+    if args.trace:
+        tracer.enable()
+
+
+def finish_from_args(args) -> None:
+    """导出trace并打印汇总"""
+    if args.trace and tracer.enabled:
+        tracer.export_chrome_trace(args.trace)
+        print(f"\nTrace written to {args.trace}")
+        print(tracer.summary())
@@ -0,0 +1,73 @@
+package com.example.design.tokens
+
+// Generated by breakpoints.py from the grid, "4. widths" and "5. containers" tokens. Do not edit by hand.
+
+enum class WindowSizeClass(val minWidthDp: Int) {
+    COMPACT(0),
+    MEDIUM(600),
+    EXPANDED(840);
+
+    companion object {
+        fun fromWidth(widthDp: Int): WindowSizeClass = when {
+            widthDp >= 840 -> EXPANDED
+            widthDp >= 600 -> MEDIUM
+            else -> COMPACT
+        }
+    }
+}
+
+/** Grid metrics for widths from [minWidthDp] up to the next breakpoint, computed at [minWidthDp]. */
+class GridSpec(
+    val minWidthDp: Int,
+    val sizeClass: WindowSizeClass,
+    val columns: Int,
+    val gutterDp: Float,
+    val marginDp: Float,
+    val contentWidthDp: Float,
+    val columnWidthDp: Float
+) {
+    /** Width of a cell spanning [span] columns, including the gutters between them. */
+    fun spanWidthDp(span: Int): Float = columnWidthDp * span + gutterDp * (span - 1)
+}
+
+object AppBreakpoints {
+    const val WIDTH_XXS = 320
+    const val WIDTH_XS = 384
+    const val WIDTH_SM = 480
+    const val WIDTH_MD = 560
+    const val WIDTH_LG = 640
+    const val PARAGRAPH_MAX_WIDTH = 720
+    const val WIDTH_XL = 768
+    const val WIDTH_2XL = 1024
+    const val WIDTH_3XL = 1280
+    const val WIDTH_4XL = 1440
+    const val WIDTH_5XL = 1600
+    const val WIDTH_6XL = 1920
+    const val CONTAINER_MAX_WIDTH_DESKTOP = 1280
+    const val CONTAINER_PADDING_DESKTOP = 32
+    const val CONTAINER_PADDING_MOBILE = 16
+
+    private val MIN_WIDTHS = intArrayOf(0, 384, 480, 560, 600, 640, 768, 840, 1024, 1280, 1440, 1600, 1920)
+
+    val GRIDS = arrayOf(
+        GridSpec(0, WindowSizeClass.COMPACT, 4, 16.0f, 16.0f, 288.0f, 60.0f),
+        GridSpec(384, WindowSizeClass.COMPACT, 4, 16.0f, 16.0f, 352.0f, 76.0f),
+        GridSpec(480, WindowSizeClass.COMPACT, 4, 16.0f, 16.0f, 448.0f, 100.0f),
+        GridSpec(560, WindowSizeClass.COMPACT, 4, 16.0f, 16.0f, 528.0f, 120.0f),
+        GridSpec(600, WindowSizeClass.MEDIUM, 6, 32.0f, 32.0f, 536.0f, 62.66f),
+        GridSpec(640, WindowSizeClass.MEDIUM, 6, 32.0f, 32.0f, 576.0f, 69.33f),
+        GridSpec(768, WindowSizeClass.MEDIUM, 6, 32.0f, 32.0f, 704.0f, 90.66f),
+        GridSpec(840, WindowSizeClass.EXPANDED, 12, 32.0f, 32.0f, 776.0f, 35.33f),
+        GridSpec(1024, WindowSizeClass.EXPANDED, 12, 32.0f, 32.0f, 960.0f, 50.66f),
+        GridSpec(1280, WindowSizeClass.EXPANDED, 12, 32.0f, 32.0f, 1216.0f, 72.0f),
+        GridSpec(1440, WindowSizeClass.EXPANDED, 12, 32.0f, 112.0f, 1216.0f, 72.0f),
+        GridSpec(1600, WindowSizeClass.EXPANDED, 12, 32.0f, 192.0f, 1216.0f, 72.0f),
+        GridSpec(1920, WindowSizeClass.EXPANDED, 12, 32.0f, 352.0f, 1216.0f, 72.0f),
+    )
+
+    /** Grid for the given window width, matching the values-w<N>dp grid_dimens resources. */
+    fun gridFor(widthDp: Int): GridSpec {
+        val index = MIN_WIDTHS.binarySearch(widthDp)
+        return GRIDS[if (index >= 0) index else maxOf(-index - 2, 0)]
+    }
+}
@@ -1,5 +1,7 @@
 package com.example.design.tokens
 
+// Generated by tokens.py from the "2. radius" tokens. Do not edit by hand.
+
 enum class AppRadius(
     val value: Int,
     val dimenRes: Int
@@ -16,14 +18,47 @@ enum class AppRadius(
     FOUR_XL(24, R.dimen.radius_4xl),
     FIVE_XL(28, R.dimen.radius_5xl),
     FULL(9999, R.dimen.radius_full);
-    
+
+    /** Radius in dp as a float, so drawing code does not convert on every frame. */
+    val dp: Float = value.toFloat()
+
+    /** Radius in px for the given display density. */
+    fun toPx(density: Float): Float = pxTable(density)[ordinal]
+
     companion object {
+        private val ENTRIES = values()
+
+        // Sorted distinct radius values and the entry index for each one
+        private val VALUE_KEYS = intArrayOf(0, 2, 4, 6, 8, 10, 12, 16, 20, 24, 28, 9999)
+        private val VALUE_INDEXES = intArrayOf(0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+
+        // R.dimen ids are only known at runtime, so this map is built once on first use
+        private val BY_DIMEN_RES: Map<Int, AppRadius> by lazy {
+            HashMap<Int, AppRadius>(ENTRIES.size * 2).apply { ENTRIES.forEach { put(it.dimenRes, it) } }
+        }
+
+        // Density and its table are published together, so a reader never pairs one density with
+        // another density's table
+        private class PxTable(val density: Float, val px: FloatArray)
+
+        @Volatile private var pxCache: PxTable? = null
+
+        /** Pixel radii indexed by ordinal, cached for the last density seen. Do not modify. */
+        fun pxTable(density: Float): FloatArray {
+            val cached = pxCache
+            if (cached != null && cached.density == density) return cached.px
+            val table = PxTable(density, FloatArray(ENTRIES.size) { ENTRIES[it].value * density })
+            pxCache = table
+            return table.px
+        }
+
         fun fromValue(value: Int): AppRadius {
-            return entries.find { it.value == value } ?: MD
+            val index = VALUE_KEYS.binarySearch(value)
+            return if (index >= 0) ENTRIES[VALUE_INDEXES[index]] else MD
         }
-        
+
         fun fromDimenRes(res: Int): AppRadius {
-            return entries.find { it.dimenRes == res } ?: MD
+            return BY_DIMEN_RES[res] ?: MD
         }
     }
-}
\ No newline at end of file
+}
@@ -24,7 +24,7 @@ class RadiusView @JvmOverloads constructor(
     }
     
     private var currentRadius: AppRadius = AppRadius.MD
-    private var animatedRadius: Float = currentRadius.value.toFloat()
+    private var animatedRadius: Float = currentRadius.px()
     private var isFullMode: Boolean = false
     private var animatedFullMode: Float = 0f
     private var transitionProgress: Float = 0f
@@ -69,6 +69,9 @@ class RadiusView @JvmOverloads constructor(
         canvas.drawPath(path, paint)
     }
     
+    /** Canvas works in pixels; radius tokens are in dp. */
+    private fun AppRadius.px(): Float = toPx(resources.displayMetrics.density)
+    
     fun setRadius(radius: AppRadius) {
         setRadius(radius, defaultDuration)
     }
@@ -88,7 +91,7 @@ class RadiusView @JvmOverloads constructor(
                 animateFullModeTransition(oldIsFullMode, isFullMode, oldRadius, radius, duration)
             }
             else -> {
-                animateRadiusChange(oldRadius.value.toFloat(), radius.value.toFloat(), duration)
+                animateRadiusChange(oldRadius.px(), radius.px(), duration)
             }
         }
     }
@@ -118,7 +121,7 @@ class RadiusView @JvmOverloads constructor(
         val height = height.toFloat()
         
         if (width <= 0 || height <= 0) {
-            animatedRadius = newRadius.value.toFloat()
+            animatedRadius = newRadius.px()
             animatedFullMode = if (toFullMode) 1f else 0f
             invalidate()
             return
@@ -134,9 +137,9 @@ class RadiusView @JvmOverloads constructor(
                 animatedFullMode = animation.animatedValue as Float
                 
                 if (toFullMode) {
-                    animatedRadius = oldRadius.value.toFloat() + (maxRadius - oldRadius.value.toFloat()) * animatedFullMode
+                    animatedRadius = oldRadius.px() + (maxRadius - oldRadius.px()) * animatedFullMode
                 } else {
-                    animatedRadius = maxRadius + (newRadius.value.toFloat() - maxRadius) * (1f - animatedFullMode)
+                    animatedRadius = maxRadius + (newRadius.px() - maxRadius) * (1f - animatedFullMode)
                 }
                 
                 invalidate()
@@ -146,7 +149,7 @@ class RadiusView @JvmOverloads constructor(
                 override fun onAnimationEnd(animation: Animator) {
                     radiusAnimator = null
                     if (!toFullMode) {
-                        animatedRadius = newRadius.value.toFloat()
+                        animatedRadius = newRadius.px()
                         animatedFullMode = 0f
                     }
                 }
@@ -160,7 +163,7 @@ class RadiusView @JvmOverloads constructor(
         if (currentRadius != radius) {
             currentRadius = radius
             isFullMode = radius == AppRadius.FULL
-            animatedRadius = radius.value.toFloat()
+            animatedRadius = radius.px()
             animatedFullMode = if (isFullMode) 1f else 0f
             invalidate()
         }
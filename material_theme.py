@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Material 3 颜色角色桥接：将语义颜色映射到 Material 3 的颜色角色（colorPrimary、colorSurface、
+colorOnSurface 等），生成继承 Theme.Material3 的应用主题和可叠加在动态颜色之上的 ThemeOverlay，
+以及 语义令牌 <-> 颜色角色 的对照表。
+角色直接引用 @color/语义颜色，日夜间由 values/values-night 资源限定符切换，控件通过平台主题解析颜色，
+不需要额外的自定义 ?attr/ 属性层。
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from color_utils import ColorTable, compute_contrast, find_contrast_failures, WCAG_AA_TEXT, WCAG_AA_NON_TEXT
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from theme import load_colors_from_xml
+from token_snapshot import load_color_maps
+
+DEFAULT_THEME_NAME = "AUIApp"
+DEFAULT_PARENT_THEME = "Theme.Material3.DayNight.NoActionBar"
+
+# Material 3 颜色角色 -> 候选语义颜色（按顺序取第一个存在的；on-角色组合见 select_passing_pairs）
+MATERIAL3_ROLES: List[Tuple[str, Tuple[str, ...]]] = [
+    ('colorPrimary', ('bg_brand_solid', 'fg_brand_primary')),
+    ('colorOnPrimary', ('text_white', 'text_primary_on_brand')),
+    ('colorPrimaryContainer', ('bg_brand_secondary', 'bg_brand_primary')),
+    ('colorOnPrimaryContainer', ('text_brand_primary', 'text_brand_secondary')),
+    ('colorPrimaryInverse', ('fg_brand_primary_alt', 'fg_brand_secondary')),
+    ('colorSecondary', ('bg_brand_solid_hover', 'fg_brand_secondary', 'text_brand_secondary')),
+    ('colorOnSecondary', ('text_white', 'text_primary_on_brand')),
+    ('colorSecondaryContainer', ('bg_brand_primary', 'bg_brand_section_subtle')),
+    ('colorOnSecondaryContainer', ('text_brand_secondary', 'text_brand_primary')),
+    ('colorError', ('bg_error_solid', 'fg_error_primary')),
+    ('colorOnError', ('text_white',)),
+    ('colorErrorContainer', ('bg_error_primary', 'bg_error_secondary')),
+    ('colorOnErrorContainer', ('text_error_primary', 'text_error_primary_hover')),
+    ('android:colorBackground', ('bg_primary',)),
+    ('colorOnBackground', ('text_primary',)),
+    ('colorSurface', ('bg_primary',)),
+    ('colorOnSurface', ('text_primary',)),
+    ('colorSurfaceVariant', ('bg_secondary',)),
+    ('colorOnSurfaceVariant', ('text_secondary', 'text_tertiary')),
+    ('colorSurfaceContainerLowest', ('bg_primary',)),
+    ('colorSurfaceContainerLow', ('bg_secondary_subtle', 'bg_primary_alt')),
+    ('colorSurfaceContainer', ('bg_secondary',)),
+    ('colorSurfaceContainerHigh', ('bg_tertiary',)),
+    ('colorSurfaceContainerHighest', ('bg_quaternary',)),
+    ('colorSurfaceInverse', ('bg_primary_solid',)),
+    ('colorOnSurfaceInverse', ('text_white', 'text_primary_on_brand')),
+    ('colorOutline', ('border_primary', 'fg_quaternary_500', 'fg_tertiary')),
+    ('colorOutlineVariant', ('border_secondary',)),
+]
+
+# (前景角色, 背景角色, 阈值)：on-角色都是文字和图标的颜色
+ROLE_CONTRAST_PAIRS: List[Tuple[str, str, float]] = [
+    ('colorOnPrimary', 'colorPrimary', WCAG_AA_TEXT),
+    ('colorOnPrimaryContainer', 'colorPrimaryContainer', WCAG_AA_TEXT),
+    ('colorOnSecondary', 'colorSecondary', WCAG_AA_TEXT),
+    ('colorOnSecondaryContainer', 'colorSecondaryContainer', WCAG_AA_TEXT),
+    ('colorOnError', 'colorError', WCAG_AA_TEXT),
+    ('colorOnErrorContainer', 'colorErrorContainer', WCAG_AA_TEXT),
+    ('colorOnBackground', 'android:colorBackground', WCAG_AA_TEXT),
+    ('colorOnSurface', 'colorSurface', WCAG_AA_TEXT),
+    ('colorOnSurfaceVariant', 'colorSurfaceVariant', WCAG_AA_TEXT),
+    ('colorOnSurfaceInverse', 'colorSurfaceInverse', WCAG_AA_TEXT),
+    ('colorOutline', 'colorSurface', WCAG_AA_NON_TEXT),
+]
+
+
+def select_passing_pairs(roles: Dict[str, str], available: set, fixed: set, table: ColorTable) -> None:
+    """按 ROLE_CONTRAST_PAIRS 的顺序，为每组 on-角色/背景角色 选择在所有模式下都达到 WCAG AA 的候选组合
+
+    背景候选在外层、前景候选在内层，取第一个通过的组合；已被覆盖或被前面的组合确定的角色不再改变。
+    没有通过的组合时保留按顺序选出的候选，由 check_role_contrast 报告。
+    """
+    candidates = dict(MATERIAL3_ROLES)
+    for fg, bg, threshold in ROLE_CONTRAST_PAIRS:
+        if fg not in roles or bg not in roles:
+            continue
+        options = {role: [roles[role]] if role in fixed else
+                   [name for name in candidates.get(role, ()) if name in available] or [roles[role]]
+                   for role in (fg, bg)}
+        combos = [(fg_token, bg_token, threshold) for bg_token in options[bg] for fg_token in options[fg]]
+        worst: Dict[Tuple[str, str], float] = {}
+        for _, fg_token, bg_token, ratio, _ in compute_contrast(table, combos):
+            worst[(fg_token, bg_token)] = min(ratio, worst.get((fg_token, bg_token), ratio))
+        passing = next(((fg_token, bg_token) for fg_token, bg_token, _ in combos
+                        if worst.get((fg_token, bg_token), 0.0) >= threshold), None)
+        if passing is not None:
+            roles[fg], roles[bg] = passing
+        fixed.update((fg, bg))
+
+
+def map_roles(color_names: List[str], overrides: Optional[Dict[str, str]] = None,
+              table: Optional[ColorTable] = None) -> Dict[str, str]:
+    """为每个颜色角色选择语义颜色，没有候选存在的角色保留父主题的默认值
+
+    Args:
+        color_names: 可用的语义颜色名称
+        overrides: 角色 -> 语义颜色，优先于内置候选
+        table: 日夜间颜色表；提供时 on-角色组合优先选择对比度达标的候选
+
+    Returns:
+        角色 -> 语义颜色（保持 MATERIAL3_ROLES 的顺序）
+    """
+    available = set(color_names)
+    overrides = overrides or {}
+    roles: Dict[str, str] = {}
+    for role, candidates in MATERIAL3_ROLES:
+        token = overrides.get(role)
+        if token is None:
+            token = next((name for name in candidates if name in available), None)
+        elif token not in available:
+            print(f"Warning: '{token}' mapped to {role} is not a semantic color")
+            continue
+        if token is not None:
+            roles[role] = token
+    for role, token in overrides.items():
+        if role not in roles and token in available:
+            roles[role] = token
+    if table is not None:
+        select_passing_pairs(roles, available, {role for role in overrides if role in roles}, table)
+    return roles
+
+
+def build_token_index(roles: Dict[str, str]) -> Dict[str, List[str]]:
+    """反向对照表：语义颜色 -> 使用它的颜色角色"""
+    index: Dict[str, List[str]] = {}
+    for role, token in roles.items():
+        index.setdefault(token, []).append(role)
+    return dict(sorted(index.items()))
+
+
+def build_color_table(light_colors: Dict[str, str], dark_colors: Dict[str, str],
+                      light_primitive_colors: Dict[str, str], dark_primitive_colors: Dict[str, str]) -> ColorTable:
+    return ColorTable.from_modes(
+        {'light mode': light_colors, 'dark mode': dark_colors},
+        {'light mode': light_primitive_colors, 'dark mode': dark_primitive_colors}
+    )
+
+
+def check_role_contrast(roles: Dict[str, str], table: ColorTable) -> List[Tuple[str, str, str, float, float]]:
+    """检查 on-角色 与对应背景角色在日夜间模式下的对比度"""
+    # 多个角色对可能映射到同一组颜色（如 colorOnSurface/colorSurface 与 colorOnBackground），只计算一次
+    pair_roles: Dict[Tuple[str, str, float], List[str]] = {}
+    for fg, bg, threshold in ROLE_CONTRAST_PAIRS:
+        if fg in roles and bg in roles:
+            pair_roles.setdefault((roles[fg], roles[bg], threshold), []).append(f"{fg} on {bg}")
+    failures = find_contrast_failures(compute_contrast(table, list(pair_roles)))
+
+    print(f"Role contrast check: {len(pair_roles)} pairs, {len(failures)} below WCAG AA")
+    for mode, fg, bg, ratio, threshold in failures:
+        labels = ', '.join(pair_roles[(fg, bg, threshold)])
+        print(f"  - FAIL [{mode}] {labels} ({fg} on {bg}): {ratio:.2f} < {threshold}")
+    if failures:
+        print(f"Warning: {len(failures)} Material 3 role pairs below WCAG AA; map them with --role ROLE=TOKEN "
+              f"or add semantic colors that pass")
+    return failures
+
+
+def generate_material_theme_xml(roles: Dict[str, str], output_path: str,
+                                theme_name: str = DEFAULT_THEME_NAME,
+                                parent_theme: str = DEFAULT_PARENT_THEME) -> None:
+    """生成 Material 3 应用主题和颜色角色 ThemeOverlay
+
+    ThemeOverlay 可传给 DynamicColorsOptions.Builder().setThemeOverlay()，
+    在系统动态颜色之上恢复品牌角色；也可以通过 android:theme 作用于局部视图。
+    """
+    items = ''.join(f'        <item name="{role}">@color/{token}</item>\n' for role, token in roles.items())
+
+    xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
+    xml_content += '<resources>\n'
+    xml_content += f'    <!-- Theme.{theme_name}.Material3 - Material 3 color roles from semantic colors -->\n'
+    xml_content += f'    <style name="Theme.{theme_name}.Material3" parent="{parent_theme}">\n'
+    xml_content += items
+    xml_content += '    </style>\n\n'
+    xml_content += f'    <!-- ThemeOverlay.{theme_name}.Material3 - the same roles as an overlay -->\n'
+    xml_content += f'    <style name="ThemeOverlay.{theme_name}.Material3" parent="">\n'
+    xml_content += items
+    xml_content += '    </style>\n'
+    xml_content += '</resources>\n'
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(xml_content)
+    tracer.count_written(xml_content)
+
+    print(f"Generated: {output_path} ({len(roles)} roles)")
+
+
+def generate_role_table(roles: Dict[str, str], light_colors: Dict[str, str], dark_colors: Dict[str, str],
+                        readme_path: str, json_path: Optional[str] = None) -> None:
+    """生成 颜色角色 <-> 语义颜色 对照表（Markdown，可选JSON）"""
+    token_index = build_token_index(roles)
+
+    lines = ["# Material 3 Color Roles", "",
+             "Semantic colors mapped onto Material 3 color roles. Prefer `?attr/<role>` (or "
+             "`MaterialTheme.colorScheme` in Compose) over `?attr/<semanticColor>`.", "",
+             "## Role -> token", "",
+             "| Role | Semantic color | Light | Dark |",
+             "|------|----------------|-------|------|"]
+    for role, token in roles.items():
+        lines.append(f"| `{role}` | `{token}` | `{light_colors.get(token, '')}` | `{dark_colors.get(token, '')}` |")
+
+    lines += ["", "## Token -> role", "",
+              "| Semantic color | Theme attribute |",
+              "|----------------|-----------------|"]
+    for token, token_roles in token_index.items():
+        lines.append(f"| `{token}` | {', '.join(f'`?attr/{role}`' for role in token_roles)} |")
+
+    with open(readme_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    print(f"Generated: {readme_path}")
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'roles': roles, 'tokens': token_index}, f, ensure_ascii=False, indent=2)
+        print(f"Generated: {json_path}")
+
+
+def generate_material3_files(light_colors: Dict[str, str], dark_colors: Dict[str, str],
+                             light_primitive_colors: Dict[str, str], dark_primitive_colors: Dict[str, str],
+                             output_path: str, readme_path: str, json_path: Optional[str] = None,
+                             theme_name: str = DEFAULT_THEME_NAME, parent_theme: str = DEFAULT_PARENT_THEME,
+                             overrides: Optional[Dict[str, str]] = None) -> List[Tuple[str, str, str, float, float]]:
+    """映射颜色角色，写出主题XML和对照表并检查角色对比度；本脚本和 tokens.py --target material3 共用
+
+    Returns:
+        对比度不足的组合
+    """
+    with tracer.span('resolve', module='material3 roles'):
+        table = build_color_table(light_colors, dark_colors, light_primitive_colors, dark_primitive_colors)
+        roles = map_roles(list(light_colors.keys()), overrides, table)
+    unmapped = [role for role, _ in MATERIAL3_ROLES if role not in roles]
+    print(f"\nMapped {len(roles)} Material 3 roles")
+    if unmapped:
+        print(f"Inherited from {parent_theme}: {', '.join(unmapped)}")
+
+    with tracer.span('emit', file=output_path):
+        generate_material_theme_xml(roles, output_path, theme_name, parent_theme)
+        generate_role_table(roles, light_colors, dark_colors, readme_path, json_path)
+
+    with tracer.span('check_contrast'):
+        return check_role_contrast(roles, table)
+
+
+def parse_role_overrides(specs: List[str]) -> Dict[str, str]:
+    """解析 '角色=语义颜色' 形式的命令行参数"""
+    overrides = {}
+    for spec in specs:
+        role, sep, token = spec.partition('=')
+        if not sep or not role.strip() or not token.strip():
+            raise ValueError(f"Invalid role mapping '{spec}', expected ROLE=TOKEN")
+        overrides[role.strip()] = token.strip()
+    return overrides
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Map semantic colors onto Material 3 color roles')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='Read colors from a token snapshot written by tokens.py --snapshot instead of the XML files')
+    parser.add_argument('--theme-name', default=DEFAULT_THEME_NAME,
+                        help=f'Theme name; generates Theme.<name>.Material3 and ThemeOverlay.<name>.Material3 '
+                             f'(default: {DEFAULT_THEME_NAME})')
+    parser.add_argument('--parent', default=DEFAULT_PARENT_THEME,
+                        help=f'Parent of the app theme (default: {DEFAULT_PARENT_THEME})')
+    parser.add_argument('--role', action='append', default=[], metavar='ROLE=TOKEN',
+                        help='Map a role to a semantic color, e.g. colorTertiary=fg_success_primary; repeatable')
+    parser.add_argument('--output', default='values/themes_material3.xml',
+                        help='Theme XML file (default: values/themes_material3.xml)')
+    parser.add_argument('--readme', default='material3_readme.md',
+                        help='Role table (default: material3_readme.md)')
+    parser.add_argument('--json', metavar='FILE', help='Also write the role table as JSON')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    try:
+        overrides = parse_role_overrides(args.role)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    if args.snapshot:
+        print(f"Loading colors from snapshot {args.snapshot}...")
+        try:
+            with tracer.span('load', file=args.snapshot):
+                colors = load_color_maps(args.snapshot)
+        except (OSError, ValueError) as e:
+            # 快照不存在、格式无效或已过期（JSON已更新）时拒绝使用
+            print(f"Error: {e}")
+            return
+    else:
+        colors = load_colors_from_xml("values/semantic_color.xml", "values-night/semantic_color.xml",
+                                      "values/primitive_color.xml", "values-night/primitive_color.xml")
+    if colors is None:
+        return
+    light_colors, dark_colors, light_primitive_colors, dark_primitive_colors = colors
+
+    failures = generate_material3_files(light_colors, dark_colors, light_primitive_colors, dark_primitive_colors,
+                                        args.output, args.readme, args.json, args.theme_name, args.parent,
+                                        overrides)
+
+    finish_from_args(args)
+    # 角色对比度不达标时以非零状态退出，CI 可以据此拦截
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+资源名注册表：持久化 令牌身份 -> Android资源名 的映射，使资源名不随 Figma 导出中的节点顺序变化。
+
+令牌身份为去掉模式节点后的路径加上 Figma 的 styleId / variableId，日夜间同一令牌身份相同。
+已登记的令牌沿用原来的名称；新令牌按确定的顺序分配：不带括号数字的令牌优先取基础名称，
+其余依次尝试 基础名称、基础名称_括号数字、基础名称_2、基础名称_3…，同优先级按身份排序。
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_REGISTRY_FILE = "token_names.json"
+REGISTRY_VERSION = 1
+
+FIGMA_EXTENSION = 'org.lukasoppermann.figmaDesignTokens'
+
+
+def token_identity(path: List[str], node: Dict) -> str:
+    """令牌身份：路径 + styleId/variableId（没有时只用路径）"""
+    extension = node.get('extensions', {}).get(FIGMA_EXTENSION, {})
+    figma_id = (extension.get('styleId') or extension.get('variableId') or '').rstrip(',')
+    identity = '.'.join(path)
+    return f"{identity}@{figma_id}" if figma_id else identity
+
+
+class NameRegistry:
+    """令牌身份 -> 资源名 的持久化映射"""
+
+    def __init__(self, file_path: Optional[str] = None):
+        self.file_path = file_path
+        self.names: Dict[str, str] = {}
+        self.renamed: List[Tuple[str, str, str]] = []
+        if file_path and os.path.exists(file_path):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = json.load(f)
+            if content.get('version') == REGISTRY_VERSION:
+                self.names = dict(content.get('names', {}))
+            else:
+                print(f"Warning: ignoring name registry {file_path} with unknown version")
+
+    def assign(self, candidates: Dict[str, List[str]]) -> Dict[str, str]:
+        """为一组令牌分配资源名
+
+        Args:
+            candidates: 身份 -> 候选名称（第一个为基础名称，带括号数字时第二个为 基础名称_数字）
+
+        Returns:
+            身份 -> 资源名；未出现在 candidates 中的旧登记会被移除
+        """
+        assigned: Dict[str, str] = {}
+        taken = set()
+
+        # 沿用登记过且仍然有效的名称
+        for identity in sorted(candidates):
+            previous = self.names.get(identity)
+            base = candidates[identity][0]
+            if previous and previous not in taken and (previous == base or previous.startswith(base + '_')):
+                assigned[identity] = previous
+                taken.add(previous)
+
+        # 新令牌：候选少的（不带括号数字）优先，同优先级按身份排序
+        pending = sorted((identity for identity in candidates if identity not in assigned),
+                         key=lambda identity: (len(candidates[identity]), identity))
+        for identity in pending:
+            names = candidates[identity]
+            name = next((name for name in names if name not in taken), None)
+            counter = 2
+            while name is None:
+                if f"{names[0]}_{counter}" not in taken:
+                    name = f"{names[0]}_{counter}"
+                counter += 1
+            assigned[identity] = name
+            taken.add(name)
+
+        self.renamed = [(identity, self.names[identity], name) for identity, name in assigned.items()
+                        if identity in self.names and self.names[identity] != name]
+        self.names = assigned
+        return assigned
+
+    def save(self) -> bool:
+        """写回注册表文件，内容未变化时不写，返回是否写入"""
+        if not self.file_path:
+            return False
+        content = json.dumps({'version': REGISTRY_VERSION, 'names': dict(sorted(self.names.items()))},
+                             ensure_ascii=False, indent=2) + '\n'
+        if os.path.exists(self.file_path):
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return False
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f"Updated name registry: {self.file_path} ({len(self.names)} names)")
+        return True
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+原子颜色近似重复分析：在OKLab感知颜色空间中查找色差小于阈值的原子颜色，
+输出合并报告，并可选地删除重复颜色、将语义颜色的引用改写为保留的颜色
+
+合并时同时写出合并映射（被合并颜色 -> 保留颜色），tokens.py 在生成前应用该映射，
+重新生成资源后合并结果依然有效。
+"""
+
+import argparse
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from color_utils import argb_to_oklab, delta_e_ok, parse_hex_color
+from theme import parse_color_xml
+from token_model import ColorToken
+
+Lab = Tuple[float, float, float]
+
+# 默认色差阈值（ΔE_OK×100），1个RGB单位的差异约为0.3~0.5
+DEFAULT_THRESHOLD = 1.0
+
+DEFAULT_MERGE_MAP_FILE = "primitive_merges.json"
+MERGE_MAP_VERSION = 1
+
+
+class LabGridIndex:
+    """OKLab空间的均匀网格索引
+
+    网格边长等于查询半径，因此一次半径查询只需检查相邻的 3×3×3 个格子，
+    避免对整个调色板两两比较。
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size / 100.0  # ΔE_OK按100倍缩放
+        self.cells: Dict[Tuple[int, int, int], List[str]] = defaultdict(list)
+
+    def _cell(self, lab: Lab) -> Tuple[int, int, int]:
+        size = self.cell_size
+        return (int(lab[0] // size), int(lab[1] // size), int(lab[2] // size))
+
+    def insert(self, name: str, lab: Lab) -> None:
+        self.cells[self._cell(lab)].append(name)
+
+    def neighbors(self, lab: Lab) -> List[str]:
+        """返回相邻格子中的所有候选名称（调用方需再做精确距离判断）"""
+        cx, cy, cz = self._cell(lab)
+        result = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    result.extend(self.cells.get((cx + dx, cy + dy, cz + dz), ()))
+        return result
+
+
+def ramp_name(name: str) -> str:
+    """返回颜色所属色阶名称，如 gray_blue_500 -> gray_blue"""
+    prefix, _, suffix = name.rpartition('_')
+    return prefix if suffix.isdigit() else name
+
+
+def count_references(semantic_colors: List[Dict[str, str]]) -> Dict[str, int]:
+    """统计每个原子颜色被语义颜色引用的次数"""
+    counts: Dict[str, int] = defaultdict(int)
+    for colors in semantic_colors:
+        for value in colors.values():
+            if value.startswith('@color/'):
+                counts[value[7:]] += 1
+    return counts
+
+
+def find_near_duplicates(light_primitive: Dict[str, str],
+                         dark_primitive: Dict[str, str],
+                         threshold: float = DEFAULT_THRESHOLD,
+                         ref_counts: Dict[str, int] = None) -> Dict[str, str]:
+    """查找近似重复的原子颜色
+
+    只有在日夜间两种模式下色差都不超过阈值、且透明度相同的颜色才会被合并；
+    同一色阶内的颜色（如 gray_25 与 gray_50）是有意设计的梯度，不参与合并。
+    引用次数多的颜色优先作为保留颜色，同引用次数时按名称排序。
+
+    Returns:
+        被合并颜色名称 -> 保留颜色名称
+    """
+    ref_counts = ref_counts or {}
+
+    # 解析颜色，(alpha, 日间lab, 夜间lab)
+    parsed: Dict[str, Tuple[int, Lab, Lab]] = {}
+    for name, value in light_primitive.items():
+        light_argb = parse_hex_color(value)
+        dark_argb = parse_hex_color(dark_primitive.get(name, value))
+        if light_argb is None or dark_argb is None:
+            continue
+        parsed[name] = (light_argb >> 24, argb_to_oklab(light_argb), argb_to_oklab(dark_argb))
+
+    index = LabGridIndex(threshold)
+    for name, (_, light_lab, _) in parsed.items():
+        index.insert(name, light_lab)
+
+    order = sorted(parsed.keys(), key=lambda n: (-ref_counts.get(n, 0), n))
+    merged: Dict[str, str] = {}
+    survivors = set()
+
+    for name in order:
+        if name in merged:
+            continue
+        survivors.add(name)
+        alpha, light_lab, dark_lab = parsed[name]
+        for candidate in index.neighbors(light_lab):
+            if candidate == name or candidate in merged or candidate in survivors:
+                continue
+            c_alpha, c_light, c_dark = parsed[candidate]
+            if c_alpha != alpha or ramp_name(candidate) == ramp_name(name):
+                continue
+            if (delta_e_ok(light_lab, c_light) <= threshold
+                    and delta_e_ok(dark_lab, c_dark) <= threshold):
+                merged[candidate] = name
+
+    return merged
+
+
+def print_report(merged: Dict[str, str], light_primitive: Dict[str, str],
+                 threshold: float) -> None:
+    """打印合并报告，按保留颜色分组"""
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for name, survivor in merged.items():
+        groups[survivor].append(name)
+
+    print(f"Near-duplicate primitives (ΔE_OK <= {threshold}): "
+          f"{len(merged)} of {len(light_primitive)} in {len(groups)} groups")
+    for survivor in sorted(groups):
+        members = ', '.join(f"{n} {light_primitive[n]}" for n in sorted(groups[survivor]))
+        print(f"  - {survivor} {light_primitive[survivor]} <= {members}")
+
+
+def rewrite_primitive_xml(file_path: str, merged: Dict[str, str]) -> int:
+    """从原子颜色XML中删除被合并的颜色，返回删除数量"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    pattern = re.compile(r'<color name="([^"]+)">')
+    kept = []
+    removed = 0
+    for line in lines:
+        match = pattern.search(line)
+        if match and match.group(1) in merged:
+            removed += 1
+            continue
+        kept.append(line)
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.writelines(kept)
+    return removed
+
+
+def rewrite_semantic_xml(file_path: str, merged: Dict[str, str]) -> int:
+    """将语义颜色XML中对被合并颜色的引用改写为保留颜色，返回改写数量"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        name = match.group(1)
+        if name in merged:
+            count += 1
+            return f">@color/{merged[name]}<"
+        return match.group(0)
+
+    content = re.sub(r'>@color/([a-zA-Z0-9_]+)<', replace, content)
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return count
+
+
+def resolve_merge_chains(merged: Dict[str, str]) -> Dict[str, str]:
+    """将 a -> b、b -> c 展开为 a -> c、b -> c，忽略成环的条目"""
+    resolved = {}
+    for name in merged:
+        survivor, seen = merged[name], {name}
+        while survivor in merged and survivor not in seen:
+            seen.add(survivor)
+            survivor = merged[survivor]
+        if survivor not in seen:
+            resolved[name] = survivor
+    return resolved
+
+
+def load_merge_map(file_path: str) -> Dict[str, str]:
+    """读取合并映射，文件不存在时返回空字典"""
+    if not file_path or not os.path.exists(file_path):
+        return {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+    if content.get('version') != MERGE_MAP_VERSION:
+        print(f"Warning: ignoring merge map {file_path} with unknown version")
+        return {}
+    return resolve_merge_chains(dict(content.get('merged', {})))
+
+
+def save_merge_map(file_path: str, merged: Dict[str, str]) -> int:
+    """将本次合并追加到合并映射文件，返回映射条目数"""
+    combined = resolve_merge_chains({**load_merge_map(file_path), **merged})
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MERGE_MAP_VERSION, 'merged': dict(sorted(combined.items()))},
+                  f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return len(combined)
+
+
+def apply_merge_map(primitives_by_mode: Dict[str, Dict[str, str]],
+                    semantic_by_mode: Dict[str, Dict[str, ColorToken]],
+                    merged: Dict[str, str]) -> Tuple[int, int]:
+    """tokens.py 在生成前调用：删除被合并的原子颜色，并将引用它们的语义颜色改为引用保留颜色
+
+    保留颜色在某个模式下不存在时，该模式下的条目不生效（JSON已变化，映射过期）。
+
+    Returns:
+        (删除的原子颜色数, 改写的语义颜色数)
+    """
+    removed = set()
+    rewritten = 0
+    for mode, colors in primitives_by_mode.items():
+        active = {name: survivor for name, survivor in merged.items() if name in colors and survivor in colors}
+        for name in active:
+            del colors[name]
+        removed.update(active)
+
+        semantic = semantic_by_mode.get(mode, {})
+        for name, token in semantic.items():
+            survivor = active.get(token.alias)
+            if survivor is None or token.value != f"@color/{token.alias}":
+                continue
+            semantic[name] = ColorToken(token.name, token.mode, token.raw, f"@color/{survivor}",
+                                        argb=parse_hex_color(colors[survivor]), alias=survivor,
+                                        comment=token.comment, provenance=token.provenance)
+            rewritten += 1
+    return len(removed), rewritten
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Find and merge near-duplicate primitive colors')
+    parser.add_argument('--res-dir', default='.',
+                        help='Directory containing values/ and values-night/ (default: .)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Maximum ΔE_OK (x100) to treat colors as duplicates (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--merge', action='store_true',
+                        help='Remove duplicates, rewrite semantic references and record the merges in the '
+                             'merge map applied by tokens.py (default: report only)')
+    parser.add_argument('--merge-map', default=DEFAULT_MERGE_MAP_FILE, metavar='FILE',
+                        help=f'Merge map (removed -> survivor) read by tokens.py (default: {DEFAULT_MERGE_MAP_FILE})')
+
+    args = parser.parse_args()
+
+    light_primitive_file = os.path.join(args.res_dir, "values", "primitive_color.xml")
+    dark_primitive_file = os.path.join(args.res_dir, "values-night", "primitive_color.xml")
+    light_semantic_file = os.path.join(args.res_dir, "values", "semantic_color.xml")
+    dark_semantic_file = os.path.join(args.res_dir, "values-night", "semantic_color.xml")
+
+    for path in (light_primitive_file, dark_primitive_file, light_semantic_file, dark_semantic_file):
+        if not os.path.exists(path):
+            print(f"Error: Color file not found: {path}")
+            return
+
+    light_primitive = parse_color_xml(light_primitive_file)
+    dark_primitive = parse_color_xml(dark_primitive_file)
+    ref_counts = count_references([parse_color_xml(light_semantic_file),
+                                   parse_color_xml(dark_semantic_file)])
+
+    merged = find_near_duplicates(light_primitive, dark_primitive, args.threshold, ref_counts)
+    print_report(merged, light_primitive, args.threshold)
+
+    if not args.merge or not merged:
+        return
+
+    removed = rewrite_primitive_xml(light_primitive_file, merged)
+    rewrite_primitive_xml(dark_primitive_file, merged)
+    rewritten = rewrite_semantic_xml(light_semantic_file, merged)
+    rewritten += rewrite_semantic_xml(dark_semantic_file, merged)
+    print(f"Removed {removed} primitive colors, rewrote {rewritten} semantic references")
+    count = save_merge_map(args.merge_map, merged)
+    print(f"Updated merge map: {args.merge_map} ({count} merges, applied by tokens.py on every run)")
+
+
+if __name__ == '__main__':
+    main()
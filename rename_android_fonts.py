@@ -9,6 +9,8 @@ import shutil
 from pathlib import Path
 from typing import Dict, List
 
+from font_metadata import read_font_metadata
+
 class FontFileRenamer:
     """Rename font files to follow Android naming conventions"""
     
@@ -29,6 +31,23 @@ class FontFileRenamer:
         self.static_dir = Path(static_dir)
         self.renamed_files: Dict[str, str] = {}
     
+    def parse_font_file(self, file_path: Path) -> Dict[str, str]:
+        """Read components from the font's OS/2 and name tables, falling back to the filename"""
+        metadata = read_font_metadata(str(file_path))
+        if metadata is None:
+            return self.parse_font_filename(file_path.name)
+
+        weight_values = {name: int(value) for name, value in self.WEIGHT_MAP.items()}
+        weight = metadata.weight_name(weight_values)
+        family = metadata.family.replace(' ', '').replace('-', '').lower() or "intertight"
+
+        return {
+            'family': family,
+            'weight': weight,
+            'style': "italic" if metadata.is_italic else "normal",
+            'weight_value': self.WEIGHT_MAP[weight]
+        }
+    
     def parse_font_filename(self, filename: str) -> Dict[str, str]:
         """Parse font filename to extract components"""
         name = filename.replace('.ttf', '').replace('.otf', '')
@@ -98,7 +117,7 @@ class FontFileRenamer:
         for file_path in self.static_dir.iterdir():
             if file_path.suffix.lower() in font_extensions:
                 old_name = file_path.name
-                components = self.parse_font_filename(old_name)
+                components = self.parse_font_file(file_path)
                 new_name = self.generate_android_filename(components)
                 
                 if old_name != new_name:
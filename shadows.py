@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+阴影烘焙：将 effect.shadows 中的多层 custom-shadow 令牌（dropShadow / innerShadow）按密度光栅化为
+9-patch PNG（drawable-<密度>/<名称>.9.png），列表项直接绘制位图，不再在运行时叠加模糊或 elevation。
+模糊使用 NumPy 的三次盒式模糊近似高斯模糊（pip install numpy），PNG 由标准库 zlib 编码，
+结果按阴影参数缓存，参数不变的阴影只渲染一次。
+
+生成的图片中心透明、形状下方的投影被挖空，可放在 LayerDrawable 底层，上层叠加随日夜间切换的背景色；
+也可以用 --fill 烘焙不透明底色。
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import shutil
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from color_utils import parse_hex_color
+from instrumentation import tracer, CACHE_HITS, add_arguments, setup_from_args, finish_from_args
+from tokens import format_xml_name, load_json_file
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 密度桶 -> 缩放倍数
+DENSITY_BUCKETS = {'mdpi': 1.0, 'hdpi': 1.5, 'xhdpi': 2.0, 'xxhdpi': 3.0, 'xxxhdpi': 4.0}
+
+# 形状默认圆角，与 radius_md 一致
+DEFAULT_CORNER_RADIUS = 8
+
+# 9-patch 中间可拉伸区域的像素数
+STRETCH_PX = 2
+
+# 渲染算法变化时修改，使旧缓存失效
+CACHE_VERSION = 1
+
+SHADOW_TYPES = {'dropShadow', 'innerShadow'}
+
+
+class ShadowLayer:
+    """阴影中的一层
+
+    Attributes:
+        shadow_type: 'dropShadow' 或 'innerShadow'
+        radius: 模糊半径（dp），按 Figma/CSS 约定为高斯标准差的两倍
+        argb: 颜色
+        offset_x: 水平偏移（dp）
+        offset_y: 垂直偏移（dp）
+        spread: 扩展（dp），负值收缩
+    """
+
+    __slots__ = ('shadow_type', 'radius', 'argb', 'offset_x', 'offset_y', 'spread')
+
+    def __init__(self, shadow_type: str, radius: float, argb: int,
+                 offset_x: float = 0, offset_y: float = 0, spread: float = 0):
+        self.shadow_type = shadow_type
+        self.radius = radius
+        self.argb = argb
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.spread = spread
+
+    @property
+    def inner(self) -> bool:
+        return self.shadow_type == 'innerShadow'
+
+    def key(self) -> Tuple[Any, ...]:
+        return (self.shadow_type, self.radius, self.argb, self.offset_x, self.offset_y, self.spread)
+
+    def __repr__(self):
+        return (f"ShadowLayer({self.shadow_type!r}, radius={self.radius}, argb=#{self.argb:08X}, "
+                f"offset=({self.offset_x}, {self.offset_y}), spread={self.spread})")
+
+
+def parse_shadow_layer(value: Dict[str, Any]) -> Optional[ShadowLayer]:
+    """解析 custom-shadow 令牌的值，无法识别时返回None"""
+    if value.get('shadowType') not in SHADOW_TYPES:
+        return None
+    argb = parse_hex_color(value.get('color', ''), alpha_last=True)
+    if argb is None:
+        return None
+    return ShadowLayer(value['shadowType'], float(value.get('radius', 0)), argb,
+                       float(value.get('offsetX', 0)), float(value.get('offsetY', 0)),
+                       float(value.get('spread', 0)))
+
+
+def process_shadows(data: Dict[str, Any]) -> Dict[str, List[ShadowLayer]]:
+    """提取 effect.shadows 中的阴影，返回 资源名 -> 按JSON顺序排列的阴影层"""
+    shadows: Dict[str, List[ShadowLayer]] = {}
+
+    def traverse(node: Dict[str, Any], path: List[str]) -> None:
+        layers = []
+        for key in sorted((k for k in node if k.isdigit()), key=int):
+            child = node[key]
+            if isinstance(child, dict) and child.get('type') == 'custom-shadow':
+                layer = parse_shadow_layer(child.get('value', {}))
+                if layer is None:
+                    print(f"Warning: skipping unsupported shadow layer {'.'.join(path + [key])}")
+                else:
+                    layers.append(layer)
+        if layers:
+            shadows[format_xml_name(path)] = layers
+            return
+        for key, child in node.items():
+            if isinstance(child, dict) and key not in ('extensions',):
+                traverse(child, path + [key])
+
+    effect = data.get('effect', {})
+    if isinstance(effect.get('shadows'), dict):
+        traverse(effect['shadows'], [])
+    return shadows
+
+
+class ShadowGeometry:
+    """单个密度下的画布尺寸（像素）
+
+    形状为边长 body 的圆角正方形，四周留出投影所需的边距。body 的一半至少覆盖圆角加上
+    最大的模糊范围，使中间的拉伸行列不受圆角影响，拉伸后的阴影与宽卡片的实际效果一致。
+    """
+
+    __slots__ = ('density', 'corner', 'body', 'left', 'top', 'right', 'bottom')
+
+    def __init__(self, layers: List[ShadowLayer], density: float, corner_dp: float):
+        self.density = density
+        self.corner = int(round(corner_dp * density))
+        reach = 0
+        left = top = right = bottom = 0
+        for layer in layers:
+            blur = math.ceil(1.5 * layer.radius * density)
+            ox, oy, spread = layer.offset_x * density, layer.offset_y * density, layer.spread * density
+            shift = max(abs(ox), abs(oy))
+            if layer.inner:
+                reach = max(reach, math.ceil(blur + abs(spread) + shift))
+                continue
+            reach = max(reach, math.ceil(blur + max(-spread, 0) + shift))
+            left = max(left, math.ceil(blur + spread - ox))
+            right = max(right, math.ceil(blur + spread + ox))
+            top = max(top, math.ceil(blur + spread - oy))
+            bottom = max(bottom, math.ceil(blur + spread + oy))
+        self.body = 2 * (self.corner + reach) + STRETCH_PX
+        self.left, self.top, self.right, self.bottom = left, top, right, bottom
+
+    @property
+    def width(self) -> int:
+        return self.left + self.body + self.right
+
+    @property
+    def height(self) -> int:
+        return self.top + self.body + self.bottom
+
+
+def box_blur_radii(sigma: float, passes: int = 3) -> List[int]:
+    """计算用 passes 次盒式模糊近似标准差为 sigma 的高斯模糊时各次的半径"""
+    if sigma <= 0:
+        return []
+    ideal = math.sqrt(12 * sigma * sigma / passes + 1)
+    lower = int(math.floor(ideal))
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    m = round((12 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes) / (-4 * lower - 4))
+    return [((lower if i < m else upper) - 1) // 2 for i in range(passes)]
+
+
+def box_blur_axis(values: 'np.ndarray', radius: int, axis: int) -> 'np.ndarray':
+    """沿一个轴做盒式模糊，基于前缀和，耗时与半径无关；画布外按0处理"""
+    if radius <= 0:
+        return values
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (radius + 1, radius)
+    cumulative = np.cumsum(np.pad(values, pad), axis=axis, dtype=np.float64)
+    size = values.shape[axis]
+    window = 2 * radius + 1
+    upper = np.take(cumulative, np.arange(window, window + size), axis=axis)
+    lower = np.take(cumulative, np.arange(0, size), axis=axis)
+    return ((upper - lower) / window).astype(np.float32)
+
+
+def gaussian_blur(values: 'np.ndarray', sigma: float) -> 'np.ndarray':
+    """三次盒式模糊近似的高斯模糊"""
+    for radius in box_blur_radii(sigma):
+        values = box_blur_axis(values, radius, 0)
+        values = box_blur_axis(values, radius, 1)
+    return values
+
+
+def rounded_rect_coverage(width: int, height: int, x0: float, y0: float, x1: float, y1: float,
+                          radius: float) -> 'np.ndarray':
+    """圆角矩形在每个像素上的覆盖率（0~1，边缘抗锯齿）"""
+    half_w, half_h = (x1 - x0) / 2, (y1 - y0) / 2
+    if half_w <= 0 or half_h <= 0:
+        return np.zeros((height, width), dtype=np.float32)
+    radius = min(max(radius, 0.0), half_w, half_h)
+    qx = np.abs(np.arange(width, dtype=np.float32) + 0.5 - (x0 + x1) / 2) - half_w + radius
+    qy = np.abs(np.arange(height, dtype=np.float32) + 0.5 - (y0 + y1) / 2) - half_h + radius
+    qx, qy = qx[np.newaxis, :], qy[:, np.newaxis]
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    inside = np.minimum(np.maximum(qx, qy), 0)
+    return np.clip(0.5 - (outside + inside - radius), 0, 1).astype(np.float32)
+
+
+def argb_components(argb: int) -> Tuple[float, 'np.ndarray']:
+    """返回 (alpha, RGB数组)，均为0~1"""
+    rgb = np.array([(argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF], dtype=np.float32) / 255
+    return ((argb >> 24) & 0xFF) / 255, rgb
+
+
+def composite(canvas: 'np.ndarray', coverage: 'np.ndarray', argb: int) -> None:
+    """以预乘alpha的 source-over 方式将单色图层叠加到画布上"""
+    alpha, rgb = argb_components(argb)
+    layer_alpha = coverage * alpha
+    canvas *= (1 - layer_alpha)[..., np.newaxis]
+    canvas[..., :3] += layer_alpha[..., np.newaxis] * rgb
+    canvas[..., 3] += layer_alpha
+
+
+def render_shadow(layers: List[ShadowLayer], geometry: ShadowGeometry,
+                  fill: Optional[int] = None) -> 'np.ndarray':
+    """渲染阴影，返回带 9-patch 边框的 RGBA 像素（uint8，未预乘）"""
+    width, height, d = geometry.width, geometry.height, geometry.density
+    x0, y0 = geometry.left, geometry.top
+    x1, y1 = x0 + geometry.body, y0 + geometry.body
+    corner = geometry.corner
+    shape = rounded_rect_coverage(width, height, x0, y0, x1, y1, corner)
+    canvas = np.zeros((height, width, 4), dtype=np.float32)
+
+    for layer in layers:
+        if layer.inner:
+            continue
+        ox, oy, spread = layer.offset_x * d, layer.offset_y * d, layer.spread * d
+        coverage = rounded_rect_coverage(width, height, x0 + ox - spread, y0 + oy - spread,
+                                         x1 + ox + spread, y1 + oy + spread, corner + spread)
+        coverage = gaussian_blur(coverage, layer.radius * d / 2)
+        if fill is None:
+            coverage *= 1 - shape
+        composite(canvas, coverage, layer.argb)
+
+    if fill is not None:
+        composite(canvas, shape, fill)
+
+    for layer in layers:
+        if not layer.inner:
+            continue
+        ox, oy, spread = layer.offset_x * d, layer.offset_y * d, layer.spread * d
+        hole = rounded_rect_coverage(width, height, x0 + ox + spread, y0 + oy + spread,
+                                     x1 + ox - spread, y1 + oy - spread, corner - spread)
+        # 1 - blur(hole) 等价于画布外全为阴影时对 (1 - hole) 的模糊
+        coverage = (1 - gaussian_blur(hole, layer.radius * d / 2)) * shape
+        composite(canvas, coverage, layer.argb)
+
+    alpha = canvas[..., 3:4]
+    rgb = np.divide(canvas[..., :3], alpha, out=np.zeros_like(canvas[..., :3]), where=alpha > 0)
+    pixels = np.zeros((height + 2, width + 2, 4), dtype=np.uint8)
+    pixels[1:-1, 1:-1, :3] = np.round(np.clip(rgb, 0, 1) * 255)
+    pixels[1:-1, 1:-1, 3] = np.round(np.clip(alpha[..., 0], 0, 1) * 255)
+
+    # 9-patch 边框：上/左标记拉伸区域，下/右标记内容区域（即形状本身）
+    black = (0, 0, 0, 255)
+    stretch_x = 1 + x0 + (geometry.body - STRETCH_PX) // 2
+    stretch_y = 1 + y0 + (geometry.body - STRETCH_PX) // 2
+    pixels[0, stretch_x:stretch_x + STRETCH_PX] = black
+    pixels[stretch_y:stretch_y + STRETCH_PX, 0] = black
+    pixels[-1, 1 + x0:1 + x1] = black
+    pixels[1 + y0:1 + y1, -1] = black
+    return pixels
+
+
+def _png_chunk(tag: bytes, payload: bytes) -> bytes:
+    return (struct.pack('>I', len(payload)) + tag + payload
+            + struct.pack('>I', zlib.crc32(tag + payload) & 0xFFFFFFFF))
+
+
+def encode_png(pixels: 'np.ndarray') -> bytes:
+    """将 RGBA uint8 像素编码为PNG，每行使用 Up 过滤（与上一行求差），阴影渐变压缩率更高"""
+    height, width = pixels.shape[:2]
+    rows = pixels.reshape(height, width * 4)
+    filtered = rows.copy()
+    filtered[1:] -= rows[:-1]
+    scanlines = np.hstack([np.full((height, 1), 2, dtype=np.uint8), filtered])
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(scanlines.tobytes(), 9)) + _png_chunk(b'IEND', b''))
+
+
+def shadow_cache_key(layers: List[ShadowLayer], density: float, corner_dp: float,
+                     fill: Optional[int]) -> str:
+    """由阴影参数计算缓存键，名称不参与，参数相同的阴影共用一份渲染结果"""
+    params = (CACHE_VERSION, STRETCH_PX, density, corner_dp, fill, tuple(layer.key() for layer in layers))
+    return hashlib.sha256(repr(params).encode('utf-8')).hexdigest()[:24]
+
+
+class ShadowBaker:
+    """按密度渲染阴影 9-patch，结果写入以参数哈希命名的缓存目录"""
+
+    def __init__(self, output_dir: str, cache_dir: str = ".shadow_cache",
+                 corner_dp: float = DEFAULT_CORNER_RADIUS, fill: Optional[int] = None):
+        self.output_dir = output_dir
+        self.cache_dir = cache_dir
+        self.corner_dp = corner_dp
+        self.fill = fill
+
+    def bake_one(self, layers: List[ShadowLayer], density: float) -> Tuple[str, ShadowGeometry, bool]:
+        """返回 (缓存文件路径, 画布尺寸, 是否命中缓存)"""
+        geometry = ShadowGeometry(layers, density, self.corner_dp)
+        cache_path = os.path.join(self.cache_dir,
+                                  f"{shadow_cache_key(layers, density, self.corner_dp, self.fill)}.9.png")
+        if os.path.exists(cache_path):
+            return cache_path, geometry, True
+
+        with tracer.span('render', density=density, layers=len(layers)):
+            png = encode_png(render_shadow(layers, geometry, self.fill))
+        # 先写临时文件，中断时不会留下损坏的缓存
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(png)
+        os.replace(tmp_path, cache_path)
+        return cache_path, geometry, False
+
+    def bake(self, shadows: Dict[str, List[ShadowLayer]],
+             buckets: Optional[List[str]] = None) -> List[Tuple[str, str, ShadowGeometry, int, bool]]:
+        """烘焙所有阴影
+
+        Returns:
+            [(名称, 密度桶, 画布尺寸, 文件大小, 是否命中缓存), ...]
+        """
+        if np is None:
+            print("Error: shadow baking requires NumPy (pip install numpy)")
+            return []
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        results = []
+        for bucket in buckets or list(DENSITY_BUCKETS):
+            drawable_dir = os.path.join(self.output_dir, f"drawable-{bucket}")
+            os.makedirs(drawable_dir, exist_ok=True)
+            for name, layers in shadows.items():
+                cache_path, geometry, cached = self.bake_one(layers, DENSITY_BUCKETS[bucket])
+                shutil.copyfile(cache_path, os.path.join(drawable_dir, f"{name}.9.png"))
+                results.append((name, bucket, geometry, os.path.getsize(cache_path), cached))
+        tracer.count(CACHE_HITS, sum(1 for result in results if result[4]))
+        return results
+
+
+def print_report(results: List[Tuple[str, str, ShadowGeometry, int, bool]]) -> None:
+    """打印每个阴影的尺寸；最小尺寸为 9-patch 不可拉伸部分，视图小于该尺寸时阴影会被压缩"""
+    for name, bucket, geometry, size, cached in results:
+        minimum = geometry.body / geometry.density
+        source = " (cached)" if cached else ""
+        print(f"  drawable-{bucket}/{name}.9.png: {geometry.width + 2}x{geometry.height + 2}px, "
+              f"{size:,} bytes, min {minimum:.0f}dp{source}")
+    if results:
+        hits = sum(1 for result in results if result[4])
+        print(f"Baked {len(results)} shadow images ({hits} from cache)")
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Bake effect.shadows tokens into 9-patch PNGs per density')
+    parser.add_argument('--tokens', default='design-tokens.tokens(5).json',
+                        help='Design token JSON (default: design-tokens.tokens(5).json)')
+    parser.add_argument('--output-dir', default='.',
+                        help='Directory that receives the drawable-<density>/ folders (default: current directory)')
+    parser.add_argument('--cache-dir', default='.shadow_cache',
+                        help='Cache directory for rendered shadows (default: .shadow_cache)')
+    parser.add_argument('--density', action='append', choices=list(DENSITY_BUCKETS), default=[],
+                        help='Density bucket to render; repeat for several (default: all)')
+    parser.add_argument('--corner-radius', type=float, default=DEFAULT_CORNER_RADIUS,
+                        help=f'Corner radius of the shadowed shape in dp (default: {DEFAULT_CORNER_RADIUS})')
+    parser.add_argument('--fill', metavar='COLOR',
+                        help='Bake an opaque shape color, e.g. #FFFFFF (default: transparent shape)')
+    parser.add_argument('--shadow', action='append', default=[],
+                        help='Only bake this shadow, e.g. shadow_md; repeat for several (default: all)')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    fill = None
+    if args.fill:
+        fill = parse_hex_color(args.fill)
+        if fill is None:
+            print(f"Error: invalid fill color: {args.fill}")
+            return
+
+    with tracer.span('load', file=args.tokens):
+        data = load_json_file(args.tokens)
+    if not data:
+        return
+    with tracer.span('walk', module='effect.shadows'):
+        shadows = process_shadows(data)
+    if args.shadow:
+        unknown = set(args.shadow) - set(shadows)
+        if unknown:
+            print(f"Error: unknown shadow(s): {', '.join(sorted(unknown))}")
+            return
+        shadows = {name: layers for name, layers in shadows.items() if name in args.shadow}
+    print(f"Found {len(shadows)} shadows")
+
+    baker = ShadowBaker(args.output_dir, args.cache_dir, args.corner_radius, fill)
+    with tracer.span('emit', module='shadows'):
+        results = baker.bake(shadows, args.density or None)
+    print_report(results)
+
+    finish_from_args(args)
+
+
+if __name__ == '__main__':
+    main()
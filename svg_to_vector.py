@@ -10,8 +10,14 @@ import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import argparse
+import logging
 from typing import Dict, List, Optional, Tuple
 
+from color_utils import to_android_argb_hex
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+
+logger = logging.getLogger(__name__)
+
 
 class SvgToVectorConverter:
     """SVG转Android Vector Drawable转换器"""
@@ -58,28 +64,7 @@ class SvgToVectorConverter:
     
     def convert_color(self, color: str) -> str:
         """转换颜色格式"""
-        if not color or color == 'none':
-            return '#00000000'  # 透明
-        
-        if color.startswith('#'):
-            # 确保颜色是8位格式 (#AARRGGBB)
-            if len(color) == 4:  # #RGB
-                color = '#' + ''.join([c*2 for c in color[1:]])
-            if len(color) == 7:  # #RRGGBB
-                color = '#FF' + color[1:]  # 添加Alpha通道
-            return color
-        
-        # 处理命名颜色
-        named_colors = {
-            'black': '#FF000000',
-            'white': '#FFFFFFFF',
-            'red': '#FFFF0000',
-            'green': '#FF00FF00',
-            'blue': '#FF0000FF',
-            'transparent': '#00000000'
-        }
-        
-        return named_colors.get(color.lower(), '#FF000000')
+        return to_android_argb_hex(color)
     
     def rect_to_path(self, element: ET.Element) -> str:
         """将rect元素转换为path数据"""
@@ -280,8 +265,9 @@ class SvgToVectorConverter:
             output_file = os.path.join(output_dir, f'{svg_filename}.xml')
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(xml_content)
+            tracer.count_written(xml_content)
             
-            print(f"✓ 已转换: {svg_filename}.svg -> {svg_filename}.xml")
+            logger.info("✓ 已转换: %s.svg -> %s.xml", svg_filename, svg_filename)
             return True
             
         except Exception as e:
@@ -349,7 +335,9 @@ class SvgToVectorConverter:
         
         success_count = 0
         for svg_file in svg_files:
-            if self.convert_svg_to_vector(str(svg_file), output_dir):
+            with tracer.span('convert', file=svg_file.name):
+                converted = self.convert_svg_to_vector(str(svg_file), output_dir)
+            if converted:
                 success_count += 1
         
         print("-" * 50)
@@ -363,8 +351,10 @@ def main():
                        help='SVG文件输入目录 (默认: svgs)')
     parser.add_argument('--output', '-o', default='vectors', 
                        help='Vector Drawable输出目录 (默认: vectors)')
+    add_arguments(parser)
     
     args = parser.parse_args()
+    setup_from_args(args)
     
     # 获取当前脚本所在目录
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -388,6 +378,8 @@ def main():
     # 创建转换器并执行转换
     converter = SvgToVectorConverter()
     converter.convert_directory(input_dir, output_dir)
+    
+    finish_from_args(args)
 
 
 if __name__ == '__main__':
@@ -4,11 +4,17 @@
 用于支持通过Theme切换实现的日夜模式
 """
 
+import argparse
 import xml.etree.ElementTree as ET
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import re
 
+from color_utils import color_resource_files
+from dark_derive import derive_missing_dark, print_derived
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from token_snapshot import load_color_maps
+
 
 def to_camel_case(snake_str: str) -> str:
     """将下划线命名转换为驼峰命名
@@ -28,20 +34,19 @@ def parse_color_xml(file_path: str) -> Dict[str, str]:
     """解析颜色XML文件，返回颜色名称和值的映射
     
     Args:
-        file_path: XML文件路径
+        file_path: XML文件路径，按分类分片生成时读取同目录下的所有分片
         
     Returns:
         字典，键为颜色名称，值为颜色值或引用
     """
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-    
     colors = {}
-    for color in root.findall('color'):
-        name = color.get('name')
-        value = color.text.strip() if color.text else ''
-        if name and value:
-            colors[name] = value
+    for path in color_resource_files(file_path) or [file_path]:
+        root = ET.parse(path).getroot()
+        for color in root.findall('color'):
+            name = color.get('name')
+            value = color.text.strip() if color.text else ''
+            if name and value:
+                colors[name] = value
     
     return colors
 
@@ -98,6 +103,7 @@ def generate_attrs_xml(color_names: List[str], output_path: str) -> None:
     # 写入文件
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
     
     print(f"Generated: {output_path}")
     print(f"  - Total attributes: {len(sorted_names)}")
@@ -222,6 +228,7 @@ def generate_combined_theme_xml(light_colors: Dict[str, str],
     # 写入文件
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
     
     print(f"Generated: {output_path}")
     print(f"  - Light theme: {light_theme_name} (parent: {light_parent_theme})")
@@ -252,33 +259,25 @@ def clean_color_value(value: str) -> str:
     return value
 
 
-def main():
-    # 配置
-    light_color_file = "values/semantic_color.xml"
-    dark_color_file = "values-night/semantic_color.xml"
-    
-    # 原子颜色文件路径
-    light_primitive_file = "values/primitive_color.xml"
-    dark_primitive_file = "values-night/primitive_color.xml"
-    
-    output_dir = "values"
-    attrs_file = os.path.join(output_dir, "semantic_color_attrs.xml")
-    theme_file = os.path.join(output_dir, "themes.xml")  # 合并到一个文件
-    
+def load_colors_from_xml(light_color_file: str, dark_color_file: str,
+                         light_primitive_file: str, dark_primitive_file: str
+                         ) -> Optional[Tuple[Dict[str, str], Dict[str, str], Dict[str, str], Dict[str, str]]]:
+    """解析日夜间语义颜色和原子颜色XML文件，语义颜色文件缺失时返回None"""
     # 检查输入文件是否存在
-    if not os.path.exists(light_color_file):
+    if not color_resource_files(light_color_file):
         print(f"Error: Light mode color file not found: {light_color_file}")
-        return
+        return None
     
-    if not os.path.exists(dark_color_file):
+    if not color_resource_files(dark_color_file):
         print(f"Error: Dark mode color file not found: {dark_color_file}")
-        return
+        return None
     
     print("Parsing semantic color files...")
     
     # 解析日间和夜间模式的颜色文件
-    light_colors = parse_color_xml(light_color_file)
-    dark_colors = parse_color_xml(dark_color_file)
+    with tracer.span('load', module='semantic colors'):
+        light_colors = parse_color_xml(light_color_file)
+        dark_colors = parse_color_xml(dark_color_file)
     
     print(f"Light mode colors: {len(light_colors)}")
     print(f"Dark mode colors: {len(dark_colors)}")
@@ -288,45 +287,100 @@ def main():
     light_primitive_colors = {}
     dark_primitive_colors = {}
     
-    if os.path.exists(light_primitive_file):
-        light_primitive_colors = parse_color_xml(light_primitive_file)
+    if color_resource_files(light_primitive_file):
+        with tracer.span('load', file=light_primitive_file):
+            light_primitive_colors = parse_color_xml(light_primitive_file)
         print(f"Light mode primitive colors: {len(light_primitive_colors)}")
     else:
         print(f"Warning: Light mode primitive color file not found: {light_primitive_file}")
     
-    if os.path.exists(dark_primitive_file):
-        dark_primitive_colors = parse_color_xml(dark_primitive_file)
+    if color_resource_files(dark_primitive_file):
+        with tracer.span('load', file=dark_primitive_file):
+            dark_primitive_colors = parse_color_xml(dark_primitive_file)
         print(f"Dark mode primitive colors: {len(dark_primitive_colors)}")
     else:
         print(f"Warning: Dark mode primitive color file not found: {dark_primitive_file}")
     
+    return light_colors, dark_colors, light_primitive_colors, dark_primitive_colors
+
+
+def generate_theme_files(light_colors: Dict[str, str], dark_colors: Dict[str, str],
+                         light_primitive_colors: Dict[str, str], dark_primitive_colors: Dict[str, str],
+                         attrs_file: str, theme_file: str,
+                         light_theme_name: str = "AUIAppTheme",
+                         dark_theme_name: str = "TintAUIAppTheme") -> None:
+    """生成属性定义文件和合并的主题文件"""
     # 获取所有颜色名称（使用日间模式的名称作为基准）
     color_names = list(light_colors.keys())
-    
-    # 验证夜间模式是否包含所有颜色
-    missing_in_dark = set(light_colors.keys()) - set(dark_colors.keys())
-    if missing_in_dark:
-        print(f"\nWarning: {len(missing_in_dark)} colors missing in dark mode:")
-        for name in sorted(missing_in_dark):
-            print(f"  - {name}")
-    
+
     # 生成属性定义文件
     print("\nGenerating attribute definitions...")
-    generate_attrs_xml(color_names, attrs_file)
+    with tracer.span('emit', file=attrs_file):
+        generate_attrs_xml(color_names, attrs_file)
     
     # 生成合并的主题文件（包含日间和夜间两个主题）
     print("\nGenerating combined theme file...")
-    generate_combined_theme_xml(
-        light_colors=light_colors,
-        dark_colors=dark_colors,
-        output_path=theme_file,
-        light_theme_name="AUIAppTheme",
-        dark_theme_name="TintAUIAppTheme",
-        light_parent_theme="Theme.MaterialComponents.DayNight.NoActionBar.Bridge",
-        dark_parent_theme="Theme.MaterialComponents.DayNight.NoActionBar.Bridge",
-        light_primitive_colors=light_primitive_colors,
-        dark_primitive_colors=dark_primitive_colors
-    )
+    with tracer.span('emit', file=theme_file):
+        generate_combined_theme_xml(
+            light_colors=light_colors,
+            dark_colors=dark_colors,
+            output_path=theme_file,
+            light_theme_name=light_theme_name,
+            dark_theme_name=dark_theme_name,
+            light_parent_theme="Theme.MaterialComponents.DayNight.NoActionBar.Bridge",
+            dark_parent_theme="Theme.MaterialComponents.DayNight.NoActionBar.Bridge",
+            light_primitive_colors=light_primitive_colors,
+            dark_primitive_colors=dark_primitive_colors
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Generate theme attributes and styles from semantic colors')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='Read colors from a token snapshot written by tokens.py --snapshot instead of the XML files')
+    parser.add_argument('--light-theme', default='AUIAppTheme', help='Light theme name (default: AUIAppTheme)')
+    parser.add_argument('--dark-theme', default='TintAUIAppTheme', help='Dark theme name (default: TintAUIAppTheme)')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    # 配置
+    light_color_file = "values/semantic_color.xml"
+    dark_color_file = "values-night/semantic_color.xml"
+    
+    # 原子颜色文件路径
+    light_primitive_file = "values/primitive_color.xml"
+    dark_primitive_file = "values-night/primitive_color.xml"
+    
+    output_dir = "values"
+    attrs_file = os.path.join(output_dir, "semantic_color_attrs.xml")
+    theme_file = os.path.join(output_dir, "themes.xml")  # 合并到一个文件
+    
+    if args.snapshot:
+        print(f"Loading colors from snapshot {args.snapshot}...")
+        try:
+            with tracer.span('load', file=args.snapshot):
+                colors = load_color_maps(args.snapshot)
+        except (OSError, ValueError) as e:
+            # 快照不存在、格式无效或已过期（JSON已更新）时拒绝使用
+            print(f"Error: {e}")
+            return
+    else:
+        colors = load_colors_from_xml(light_color_file, dark_color_file,
+                                      light_primitive_file, dark_primitive_file)
+    if colors is None:
+        return
+    light_colors, dark_colors, light_primitive_colors, dark_primitive_colors = colors
+    
+    # 夜间模式缺失的颜色由日间颜色推导（tokens.py 生成的XML已包含推导结果，这里处理手工维护的XML）
+    derived = derive_missing_dark(light_colors, dark_colors, light_primitive_colors, dark_primitive_colors)
+    if derived:
+        print()
+        print_derived(derived)
+        dark_colors = {**dark_colors, **{name: color.value for name, color in derived.items()}}
+    
+    generate_theme_files(light_colors, dark_colors, light_primitive_colors, dark_primitive_colors,
+                         attrs_file, theme_file, args.light_theme, args.dark_theme)
     
     print("\n" + "="*60)
     print("Generation completed successfully!")
@@ -349,6 +403,8 @@ def main():
     print("      <!-- 你的其他主题属性 -->")
     print("  </style>")
 
+    finish_from_args(args)
+
 
 if __name__ == '__main__':
     main()
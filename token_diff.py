@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+设计令牌差异对比：按规范化路径对齐两份Figma导出的JSON，
+为每个子树计算内容哈希，哈希相同的分支直接跳过；
+列出新增、删除、修改的令牌，以及每个变更会影响的生成文件（含引用它的语义令牌）。
+资源名与 tokens.py 一致：语义颜色按名称注册表分配（含重名后缀），模式从令牌集合中发现。
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from aucolorKt import MAIN_KT_FILE, category_kt_file
+from color_utils import semantic_category
+from shadows import DENSITY_BUCKETS
+from name_registry import DEFAULT_REGISTRY_FILE, NameRegistry
+from tokens import (DEFAULT_MODE_QUALIFIERS, collect_semantic_names, discover_modes, find_color_modes_key,
+                    format_gradient_name, format_xml_name, load_json_file, match_mode, parse_mode_qualifiers)
+
+Path = Tuple[str, ...]
+
+# 引用格式 {primitives.colors.brand.500}
+REFERENCE_PATTERN = re.compile(r'^\{([^{}]+)\}$')
+
+# 引用路径中的集合模式段（'mode 1' 等；具名模式由 discover_modes 从令牌集合中发现）
+MODE_N = re.compile(r'^mode \d+$')
+
+
+def normalize_key(key: str) -> str:
+    """规范化节点名：全角转半角、合并空白、小写"""
+    key = unicodedata.normalize('NFKC', key)
+    return ' '.join(key.split()).lower()
+
+
+def is_token(node: Any) -> bool:
+    """判断节点是否为令牌（带type和value的叶子）"""
+    return isinstance(node, dict) and 'type' in node and 'value' in node
+
+
+def token_content(node: Dict[str, Any]) -> Any:
+    """参与比较的令牌内容：类型和值（不含描述、Figma变量ID等元数据）"""
+    return {'type': node['type'], 'value': node['value']}
+
+
+class TreeNode:
+    """带内容哈希的令牌树节点"""
+
+    __slots__ = ('key', 'digest', 'children', 'token')
+
+    def __init__(self, key: str, digest: bytes, children: Optional[Dict[str, 'TreeNode']] = None,
+                 token: Optional[Dict[str, Any]] = None):
+        self.key = key
+        self.digest = digest
+        self.children = children or {}
+        self.token = token
+
+
+def build_tree(key: str, node: Any) -> TreeNode:
+    """自底向上构建哈希树，分组的哈希由子节点的 (规范化名称, 哈希) 决定"""
+    if is_token(node):
+        content = json.dumps(token_content(node), sort_keys=True, ensure_ascii=False)
+        digest = hashlib.blake2b(b'T' + content.encode('utf-8'), digest_size=16).digest()
+        return TreeNode(key, digest, token=node)
+
+    children: Dict[str, TreeNode] = {}
+    if isinstance(node, dict):
+        for child_key, child in node.items():
+            if isinstance(child, dict):
+                children[normalize_key(child_key)] = build_tree(child_key, child)
+
+    digest = hashlib.blake2b(b'G', digest_size=16)
+    for child_key in sorted(children):
+        digest.update(child_key.encode('utf-8'))
+        digest.update(children[child_key].digest)
+    return TreeNode(key, digest.digest(), children=children)
+
+
+def iter_tokens(node: TreeNode, path: Path) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """遍历子树中的所有令牌，path为原始节点名"""
+    if node.token is not None:
+        yield path, node.token
+        return
+    for child in node.children.values():
+        yield from iter_tokens(child, path + (child.key,))
+
+
+class TokenDiff:
+    """两棵令牌树的差异"""
+
+    def __init__(self):
+        self.added: List[Tuple[Path, Dict[str, Any]]] = []
+        self.removed: List[Tuple[Path, Dict[str, Any]]] = []
+        self.changed: List[Tuple[Path, Dict[str, Any], Dict[str, Any]]] = []
+        self.skipped_subtrees = 0
+
+    def compare(self, old: TreeNode, new: TreeNode, path: Path = ()) -> None:
+        if old.digest == new.digest:
+            self.skipped_subtrees += 1
+            return
+
+        if old.token is not None and new.token is not None:
+            self.changed.append((path, old.token, new.token))
+            return
+        if old.token is not None or new.token is not None:
+            # 令牌与分组互换：视为删除后新增
+            self.removed.extend(iter_tokens(old, path))
+            self.added.extend(iter_tokens(new, path))
+            return
+
+        for key in sorted(set(old.children) | set(new.children)):
+            old_child = old.children.get(key)
+            new_child = new.children.get(key)
+            if old_child is None:
+                self.added.extend(iter_tokens(new_child, path + (new_child.key,)))
+            elif new_child is None:
+                self.removed.extend(iter_tokens(old_child, path + (old_child.key,)))
+            else:
+                self.compare(old_child, new_child, path + (new_child.key,))
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+def diff_token_files(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> TokenDiff:
+    """对比两份令牌JSON"""
+    result = TokenDiff()
+    result.compare(build_tree('', old_data), build_tree('', new_data))
+    return result
+
+
+class ResourceNames:
+    """一份令牌JSON生成的资源名和模式目录，与 tokens.py 的命名保持一致
+
+    语义颜色的资源名由名称注册表按令牌身份分配（只读取，不写回），重名时带有与生成结果相同的后缀；
+    原子颜色按路径格式化。模式从语义颜色集合中发现，资源目录与 tokens.py --mode-qualifier 相同。
+    """
+
+    def __init__(self, data: Dict[str, Any], registry_file: Optional[str] = DEFAULT_REGISTRY_FILE,
+                 mode_qualifiers: Optional[Dict[str, str]] = None):
+        self.modes = discover_modes(data)
+        self.mode_qualifiers = mode_qualifiers or dict(DEFAULT_MODE_QUALIFIERS)
+        self.semantic: Dict[Path, str] = {}
+        color_modes_key = find_color_modes_key(data)
+        if color_modes_key is not None:
+            identities: Dict[Tuple[str, ...], str] = {}
+            candidates: Dict[str, List[str]] = {}
+            collect_semantic_names(data[color_modes_key], [], [], identities, candidates, self.modes)
+            names = NameRegistry(registry_file).assign(candidates)
+            for path, identity in identities.items():
+                self.semantic[(color_modes_key,) + path] = names[identity]
+
+    def resource_name(self, path: Path) -> Optional[str]:
+        """语义/原子颜色的资源名，其他令牌返回None"""
+        top = normalize_key(path[0])
+        if 'color modes' in top:
+            return self.semantic.get(tuple(path))
+        if top == 'primitives':
+            return format_xml_name(list(path[1:]))
+        return None
+
+    def mode_dirs(self, path: Path) -> List[str]:
+        """根据路径中的模式名确定资源目录，没有资源目录的模式不生成文件"""
+        for part in path:
+            mode = match_mode(part, self.modes)
+            if mode is not None:
+                directory = self.mode_qualifiers.get(mode)
+                return [directory] if directory else []
+        return [self.mode_qualifiers[mode] for mode in self.modes if mode in self.mode_qualifiers]
+
+
+def reference_key(parts: List[str], modes: Tuple[str, ...]) -> Path:
+    """引用匹配用的路径键
+
+    导出的primitives引用带有集合模式段（如 primitives.light mode.colors.brand.500、
+    primitives.mode 1.spacing.0），而JSON树中没有这一层，比较时去掉。
+    """
+    key = [normalize_key(part) for part in parts]
+    if key and key[0] == 'primitives':
+        key = [key[0]] + [part for part in key[1:] if part not in modes and not MODE_N.match(part)]
+    return tuple(key)
+
+
+def build_reference_index(data: Dict[str, Any], modes: Tuple[str, ...]) -> Dict[Path, List[Path]]:
+    """建立 被引用令牌的规范化路径 -> 引用它的令牌路径 的反向索引"""
+    index: Dict[Path, List[Path]] = defaultdict(list)
+    for path, token in iter_tokens(build_tree('', data), ()):
+        value = token['value']
+        if isinstance(value, str):
+            match = REFERENCE_PATTERN.match(value.strip())
+            if match:
+                index[reference_key(match.group(1).split('.'), modes)].append(path)
+    return index
+
+
+def affected_outputs(path: Path, names: ResourceNames, structural: bool = False) -> List[str]:
+    """返回令牌变更会影响的生成文件
+
+    Args:
+        path: 令牌的原始路径
+        names: 该令牌所在JSON的资源名
+        structural: 是否为新增/删除（会影响属性定义等按名称生成的文件）
+    """
+    if not path:
+        return []
+    top = normalize_key(path[0])
+    parts = [normalize_key(part) for part in path]
+
+    if top == 'primitives':
+        if 'spacing' in parts:
+            return ["values/dimens.xml"]
+        # 引用该颜色的语义颜色作为依赖项单独记录，Kotlin文件由它们的分类决定
+        outputs = [f"{d}/primitive_color.xml" for d in names.mode_dirs(path)]
+        return outputs + ["values/themes.xml"]
+    if 'color modes' in top:
+        outputs = [f"{d}/semantic_color.xml" for d in names.mode_dirs(path)]
+        name = names.resource_name(path)
+        outputs.append("values/themes.xml")
+        if name is not None:
+            outputs.append(category_kt_file(semantic_category(name)))
+        if structural:
+            # 新增/删除可能使分类变空或出现新分类，分发函数随之变化
+            outputs += ["values/semantic_color_attrs.xml", MAIN_KT_FILE]
+        return outputs
+    if top == 'gradient' and len(path) >= 2:
+        parent = path[-2] if len(path) >= 3 else 'gradient'
+        return [f"gradients/{format_gradient_name(parent, path[-1])}.xml"]
+    if top == 'effect' and len(path) >= 4 and parts[1] == 'shadows':
+        name = format_xml_name(list(path[2:-1]))
+        return [f"drawable-{bucket}/{name}.9.png" for bucket in DENSITY_BUCKETS]
+    if top in ('grid', '4. widths', '5. containers'):
+        return ["values/width_dimens.xml", "values*/grid_dimens.xml", "ktClass/AppBreakpoints.kt"]
+    if top == '2. radius':
+        return ["values/radius_dimens.xml", "ktClass/AppRadius.kt"]
+    if top == '3. spacing':
+        return ["values/semantic_dimens.xml"]
+    if top == 'typography':
+        return ["values/text_styles.xml", "values/text_sizes.xml", "typography_readme.md"]
+    if top == '6. typography' and 'font size' in parts:
+        return ["values/text_dimens.xml"]
+    return []
+
+
+def collect_dependents(path: Path, reference_index: Dict[Path, List[Path]],
+                       modes: Tuple[str, ...]) -> List[Path]:
+    """传递地查找引用该令牌的所有令牌"""
+    result: List[Path] = []
+    seen: Set[Path] = set()
+    pending = [reference_key(list(path), modes)]
+    while pending:
+        for dependent in reference_index.get(pending.pop(), ()):
+            key = reference_key(list(dependent), modes)
+            if key not in seen:
+                seen.add(key)
+                result.append(dependent)
+                pending.append(key)
+    return result
+
+
+def analyze_impact(diff: TokenDiff, old_data: Dict[str, Any], new_data: Dict[str, Any],
+                   old_names: ResourceNames, new_names: ResourceNames) -> Dict[str, List[str]]:
+    """汇总 生成文件 -> 影响它的令牌路径"""
+    old_refs = build_reference_index(old_data, old_names.modes)
+    new_refs = build_reference_index(new_data, new_names.modes)
+    impact: Dict[str, Set[str]] = defaultdict(set)
+
+    def record(path: Path, structural: bool, references: Dict[Path, List[Path]], names: ResourceNames) -> None:
+        label = '.'.join(path)
+        for output in affected_outputs(path, names, structural):
+            impact[output].add(label)
+        for dependent in collect_dependents(path, references, names.modes):
+            for output in affected_outputs(dependent, names):
+                impact[output].add(f"{label} (via {'.'.join(dependent)})")
+
+    for path, _ in diff.added:
+        record(path, True, new_refs, new_names)
+    for path, _ in diff.removed:
+        record(path, True, old_refs, old_names)
+    for path, _, _ in diff.changed:
+        record(path, False, new_refs, new_names)
+
+    return {output: sorted(labels) for output, labels in sorted(impact.items())}
+
+
+def format_value(token: Dict[str, Any]) -> str:
+    value = token['value']
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def print_report(diff: TokenDiff, impact: Dict[str, List[str]], old_names: ResourceNames,
+                 new_names: ResourceNames, verbose: bool = False) -> None:
+    """打印差异和影响范围，删除的令牌使用旧JSON中的资源名"""
+    print(f"Added: {len(diff.added)}, Removed: {len(diff.removed)}, Changed: {len(diff.changed)} "
+          f"({diff.skipped_subtrees} unchanged subtrees skipped)")
+
+    for title, marker, entries, names in (("Added", '+', diff.added, new_names),
+                                          ("Removed", '-', diff.removed, old_names)):
+        if entries:
+            print(f"\n{title}:")
+            for path, token in entries:
+                name = names.resource_name(path)
+                suffix = f"  [{name}]" if name else ""
+                print(f"  {marker} {'.'.join(path)}: {format_value(token)}{suffix}")
+
+    if diff.changed:
+        print("\nChanged:")
+        for path, old, new in diff.changed:
+            name = new_names.resource_name(path)
+            suffix = f"  [{name}]" if name else ""
+            print(f"  ~ {'.'.join(path)}: {format_value(old)} -> {format_value(new)}{suffix}")
+
+    if impact:
+        print("\nAffected outputs:")
+        for output, labels in impact.items():
+            print(f"  {output}: {len(labels)} change(s)")
+            if verbose:
+                for label in labels:
+                    print(f"      {label}")
+
+
+def diff_to_json(diff: TokenDiff, impact: Dict[str, List[str]], old_names: ResourceNames,
+                 new_names: ResourceNames) -> Dict[str, Any]:
+    """差异的JSON表示"""
+    return {
+        'added': [{'path': '.'.join(p), 'name': new_names.resource_name(p), 'value': t['value']}
+                  for p, t in diff.added],
+        'removed': [{'path': '.'.join(p), 'name': old_names.resource_name(p), 'value': t['value']}
+                    for p, t in diff.removed],
+        'changed': [{'path': '.'.join(p), 'name': new_names.resource_name(p), 'old': o['value'], 'new': n['value']}
+                    for p, o, n in diff.changed],
+        'affected_outputs': impact,
+    }
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Diff two design token exports and list affected outputs')
+    parser.add_argument('old', nargs='?', default='design-tokens.tokens(1).json',
+                        help='Old token JSON (default: design-tokens.tokens(1).json)')
+    parser.add_argument('new', nargs='?', default='design-tokens.tokens(5).json',
+                        help='New token JSON (default: design-tokens.tokens(5).json)')
+    parser.add_argument('--json', metavar='FILE', help='Also write the diff as JSON')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='List the token paths behind each affected output')
+    parser.add_argument('--name-registry', default=DEFAULT_REGISTRY_FILE, metavar='FILE',
+                        help=f'Token -> resource name registry used by tokens.py (default: {DEFAULT_REGISTRY_FILE})')
+    parser.add_argument('--mode-qualifier', action='append', default=[], metavar='MODE=DIR',
+                        help="Resource directory for an extra mode, as passed to tokens.py")
+
+    args = parser.parse_args()
+
+    try:
+        mode_qualifiers = parse_mode_qualifiers(args.mode_qualifier)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    old_data = load_json_file(args.old)
+    new_data = load_json_file(args.new)
+    old_names = ResourceNames(old_data, args.name_registry, mode_qualifiers)
+    new_names = ResourceNames(new_data, args.name_registry, mode_qualifiers)
+
+    print(f"Comparing {args.old} -> {args.new}")
+    diff = diff_token_files(old_data, new_data)
+    impact = analyze_impact(diff, old_data, new_data, old_names, new_names)
+    print_report(diff, impact, old_names, new_names, args.verbose)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(diff_to_json(diff, impact, old_names, new_names), f, ensure_ascii=False, indent=2)
+        print(f"\nDiff written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+令牌历史库：把每一份编号导出（design-tokens.tokens(N).json）解析后写入本地 SQLite 数据库，
+之后可以直接查询某个令牌在各个导出之间的变化，例如 “bg_primary 的夜间值是在哪一版变的”，
+不必重新解析所有JSON。
+
+表结构：
+    exports      导出文件（版本号、内容sha256），内容相同的文件只导入一次
+    modes        模式名称；与模式无关的令牌（尺寸、圆角等）使用 'default'
+    tokens       (资源名, 类型)
+    token_values 令牌值的JSON，按内容哈希去重，相同的值只存一份
+    revisions    (令牌, 模式, 版本) -> 值；只在值与前一个版本不同时记录一行，值为NULL表示令牌被删除
+
+导出按版本号排序，导入中间版本时会重新计算其后一个版本的变化记录，导入顺序不影响结果。
+资源名沿用名称注册表（不会写回），与 tokens.py 生成的资源名一致。
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import redirect_stdout
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from dark_derive import fill_missing_dark_tokens
+from export_targets import build_manifest
+from name_registry import NameRegistry, DEFAULT_REGISTRY_FILE
+from token_model import ResolvedTokens
+from token_snapshot import file_sha256
+from tokens import (load_json_file, discover_modes, process_primitive_modes, process_semantic_modes,
+                    process_spacing_dimensions, process_semantic_spacing, process_gradients, process_radius_data,
+                    process_typography_data, process_font_sizes, LIGHT_MODE, DARK_MODE)
+
+DEFAULT_DATABASE = "token_history.db"
+DEFAULT_EXPORT_PATTERN = "design-tokens.tokens(*).json"
+SCHEMA_VERSION = 1
+DEFAULT_MODE = 'default'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL UNIQUE,
+    file TEXT NOT NULL,
+    sha256 TEXT NOT NULL UNIQUE,
+    token_count INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE TABLE IF NOT EXISTS modes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    UNIQUE (name, type)
+);
+CREATE TABLE IF NOT EXISTS token_values (
+    id INTEGER PRIMARY KEY,
+    hash BLOB NOT NULL UNIQUE,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS revisions (
+    token_id INTEGER NOT NULL REFERENCES tokens(id),
+    mode_id INTEGER NOT NULL REFERENCES modes(id),
+    version INTEGER NOT NULL,
+    value_id INTEGER REFERENCES token_values(id),
+    PRIMARY KEY (token_id, mode_id, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS revisions_by_version ON revisions (version, token_id);
+"""
+
+# (令牌id, 模式id) -> 值id（None 表示已删除）
+State = Dict[Tuple[int, int], Optional[int]]
+
+
+def export_version(file_path: str) -> Optional[int]:
+    """从文件名中的括号编号取版本号，如 design-tokens.tokens(5).json -> 5"""
+    match = re.search(r'\((\d+)\)[^()]*$', os.path.basename(file_path))
+    return int(match.group(1)) if match else None
+
+
+def resolve_export(file_path: str, registry_file: Optional[str]) -> ResolvedTokens:
+    """按 tokens.py 的流程解析一份导出，返回已解析的令牌模型（解析过程的输出被丢弃）"""
+    with redirect_stdout(io.StringIO()):
+        data = load_json_file(file_path)
+        modes = discover_modes(data)
+        primitives_by_mode = process_primitive_modes(data, modes)
+        primitive_color_map = {}
+        for colors in primitives_by_mode.values():
+            primitive_color_map.update(colors)
+        # 注册表只读：查询历史不应改变当前工程的资源名
+        registry = NameRegistry(registry_file)
+        semantic_by_mode = process_semantic_modes(data, primitive_color_map, primitives_by_mode, modes, registry)
+        fill_missing_dark_tokens(semantic_by_mode[LIGHT_MODE], semantic_by_mode[DARK_MODE],
+                                 primitives_by_mode[LIGHT_MODE], primitives_by_mode[DARK_MODE])
+        return ResolvedTokens(file_path, primitives_by_mode, semantic_by_mode,
+                              process_spacing_dimensions(data), process_semantic_spacing(data),
+                              process_gradients(data), process_radius_data(data),
+                              process_typography_data(data), process_font_sizes(data))
+
+
+def iter_token_values(model: ResolvedTokens) -> Iterator[Tuple[str, str, str, Any]]:
+    """展开为 (资源名, 类型, 模式, 值)，值为可JSON序列化的对象"""
+    for token in build_manifest(model)['tokens']:
+        name, token_type = token['name'], token['type']
+        if 'values' in token:
+            for mode, value in token['values'].items():
+                yield name, token_type, mode, value
+        else:
+            value = {key: value for key, value in token.items() if key not in ('name', 'type')}
+            yield name, token_type, DEFAULT_MODE, value
+
+
+def value_hash(encoded: str) -> bytes:
+    return hashlib.sha1(encoded.encode('utf-8')).digest()
+
+
+class TokenHistory:
+    """令牌历史数据库"""
+
+    def __init__(self, path: str = DEFAULT_DATABASE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        current = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if current not in (0, SCHEMA_VERSION):
+            raise RuntimeError(f"{path}: unsupported schema version {current}")
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._ids: Dict[Tuple[str, ...], int] = {}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _lookup_id(self, table: str, columns: Tuple[str, ...], values: Tuple[Any, ...]) -> int:
+        """查找或插入一行，返回id（带进程内缓存）"""
+        key = (table,) + tuple(values)
+        row_id = self._ids.get(key)
+        if row_id is not None:
+            return row_id
+        where = ' AND '.join(f"{column} = ?" for column in columns)
+        row = self.conn.execute(f"SELECT id FROM {table} WHERE {where}", values).fetchone()
+        if row is None:
+            placeholders = ', '.join('?' for _ in columns)
+            row = (self.conn.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                                     values).lastrowid,)
+        self._ids[key] = row[0]
+        return row[0]
+
+    def value_id(self, value: Any) -> int:
+        """值按内容哈希去重"""
+        encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        digest = value_hash(encoded)
+        row = self.conn.execute("SELECT id FROM token_values WHERE hash = ?", (digest,)).fetchone()
+        if row is not None:
+            return row[0]
+        return self.conn.execute("INSERT INTO token_values (hash, value) VALUES (?, ?)",
+                                 (digest, encoded)).lastrowid
+
+    def state_at(self, version: int, inclusive: bool = True) -> State:
+        """某个版本（inclusive=False 时为该版本之前）所有令牌的值"""
+        operator = '<=' if inclusive else '<'
+        rows = self.conn.execute(f"""
+            SELECT r.token_id, r.mode_id, r.value_id FROM revisions r
+            JOIN (SELECT token_id, mode_id, MAX(version) AS version FROM revisions
+                  WHERE version {operator} ? GROUP BY token_id, mode_id) latest
+              ON r.token_id = latest.token_id AND r.mode_id = latest.mode_id AND r.version = latest.version
+        """, (version,))
+        return {(token_id, mode_id): value_id for token_id, mode_id, value_id in rows}
+
+    def _write_revisions(self, version: int, previous: State, state: State) -> int:
+        """写入 state 相对 previous 的变化（新增、修改、删除），返回行数"""
+        rows = [(token_id, mode_id, version, value_id) for (token_id, mode_id), value_id in state.items()
+                if previous.get((token_id, mode_id)) != value_id]
+        rows += [(token_id, mode_id, version, None) for (token_id, mode_id), value_id in previous.items()
+                 if value_id is not None and (token_id, mode_id) not in state]
+        self.conn.executemany("INSERT INTO revisions (token_id, mode_id, version, value_id) VALUES (?, ?, ?, ?)",
+                              rows)
+        return len(rows)
+
+    def ingest(self, file_path: str, version: Optional[int] = None,
+               registry_file: Optional[str] = DEFAULT_REGISTRY_FILE) -> Tuple[str, int, int]:
+        """导入一份导出
+
+        Returns:
+            (状态 'added'/'skipped', 版本号, 写入的变化记录数)
+        """
+        digest = file_sha256(file_path).hex()
+        existing = self.conn.execute("SELECT version FROM exports WHERE sha256 = ?", (digest,)).fetchone()
+        if existing is not None:
+            return 'skipped', existing[0], 0
+
+        if version is None:
+            version = export_version(file_path)
+        if version is None:
+            version = (self.conn.execute("SELECT MAX(version) FROM exports").fetchone()[0] or 0) + 1
+        if self.conn.execute("SELECT 1 FROM exports WHERE version = ?", (version,)).fetchone():
+            raise ValueError(f"version {version} already ingested from a different file")
+
+        model = resolve_export(file_path, registry_file)
+        with self.conn:
+            state: State = {}
+            for name, token_type, mode, value in iter_token_values(model):
+                token_id = self._lookup_id('tokens', ('name', 'type'), (name, token_type))
+                mode_id = self._lookup_id('modes', ('name',), (mode,))
+                state[(token_id, mode_id)] = self.value_id(value)
+
+            # 插入到已有版本之间时，后一个版本的变化记录需要相对新版本重新计算
+            following = self.conn.execute("SELECT MIN(version) FROM exports WHERE version > ?",
+                                          (version,)).fetchone()[0]
+            following_state = self.state_at(following) if following is not None else None
+
+            written = self._write_revisions(version, self.state_at(version, inclusive=False), state)
+            if following is not None:
+                self.conn.execute("DELETE FROM revisions WHERE version = ?", (following,))
+                written += self._write_revisions(following, state, following_state)
+
+            self.conn.execute("INSERT INTO exports (version, file, sha256, token_count) VALUES (?, ?, ?, ?)",
+                              (version, os.path.basename(file_path), digest, len(state)))
+        return 'added', version, written
+
+    def exports(self) -> List[Tuple[int, str, int, str, int]]:
+        """[(版本, 文件, 令牌数, 导入时间, 变化记录数)]"""
+        return self.conn.execute("""
+            SELECT e.version, e.file, e.token_count, e.ingested_at,
+                   (SELECT COUNT(*) FROM revisions r WHERE r.version = e.version)
+            FROM exports e ORDER BY e.version
+        """).fetchall()
+
+    def history(self, name: str, mode: Optional[str] = None) -> List[Tuple[str, str, int, str, Optional[str]]]:
+        """令牌在各版本中的变化：[(类型, 模式, 版本, 文件, 值JSON或None)]"""
+        query = """
+            SELECT t.type, m.name, r.version, e.file, v.value
+            FROM tokens t
+            JOIN revisions r ON r.token_id = t.id
+            JOIN modes m ON m.id = r.mode_id
+            JOIN exports e ON e.version = r.version
+            LEFT JOIN token_values v ON v.id = r.value_id
+            WHERE t.name = ?"""
+        params: List[Any] = [name]
+        if mode:
+            query += " AND m.name = ?"
+            params.append(mode)
+        query += " ORDER BY t.type, m.name, r.version"
+        return self.conn.execute(query, params).fetchall()
+
+    def value_at(self, name: str, version: int) -> List[Tuple[str, str, int, Optional[str]]]:
+        """令牌在某个版本时的值：[(类型, 模式, 来自的版本, 值JSON或None)]"""
+        return self.conn.execute("""
+            SELECT t.type, m.name, r.version, v.value
+            FROM tokens t
+            JOIN revisions r ON r.token_id = t.id
+            JOIN modes m ON m.id = r.mode_id
+            LEFT JOIN token_values v ON v.id = r.value_id
+            WHERE t.name = ? AND r.version = (
+                SELECT MAX(version) FROM revisions
+                WHERE token_id = r.token_id AND mode_id = r.mode_id AND version <= ?)
+            ORDER BY t.type, m.name
+        """, (name, version)).fetchall()
+
+    def changes(self, version: int, token_type: Optional[str] = None
+                ) -> List[Tuple[str, str, str, Optional[str], Optional[str]]]:
+        """某个版本相对前一版本的变化：[(名称, 类型, 模式, 旧值JSON, 新值JSON)]"""
+        query = """
+            SELECT t.name, t.type, m.name,
+                   (SELECT pv.value FROM revisions p LEFT JOIN token_values pv ON pv.id = p.value_id
+                    WHERE p.token_id = r.token_id AND p.mode_id = r.mode_id AND p.version < r.version
+                    ORDER BY p.version DESC LIMIT 1),
+                   v.value
+            FROM revisions r
+            JOIN tokens t ON t.id = r.token_id
+            JOIN modes m ON m.id = r.mode_id
+            LEFT JOIN token_values v ON v.id = r.value_id
+            WHERE r.version = ?"""
+        params: List[Any] = [version]
+        if token_type:
+            query += " AND t.type = ?"
+            params.append(token_type)
+        query += " ORDER BY t.type, t.name, m.name"
+        return self.conn.execute(query, params).fetchall()
+
+
+def format_value(value: Optional[str]) -> str:
+    """把值JSON格式化为一行：颜色显示 值 (别名)，删除显示 <removed>"""
+    if value is None:
+        return '<removed>'
+    data = json.loads(value)
+    if isinstance(data, dict) and 'value' in data and isinstance(data['value'], str):
+        text = data['value']
+        if data.get('alias'):
+            text += f" ({data['alias']})"
+        if data.get('derived'):
+            text += " [derived]"
+        return text
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Store token exports in a SQLite history and query it')
+    parser.add_argument('--db', default=DEFAULT_DATABASE, help=f'History database (default: {DEFAULT_DATABASE})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest = subparsers.add_parser('ingest', help='Load token exports into the history')
+    ingest.add_argument('files', nargs='*',
+                        help=f'Export files (default: {DEFAULT_EXPORT_PATTERN} in the current directory)')
+    ingest.add_argument('--version', type=int,
+                        help='Version number for a single file (default: the number in parentheses in the name)')
+    ingest.add_argument('--name-registry', default=DEFAULT_REGISTRY_FILE, metavar='FILE',
+                        help=f'Token -> resource name registry, read only (default: {DEFAULT_REGISTRY_FILE})')
+
+    subparsers.add_parser('exports', help='List ingested exports')
+
+    history = subparsers.add_parser('history', help='Show every change of a token across exports')
+    history.add_argument('name', help='Resource name, e.g. bg_primary')
+    history.add_argument('--mode', help="Only this mode, e.g. 'dark mode'")
+
+    show = subparsers.add_parser('show', help='Show the value of a token in one export')
+    show.add_argument('name', help='Resource name, e.g. bg_primary')
+    show.add_argument('version', type=int, help='Export version')
+
+    changes = subparsers.add_parser('changes', help='List tokens that changed in an export')
+    changes.add_argument('version', type=int, help='Export version')
+    changes.add_argument('--type', help='Only this token type, e.g. semantic_color')
+
+    args = parser.parse_args(argv)
+    store = TokenHistory(args.db)
+    start = time.perf_counter()
+    try:
+        if args.command == 'ingest':
+            files = args.files or sorted(glob.glob(DEFAULT_EXPORT_PATTERN),
+                                         key=lambda path: (export_version(path) or 0, path))
+            if args.version is not None and len(files) != 1:
+                print("Error: --version requires exactly one file")
+                return
+            for file_path in files:
+                try:
+                    status, version, written = store.ingest(file_path, args.version, args.name_registry)
+                except (OSError, ValueError) as e:
+                    print(f"Error: {file_path}: {e}")
+                    continue
+                if status == 'skipped':
+                    print(f"Skipped {file_path}: identical to version {version}")
+                else:
+                    print(f"Ingested {file_path} as version {version} ({written} changed rows)")
+        elif args.command == 'exports':
+            for version, file_name, token_count, ingested_at, revision_count in store.exports():
+                print(f"  v{version}: {file_name}, {token_count} token values, "
+                      f"{revision_count} changed, ingested {ingested_at}")
+        elif args.command == 'history':
+            rows = store.history(args.name, args.mode)
+            if not rows:
+                print(f"No history for {args.name}")
+            for token_type, mode, version, file_name, value in rows:
+                print(f"  [{token_type}] {mode} v{version} ({file_name}): {format_value(value)}")
+        elif args.command == 'show':
+            rows = store.value_at(args.name, args.version)
+            if not rows:
+                print(f"{args.name} not found at version {args.version}")
+            for token_type, mode, since, value in rows:
+                print(f"  [{token_type}] {mode}: {format_value(value)} (since v{since})")
+        elif args.command == 'changes':
+            rows = store.changes(args.version, args.type)
+            print(f"{len(rows)} changes in version {args.version}")
+            for name, token_type, mode, old, new in rows:
+                print(f"  [{token_type}] {name} {mode}: "
+                      f"{format_value(old) if old is not None else '<new>'} -> {format_value(new)}")
+    finally:
+        store.close()
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+令牌数据模型：使用 __slots__ 的紧凑记录代替嵌套字典和 (值, 注释) 元组，
+解析阶段一次性确定输出值、别名目标和最终ARGB，生成阶段直接读取字段。
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class FrozenRecord:
+    """只读的 __slots__ 记录：字段在构造时写入，之后不能修改
+
+    ResolvedTokens 被多个导出目标在不同线程中共享，令牌本身也必须不可变；
+    需要改变值时（如合并原子颜色、推导夜间颜色）构造新的令牌替换。
+    """
+
+    __slots__ = ()
+
+    def _init_fields(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only (tried to set {name!r})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only (tried to delete {name!r})")
+
+    def __reduce__(self):
+        # 按构造参数重建，multiprocessing 传给子进程时不经过 __setattr__
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+
+class ColorToken(FrozenRecord):
+    """单个模式下的语义颜色（只读）
+
+    Attributes:
+        name: 资源名，如 text_primary
+        mode: 'light mode' 或 'dark mode'
+        raw: JSON中的原始值（颜色值或引用）
+        value: 写入XML的值，@color/引用或 #AARRGGBB
+        argb: 解析后的ARGB整数，无法解析时为None
+        alias: 引用的原子颜色名称，直接颜色值时为None
+        comment: 跨模式引用时附加在XML行尾的注释
+        provenance: 令牌在JSON中的路径
+    """
+
+    __slots__ = ('name', 'mode', 'raw', 'value', 'argb', 'alias', 'comment', 'provenance')
+
+    def __init__(self, name: str, mode: str, raw: str, value: str,
+                 argb: Optional[int] = None, alias: Optional[str] = None,
+                 comment: str = '', provenance: str = ''):
+        self._init_fields(name=name, mode=mode, raw=raw, value=value, argb=argb, alias=alias,
+                          comment=comment, provenance=provenance)
+
+    def __repr__(self):
+        return f"ColorToken({self.name!r}, {self.mode!r}, {self.value!r}, alias={self.alias!r})"
+
+
+class GradientToken(FrozenRecord):
+    """两点线性渐变（只读）"""
+
+    __slots__ = ('name', 'rotation', 'start_color', 'end_color', 'provenance')
+
+    def __init__(self, name: str, rotation: float, start_color: str, end_color: str,
+                 provenance: str = ''):
+        self._init_fields(name=name, rotation=rotation, start_color=start_color, end_color=end_color,
+                          provenance=provenance)
+
+    def __repr__(self):
+        return f"GradientToken({self.name!r}, {self.start_color!r} -> {self.end_color!r}, {self.rotation})"
+
+
+class ResolvedTokens:
+    """一次解析得到的完整令牌模型，由多个导出目标共享
+
+    创建后不可修改：不能重新赋值属性，字典字段包装为只读映射，列表字段转为元组，
+    其中的 ColorToken / GradientToken 也是只读记录，多个导出目标可以在不同线程中同时读取而无需加锁。
+
+    Attributes:
+        source: 令牌JSON文件路径
+        primitives_by_mode / semantic_by_mode: 模式 -> 原子颜色 / 语义颜色（含推导出的夜间颜色）
+        dimensions / semantic_dimensions: 间距尺寸，保持JSON中的顺序
+        gradients, radius_values, typography_styles, text_sizes: 其他令牌
+        font_indexes: 字体族的字重索引，没有字体目录时为None
+    """
+
+    __slots__ = ('source', 'primitives_by_mode', 'semantic_by_mode', 'dimensions', 'semantic_dimensions',
+                 'gradients', 'radius_values', 'typography_styles', 'text_sizes', 'font_indexes')
+
+    def __init__(self, source: str,
+                 primitives_by_mode: Dict[str, Dict[str, str]],
+                 semantic_by_mode: Dict[str, Dict[str, ColorToken]],
+                 dimensions: List[Tuple[str, int]],
+                 semantic_dimensions: List[Tuple[str, str]],
+                 gradients: Dict[str, GradientToken],
+                 radius_values: Dict[str, str],
+                 typography_styles: Dict[str, Dict[str, str]],
+                 text_sizes: Dict[str, int],
+                 font_indexes: Optional[Dict[str, Any]] = None):
+        fields = {
+            'source': source,
+            'primitives_by_mode': MappingProxyType({mode: MappingProxyType(dict(colors))
+                                                    for mode, colors in primitives_by_mode.items()}),
+            'semantic_by_mode': MappingProxyType({mode: MappingProxyType(dict(tokens))
+                                                  for mode, tokens in semantic_by_mode.items()}),
+            'dimensions': tuple(dimensions),
+            'semantic_dimensions': tuple(semantic_dimensions),
+            'gradients': MappingProxyType(dict(gradients)),
+            'radius_values': MappingProxyType(dict(radius_values)),
+            'typography_styles': MappingProxyType({name: MappingProxyType(dict(style))
+                                                   for name, style in typography_styles.items()}),
+            'text_sizes': MappingProxyType(dict(text_sizes)),
+            'font_indexes': font_indexes,
+        }
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ResolvedTokens is read-only (tried to set {name!r})")
+
+    def primitives(self, mode: str) -> Mapping[str, str]:
+        return self.primitives_by_mode.get(mode, MappingProxyType({}))
+
+    def semantic(self, mode: str) -> Mapping[str, ColorToken]:
+        return self.semantic_by_mode.get(mode, MappingProxyType({}))
+
+    def __repr__(self):
+        counts = ', '.join(f"{mode}: {len(tokens)}" for mode, tokens in self.semantic_by_mode.items())
+        return f"ResolvedTokens({self.source!r}, semantic {{{counts}}})"
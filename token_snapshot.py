@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+令牌二进制快照：将 tokens.py 解析后的令牌（名称、类型、日间值、夜间值）写成
+字符串驻留、定长记录数组的二进制文件。后续阶段通过 mmap 直接读取，
+无需重新解析和解析引用设计令牌JSON。
+
+快照记录了生成它的JSON文件（相对快照所在目录的路径、大小、修改时间和sha256），
+读取颜色时默认检查快照是否仍与该文件一致，过期的快照会被拒绝。
+
+文件布局（小端）：
+    头部        HEADER_FORMAT
+    字符串偏移   uint32 × (字符串数 + 1)
+    字符串数据   UTF-8，按4字节对齐
+    记录        uint32 × 4 × 记录数：(名称id, 类型, 日间值id, 夜间值id)，保持写入顺序
+    排序索引     uint32 × 记录数：按 (类型, 名称) 排序的记录下标，用于二分查找
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b'TKSN'
+VERSION = 2
+
+# magic, 版本, 保留, 字符串数, 记录数, 源文件大小, 源文件修改时间(ns), 源文件sha256, 源文件路径字符串id
+HEADER_FORMAT = '<4sHHIIQQ32sI'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_FIELDS = 4
+
+# 缺失值（某一模式下不存在该令牌）
+NO_VALUE = 0xFFFFFFFF
+
+# 令牌类型
+TYPE_PRIMITIVE_COLOR = 1
+TYPE_SEMANTIC_COLOR = 2
+TYPE_DIMEN = 3
+TYPE_SEMANTIC_DIMEN = 4
+TYPE_RADIUS = 5
+TYPE_TEXT_SIZE = 6
+
+TYPE_NAMES = {
+    TYPE_PRIMITIVE_COLOR: 'primitive_color',
+    TYPE_SEMANTIC_COLOR: 'semantic_color',
+    TYPE_DIMEN: 'dimen',
+    TYPE_SEMANTIC_DIMEN: 'semantic_dimen',
+    TYPE_RADIUS: 'radius',
+    TYPE_TEXT_SIZE: 'text_size',
+}
+
+SnapshotEntry = Tuple[str, int, Optional[str], Optional[str]]
+
+
+class StaleSnapshotError(ValueError):
+    """快照不是由当前的JSON文件生成的"""
+
+
+def file_sha256(file_path: str) -> bytes:
+    """计算文件的sha256摘要"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _uint32_array(data: bytes) -> array:
+    """将小端uint32字节转换为array('I')"""
+    values = array('I')
+    values.frombytes(data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array('I', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(file_path: str, entries: Iterable[SnapshotEntry], source_path: Optional[str] = None) -> int:
+    """写入快照文件，返回记录数
+
+    Args:
+        file_path: 快照文件路径
+        entries: (名称, 类型, 日间值, 夜间值)，值为None表示该模式下不存在
+        source_path: 生成快照的JSON文件，用于判断快照是否过期
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(text: Optional[str]) -> int:
+        if text is None:
+            return NO_VALUE
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = len(strings)
+            string_ids[text] = string_id
+            strings.append(text)
+        return string_id
+
+    source_id = NO_VALUE
+    if source_path:
+        source_id = intern(os.path.relpath(source_path, os.path.dirname(os.path.abspath(file_path))))
+
+    records = array('I')
+    keys = []
+    for name, token_type, light, dark in entries:
+        keys.append((token_type, name))
+        records.extend((intern(name), token_type, intern(light), intern(dark)))
+
+    count = len(keys)
+    order = array('I', sorted(range(count), key=keys.__getitem__))
+
+    blob = bytearray()
+    offsets = array('I', [0])
+    for text in strings:
+        blob += text.encode('utf-8')
+        offsets.append(len(blob))
+    blob += b'\0' * (-len(blob) % 4)
+
+    source_size = source_mtime = 0
+    source_hash = b'\0' * 32
+    if source_path:
+        stat = os.stat(source_path)
+        source_size, source_mtime = stat.st_size, stat.st_mtime_ns
+        source_hash = file_sha256(source_path)
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, 0, len(strings), count,
+                         source_size, source_mtime, source_hash, source_id)
+
+    # 先写临时文件再替换，读取方不会看到写了一半的快照
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(_to_bytes(offsets))
+        f.write(blob)
+        f.write(_to_bytes(records))
+        f.write(_to_bytes(order))
+    os.replace(tmp_path, file_path)
+    return count
+
+
+class TokenSnapshot:
+    """只读的快照视图，字符串按需解码"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version = struct.unpack_from('<4sH', self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a token snapshot (or unsupported version): {file_path}")
+        (_, _, _, string_count, record_count, self.source_size, self.source_mtime, self.source_hash,
+         self._source_id) = struct.unpack_from(HEADER_FORMAT, self._data, 0)
+
+        offset = HEADER_SIZE
+        self._offsets = _uint32_array(self._data[offset:offset + 4 * (string_count + 1)])
+        offset += 4 * (string_count + 1)
+        self._blob_offset = offset
+        offset += self._offsets[-1] + (-self._offsets[-1] % 4)
+        self._records = _uint32_array(self._data[offset:offset + 4 * RECORD_FIELDS * record_count])
+        offset += 4 * RECORD_FIELDS * record_count
+        self._order = _uint32_array(self._data[offset:offset + 4 * record_count])
+        self._strings: Dict[int, str] = {}
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def string(self, string_id: int) -> Optional[str]:
+        """按id读取驻留字符串"""
+        if string_id == NO_VALUE:
+            return None
+        text = self._strings.get(string_id)
+        if text is None:
+            start = self._blob_offset + self._offsets[string_id]
+            end = self._blob_offset + self._offsets[string_id + 1]
+            text = self._data[start:end].decode('utf-8')
+            self._strings[string_id] = text
+        return text
+
+    def record(self, index: int) -> SnapshotEntry:
+        base = index * RECORD_FIELDS
+        name_id, token_type, light_id, dark_id = self._records[base:base + RECORD_FIELDS]
+        return self.string(name_id), token_type, self.string(light_id), self.string(dark_id)
+
+    def records(self, token_type: Optional[int] = None) -> Iterator[SnapshotEntry]:
+        """按写入顺序遍历记录"""
+        records = self._records
+        for index in range(len(self)):
+            if token_type is None or records[index * RECORD_FIELDS + 1] == token_type:
+                yield self.record(index)
+
+    def values(self, token_type: int, dark: bool = False) -> Dict[str, str]:
+        """返回某类型在日间或夜间模式下的 名称 -> 值"""
+        result = {}
+        for name, _, light, dark_value in self.records(token_type):
+            value = dark_value if dark else light
+            if value is not None:
+                result[name] = value
+        return result
+
+    def find(self, name: str, token_type: int) -> Optional[SnapshotEntry]:
+        """通过排序索引二分查找令牌"""
+        key = (token_type, name)
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            index = self._order[middle]
+            base = index * RECORD_FIELDS
+            probe = (self._records[base + 1], self.string(self._records[base]))
+            if probe < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._order):
+            entry = self.record(self._order[low])
+            if entry[0] == name and entry[1] == token_type:
+                return entry
+        return None
+
+    @property
+    def source_path(self) -> Optional[str]:
+        """生成快照的JSON文件路径（相对当前目录），写入时未记录则为None"""
+        relative = self.string(self._source_id)
+        if relative is None:
+            return None
+        return os.path.relpath(os.path.join(os.path.dirname(os.path.abspath(self.file_path)), relative))
+
+    def is_fresh(self, source_path: Optional[str] = None) -> bool:
+        """判断快照是否由当前的JSON文件生成（先比较大小和修改时间，不同再比较内容哈希）
+
+        Args:
+            source_path: JSON文件，默认使用快照中记录的源文件
+        """
+        source_path = source_path or self.source_path
+        if source_path is None:
+            return False
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime_ns == self.source_mtime:
+            return True
+        return file_sha256(source_path) == self.source_hash
+
+
+def load_color_maps(file_path: str, check_fresh: bool = True
+                    ) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """从快照读取颜色，格式与解析 semantic_color.xml / primitive_color.xml 的结果相同
+
+    Raises:
+        StaleSnapshotError: check_fresh 时快照与记录的JSON文件不一致（需重新运行 tokens.py --snapshot）
+
+    Returns:
+        (日间语义颜色, 夜间语义颜色, 日间原子颜色, 夜间原子颜色)
+    """
+    with TokenSnapshot(file_path) as snapshot:
+        if check_fresh and not snapshot.is_fresh():
+            raise StaleSnapshotError(f"Token snapshot {file_path} is stale for {snapshot.source_path}; "
+                                     f"rerun tokens.py --snapshot {file_path}")
+        return (snapshot.values(TYPE_SEMANTIC_COLOR),
+                snapshot.values(TYPE_SEMANTIC_COLOR, dark=True),
+                snapshot.values(TYPE_PRIMITIVE_COLOR),
+                snapshot.values(TYPE_PRIMITIVE_COLOR, dark=True))
+
+
+def main():
+    """主函数：打印快照内容摘要"""
+    parser = argparse.ArgumentParser(description='Inspect a binary token snapshot')
+    parser.add_argument('snapshot', help='Snapshot file written by tokens.py --snapshot')
+    parser.add_argument('--source', help='Token JSON file to check freshness against '
+                                         '(default: the file recorded in the snapshot)')
+    parser.add_argument('--dump', action='store_true', help='Print every record')
+
+    args = parser.parse_args()
+
+    with TokenSnapshot(args.snapshot) as snapshot:
+        counts: Dict[int, int] = {}
+        for _, token_type, _, _ in snapshot.records():
+            counts[token_type] = counts.get(token_type, 0) + 1
+
+        print(f"{args.snapshot}: {len(snapshot)} tokens")
+        for token_type, count in sorted(counts.items()):
+            print(f"  {TYPE_NAMES.get(token_type, token_type)}: {count}")
+        source = args.source or snapshot.source_path
+        if source:
+            print(f"Fresh for {source}: {snapshot.is_fresh(source)}")
+        if args.dump:
+            for name, token_type, light, dark in snapshot.records():
+                print(f"  {TYPE_NAMES.get(token_type, token_type):<15} {name:<40} {light} / {dark}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,36 @@
 解析设计令牌JSON文件，生成Android平台日夜间模式的颜色XML文件
 """
 
+import argparse
 import json
+import logging
 import os
 import re
-from typing import Dict, Any, List, Tuple, Optional, Union, Set
+from collections import defaultdict
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Tuple, Optional, Set
+
+from color_utils import (figma_to_android_hex, to_opaque_rgb_hex, parse_hex_color, check_semantic_contrast,
+                         semantic_category, primitive_group, is_color_shard, SHARD_MARKER)
+from dark_derive import fill_missing_dark_tokens
+from export_targets import EXPORT_TARGETS, DEFAULT_TARGETS, export_targets, print_timings
+from generate_android_fonts import build_font_weight_indexes
+from name_registry import NameRegistry, DEFAULT_REGISTRY_FILE, token_identity
+from palette_dedupe import DEFAULT_MERGE_MAP_FILE, apply_merge_map, load_merge_map
+from token_model import ColorToken, GradientToken, ResolvedTokens
+from token_snapshot import (write_snapshot, SnapshotEntry, TYPE_PRIMITIVE_COLOR,
+                            TYPE_SEMANTIC_COLOR, TYPE_DIMEN, TYPE_SEMANTIC_DIMEN, TYPE_RADIUS, TYPE_TEXT_SIZE)
+from instrumentation import (tracer, add_arguments, setup_from_args, finish_from_args,
+                             NODES_VISITED, LOOKUPS)
+
+logger = logging.getLogger(__name__)
+
+LIGHT_MODE = 'light mode'
+DARK_MODE = 'dark mode'
+
+# 模式 -> 资源目录（Android限定符）。其他模式通过 --mode-qualifier 指定，如 values-v31
+DEFAULT_MODE_QUALIFIERS = {LIGHT_MODE: 'values', DARK_MODE: 'values-night'}
+DEFAULT_MODES = tuple(DEFAULT_MODE_QUALIFIERS)
 
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
@@ -20,27 +46,73 @@ def is_color_node(node: Dict[str, Any]) -> bool:
     return node.get('type') == 'color' and 'value' in node
 
 
-def is_light_mode(node_name: str) -> bool:
-    """判断是否为日间模式节点"""
-    return 'light mode' in node_name.lower()
+def find_color_modes_key(data: Dict[str, Any]) -> Optional[str]:
+    """查找语义颜色集合的顶层键名（如 '1. color modes'）"""
+    for key in data.keys():
+        if 'color modes' in key.lower():
+            return key
+    return None
+
+
+def discover_modes(data: Dict[str, Any]) -> Tuple[str, ...]:
+    """从语义颜色集合的子节点发现模式名（小写），日间和夜间模式总是包含在内
+
+    例如 ('light mode', 'dark mode', 'high contrast mode')
+    """
+    modes = list(DEFAULT_MODE_QUALIFIERS)
+    color_modes_key = find_color_modes_key(data)
+    if color_modes_key is not None:
+        for key, value in data[color_modes_key].items():
+            mode = key.lower()
+            if isinstance(value, dict) and 'value' not in value and mode not in modes:
+                modes.append(mode)
+    return tuple(modes)
+
+
+def match_mode(node_name: str, modes: Tuple[str, ...]) -> Optional[str]:
+    """判断节点名是否指定了模式
+
+    节点名本身是模式（语义颜色集合下的 'light mode'），或带有模式后缀
+    （原子颜色色阶 'gray (dark mode)'、'gray (dark mode alpha)'）时返回该模式，否则返回None。
+    遍历时每个节点只匹配一次，结果随递归向下传递。
+    """
+    lowered = node_name.lower()
+    if lowered in modes:
+        return lowered
+    match = mode_node_pattern(modes).search(lowered)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=None)
+def mode_node_pattern(modes: Tuple[str, ...]) -> 're.Pattern':
+    """匹配节点名中完整的模式后缀，允许 alpha 色阶的 ' alpha' 后缀
+
+    较长的模式优先，'(dark mode high contrast)' 不会被当成 'dark mode'
+    """
+    alternatives = '|'.join(re.escape(mode) for mode in sorted(modes, key=len, reverse=True))
+    return re.compile(r'\((' + alternatives + r')(?: alpha)?\)')
 
 
-def should_include_in_light(node_name: str) -> bool:
-    """判断是否应该包含在日间模式XML中"""
-    return 'light mode' in node_name.lower() or 'light mode' not in node_name.lower()
+@lru_cache(maxsize=None)
+def mode_suffix_pattern(modes: Tuple[str, ...]) -> 're.Pattern':
+    """匹配引用中完整的模式后缀，如 '(light mode)'；'(dark mode alpha)' 是色阶名的一部分，不匹配"""
+    return re.compile(r'\s*\((' + '|'.join(re.escape(mode) for mode in modes) + r')\)', re.IGNORECASE)
 
 
-def should_include_in_dark(node_name: str) -> bool:
-    """判断是否应该包含在夜间模式XML中"""
-    return 'dark mode' in node_name.lower() or 'light mode' not in node_name.lower()
+def parse_mode_qualifiers(specs: List[str]) -> Dict[str, str]:
+    """解析 '模式=资源目录' 形式的命令行参数，如 'high contrast mode=values-v31'"""
+    qualifiers = dict(DEFAULT_MODE_QUALIFIERS)
+    for spec in specs:
+        mode, sep, directory = spec.partition('=')
+        if not sep or not mode.strip() or not directory.strip():
+            raise ValueError(f"Invalid mode mapping '{spec}', expected MODE=DIR")
+        qualifiers[mode.strip().lower()] = directory.strip()
+    return qualifiers
 
 
 def extract_color_value(value: str) -> str:
     """提取颜色值，将#RRGGBBAA转换为Android的#AARRGGBB格式"""
-    if len(value) == 9 and value.startswith('#'):  # #RRGGBBAA格式
-        # 将 #RRGGBBAA 转换为 #AARRGGBB
-        return '#' + value[7:9] + value[1:7]
-    return value
+    return figma_to_android_hex(value)
 
 
 def format_xml_name(name_parts: List[str], existing_names: Optional[Set[str]] = None) -> str:
@@ -209,41 +281,35 @@ def is_dimension_node(node: Dict[str, Any]) -> bool:
 
 
 def traverse_primitive_colors(data: Dict[str, Any], path: List[str],
-                              light_colors: Dict[str, str],
-                              dark_colors: Dict[str, str]) -> None:
-    """遍历primitives模块中的颜色"""
+                              colors_by_mode: Dict[str, Dict[str, str]],
+                              modes: Tuple[str, ...], mode: Optional[str] = None) -> None:
+    """遍历primitives模块中的颜色
+
+    Args:
+        colors_by_mode: 模式 -> (资源名 -> 颜色值)
+        modes: 所有模式
+        mode: 祖先节点指定的模式，如 'gray (dark mode)' 下的颜色只属于夜间模式；
+              未指定模式的颜色属于所有模式
+    """
+    tracer.count(NODES_VISITED, len(data))
     for key, value in data.items():
         current_path = path + [key]
 
         if isinstance(value, dict):
+            node_mode = match_mode(key, modes) or mode
             if is_color_node(value):
                 # 这是一个颜色节点
                 color_value = extract_color_value(value['value'])
                 xml_name = format_xml_name(current_path)
 
-                # 根据路径判断是否包含light/dark mode
-                path_str = ' '.join(current_path).lower()
-
-                # 特殊处理 gray 颜色
-                if 'gray' in path_str:
-                    if 'light mode' in path_str:
-                        light_colors[xml_name] = color_value
-                    elif 'dark mode' in path_str:
-                        dark_colors[xml_name] = color_value
-                    else:
-                        # 如果没有明确指定模式，同时添加到两个集合
-                        light_colors[xml_name] = color_value
-                        dark_colors[xml_name] = color_value
+                if node_mode:
+                    colors_by_mode[node_mode][xml_name] = color_value
                 else:
-                    # 其他颜色按原来的逻辑处理
-                    if should_include_in_light(path_str):
-                        light_colors[xml_name] = color_value
-
-                    if should_include_in_dark(path_str):
-                        dark_colors[xml_name] = color_value
+                    for colors in colors_by_mode.values():
+                        colors[xml_name] = color_value
             else:
                 # 继续递归
-                traverse_primitive_colors(value, current_path, light_colors, dark_colors)
+                traverse_primitive_colors(value, current_path, colors_by_mode, modes, node_mode)
 
 
 def traverse_spacing_dimensions(data: Dict[str, Any], path: List[str],
@@ -263,57 +329,83 @@ def traverse_spacing_dimensions(data: Dict[str, Any], path: List[str],
                 traverse_spacing_dimensions(value, current_path, dimensions)
 
 
-def generate_android_xml(colors: Dict[str, Union[str, Tuple[str, str]]], output_path: str, file_name: str) -> None:
+def generate_android_xml(colors: Dict[str, str], output_path: str, file_name: str,
+                         shard: Optional[Callable[[str], str]] = None) -> None:
     """生成Android XML文件
     
     Args:
-        colors: 颜色字典，值可以是字符串（颜色值或引用）或元组（颜色值，注释）
+        colors: 颜色字典，值为颜色值或引用
+        shard: 按名称返回分片名，传入时按分片写成多个文件
     """
-    xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
-    xml_content += '<resources>\n'
-
-    # 按名称排序
-    for name in sorted(colors.keys()):
-        color_data = colors[name]
-        
-        # 检查是否包含注释（跨模式引用的情况）
-        if isinstance(color_data, tuple):
-            color_value, comment = color_data
-            xml_content += f'    <color name="{name}">{color_value}</color>{comment}\n'
-        else:
-            xml_content += f'    <color name="{name}">{color_data}</color>\n'
+    lines = {name: f'    <color name="{name}">{value}</color>\n' for name, value in colors.items()}
+    write_color_xml(lines, output_path, file_name, shard)
 
-    xml_content += '</resources>'
-
-    # 确保输出目录存在
-    os.makedirs(output_path, exist_ok=True)
-
-    # 写入文件
-    file_path = os.path.join(output_path, file_name)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(xml_content)
 
-    print(f"Generated: {file_path}")
+def generate_color_token_xml(tokens: Dict[str, ColorToken], output_path: str, file_name: str,
+                             shard: Optional[Callable[[str], str]] = None) -> None:
+    """生成语义颜色XML文件，跨模式引用的令牌在行尾附带注释"""
+    lines = {name: f'    <color name="{name}">{token.value}</color>{token.comment}\n'
+             for name, token in tokens.items()}
+    write_color_xml(lines, output_path, file_name, shard)
 
 
-def generate_dimens_xml(dimensions: Dict[str, int], output_path: str, file_name: str) -> None:
-    """生成Android dimens.xml文件"""
-    xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
-    xml_content += '<resources>\n'
+def write_color_xml(lines: Dict[str, str], output_path: str, file_name: str,
+                    shard: Optional[Callable[[str], str]] = None) -> None:
+    """写出颜色XML，每个文件内按名称排序
 
-    # 按名称排序
-    for name in sorted(dimensions.keys()):
-        xml_content += f'    <dimen name="{name}">{dimensions[name]}dp</dimen>\n'
+    aapt2 以文件为单位编译资源，分片后一个令牌变化只需重新编译它所在的分片；分片只由名称决定，
+    内容不变的分片不会重写。切换单文件/分片输出时删除另一种形式留下的文件，避免资源重复定义。
+    """
+    stem = os.path.splitext(file_name)[0]
+    written = set()
+    if shard is None:
+        xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
+        xml_content += '<resources>\n'
+        xml_content += ''.join(lines[name] for name in sorted(lines))
+        xml_content += '</resources>'
+        write_resource_xml(xml_content, output_path, file_name)
+        written.add(file_name)
+    else:
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for name in sorted(lines):
+            groups[shard(name)].append(lines[name])
+        for group in sorted(groups):
+            shard_file = f"{stem}_{group}.xml"
+            xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
+            xml_content += f'{SHARD_MARKER}{group} -->\n'
+            xml_content += '<resources>\n'
+            xml_content += ''.join(groups[group])
+            xml_content += '</resources>'
+            write_resource_xml(xml_content, output_path, shard_file)
+            written.add(shard_file)
+
+    if not os.path.isdir(output_path):
+        return
+    for existing in sorted(os.listdir(output_path)):
+        path = os.path.join(output_path, existing)
+        if existing in written or not existing.endswith('.xml'):
+            continue
+        if existing == file_name or (existing.startswith(stem + '_') and is_color_shard(path)):
+            os.remove(path)
+            print(f"Removed: {path}")
 
-    xml_content += '</resources>'
 
+def write_resource_xml(xml_content: str, output_path: str, file_name: str) -> None:
+    """写入资源XML文件，内容与已有文件相同时不重写，保持修改时间不变以免触发增量编译"""
     # 确保输出目录存在
     os.makedirs(output_path, exist_ok=True)
 
-    # 写入文件
     file_path = os.path.join(output_path, file_name)
+    if os.path.exists(file_path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if f.read() == xml_content:
+                print(f"Unchanged: {file_path}")
+                return
+
+    # 写入文件
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
 
     print(f"Generated: {file_path}")
 
@@ -336,6 +428,7 @@ def generate_ordered_dimens_xml(dimensions: List[Tuple[str, int]], output_path:
     file_path = os.path.join(output_path, file_name)
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
 
     print(f"Generated: {file_path}")
 
@@ -358,41 +451,19 @@ def generate_ordered_semantic_dimens_xml(dimensions: List[Tuple[str, str]], outp
     file_path = os.path.join(output_path, file_name)
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
 
     print(f"Generated: {file_path}")
 
 
-def generate_semantic_dimens_xml(dimensions: Dict[str, int], output_path: str, file_name: str) -> None:
-    """生成Android dimens.xml文件"""
-    xml_content = '<?xml version="1.0" encoding="utf-8"?>\n'
-    xml_content += '<resources>\n'
-
-    # 按名称排序
-    for name in sorted(dimensions.keys()):
-        xml_content += f'    <dimen name="{name}">@dimen/{dimensions[name]}</dimen>\n'
-
-    xml_content += '</resources>'
-
-    # 确保输出目录存在
-    os.makedirs(output_path, exist_ok=True)
-
-    # 写入文件
-    file_path = os.path.join(output_path, file_name)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(xml_content)
-
-    print(f"Generated: {file_path}")
-
+def process_primitive_modes(data: Dict[str, Any], modes: Tuple[str, ...]) -> Dict[str, Dict[str, str]]:
+    """处理primitives模块，按模式提取颜色"""
+    colors_by_mode: Dict[str, Dict[str, str]] = {mode: {} for mode in modes}
 
-def process_primitives(data: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, str]]:
-    """处理primitives模块，提取颜色"""
-    light_colors = {}
-    dark_colors = {}
-    
     print("Extracting primitive colors...")
-    traverse_primitive_colors(data['primitives'], [], light_colors, dark_colors)
-    
-    return light_colors, dark_colors
+    traverse_primitive_colors(data['primitives'], [], colors_by_mode, modes)
+
+    return colors_by_mode
 
 
 def process_spacing_dimensions(data: Dict[str, Any]) -> List[Tuple[str, int]]:
@@ -409,52 +480,21 @@ def process_spacing_dimensions(data: Dict[str, Any]) -> List[Tuple[str, int]]:
 
 
 def generate_xml_files(light_colors: Dict[str, str], dark_colors: Dict[str, str], 
-                      output_dir: str) -> None:
-    """生成Android XML文件"""
+                      output_dir: str, shard: bool = False) -> None:
+    """生成Android XML文件，shard为True时按色阶分片"""
     print("Generating Android XML files...")
-    generate_android_xml(light_colors, os.path.join(output_dir, "values"), "primitive_color.xml")  # type: ignore
-    generate_android_xml(dark_colors, os.path.join(output_dir, "values-night"), "primitive_color.xml")  # type: ignore
-
-
-def resolve_color_reference(reference: str, primitive_color_map: Dict[str, str]) -> Optional[str]:
-    """解析颜色引用，从primitive color map中查找对应的颜色值"""
-    # 去除开头和结尾的花括号
-    if reference.startswith('{') and reference.endswith('}'):
-        reference = reference[1:-1]
-    
-    # 去掉light mode或dark mode
-    reference = re.sub(r'\s*\(light mode\)', '', reference)
-    reference = re.sub(r'\s*\(dark mode\)', '', reference)
-    
-    # 以点号分割路径
-    path_parts = reference.split('.')
-    
-    # 移除 'colors' 和 'base' 前缀
-    filtered_parts = []
-    for part in path_parts:
-        if part not in ['colors', 'base']:
-            filtered_parts.append(part)
-    
-    # 如果只剩一个部分，直接使用
-    if len(filtered_parts) == 1:
-        color_name = filtered_parts[0]
-    else:
-        # 否则使用最后两部分（处理类似 blue_dark_50 的情况）
-        color_name = '_'.join(filtered_parts[-2:])
-    
-    if color_name and color_name in primitive_color_map:
-        return primitive_color_map[color_name]
-    
-    print(f"Warning: Could not find color for reference '{reference}' -> '{color_name}'")
-    return None
+    group = primitive_group if shard else None
+    generate_android_xml(light_colors, os.path.join(output_dir, "values"), "primitive_color.xml", group)
+    generate_android_xml(dark_colors, os.path.join(output_dir, "values-night"), "primitive_color.xml", group)
 
 
-def resolve_color_reference_to_name(reference: str, primitive_color_map: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
+def resolve_color_reference_to_name(reference: str, primitive_color_map: Dict[str, str],
+                                    modes: Tuple[str, ...] = DEFAULT_MODES) -> Tuple[Optional[str], Optional[str]]:
     """解析颜色引用,返回primitive color的名称和模式信息
     
     Returns:
         Tuple[Optional[str], Optional[str]]: (颜色名称, 模式信息) 或 (None, None)
-        模式信息可以是 'light mode', 'dark mode' 或 None
+        模式信息为 modes 中的某个模式（如 'light mode'）或 None
     """
     # 去除开头和结尾的花括号
     if reference.startswith('{') and reference.endswith('}'):
@@ -466,9 +506,9 @@ def resolve_color_reference_to_name(reference: str, primitive_color_map: Dict[st
     
     # 如果引用以 "primitives." 开头,直接解析
     if reference.startswith('primitives.'):
-        color_name = resolve_primitives_reference(reference, primitive_color_map)
+        color_name = resolve_primitives_reference(reference, primitive_color_map, modes)
         # 提取模式信息
-        mode_info = extract_mode_from_reference(reference)
+        mode_info = extract_mode_from_reference(reference, modes)
         return color_name, mode_info
     
     # 如果引用以 "1. color modes" 开头,需要特殊处理
@@ -479,37 +519,35 @@ def resolve_color_reference_to_name(reference: str, primitive_color_map: Dict[st
     
     # 其他情况,尝试解析
     else:
-        color_name = resolve_primitives_reference(reference, primitive_color_map)
-        mode_info = extract_mode_from_reference(reference)
+        color_name = resolve_primitives_reference(reference, primitive_color_map, modes)
+        mode_info = extract_mode_from_reference(reference, modes)
         return color_name, mode_info
 
 
-def extract_mode_from_reference(reference: str) -> Optional[str]:
+def extract_mode_from_reference(reference: str, modes: Tuple[str, ...] = DEFAULT_MODES) -> Optional[str]:
     """从引用中提取模式信息
     
     Returns:
-        'light mode', 'dark mode' 或 None
+        引用带有的完整模式后缀对应的模式（如 '(dark mode)' -> 'dark mode'），没有时返回None
     """
-    if '(light mode)' in reference.lower():
-        return 'light mode'
-    elif '(dark mode)' in reference.lower():
-        return 'dark mode'
-    else:
-        return None
+    match = mode_suffix_pattern(modes).search(reference)
+    return match.group(1).lower() if match else None
 
 
-def resolve_primitives_reference(reference: str, primitive_color_map: Dict[str, str]) -> Optional[str]:
+def resolve_primitives_reference(reference: str, primitive_color_map: Dict[str, str],
+                                 modes: Tuple[str, ...] = DEFAULT_MODES) -> Optional[str]:
     """解析primitives引用"""
-    # 去掉light mode或dark mode后缀(在括号中的)
-    reference = re.sub(r'\s*\(light mode\)', '', reference)
-    reference = re.sub(r'\s*\(dark mode\)', '', reference)
+    tracer.count(LOOKUPS)
+    # 去掉模式后缀(在括号中的)
+    reference = mode_suffix_pattern(modes).sub('', reference)
     
     # 以点号分割路径
     path_parts = reference.split('.')
     
-    # 移除 'primitives', 'colors' 等前缀，但保留 'base'
+    # 移除 'primitives', 'colors' 和模式名等前缀，但保留 'base'
     filtered_parts = []
-    skip_keywords = ['primitives', 'colors', 'light mode', 'dark mode']
+    skip_keywords = {'primitives', 'colors', *modes}
+    cleaned_keywords = {keyword.replace(' ', '_') for keyword in skip_keywords}
     
     for part in path_parts:
         # 跳过需要移除的关键字
@@ -517,7 +555,7 @@ def resolve_primitives_reference(reference: str, primitive_color_map: Dict[str,
             continue
         # 替换空格为下划线（但要在判断后）
         cleaned_part = part.replace(' ', '_')
-        if cleaned_part and cleaned_part not in [kw.replace(' ', '_') for kw in skip_keywords]:
+        if cleaned_part and cleaned_part not in cleaned_keywords:
             filtered_parts.append(cleaned_part)
     
     # 特殊处理 base 下的颜色（white, black, transparent）
@@ -602,193 +640,321 @@ def generate_radius_xml(radius_values: Dict[str, str], output_dir: str) -> None:
     output_path = os.path.join(output_dir, 'radius_dimens.xml')
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
     print(f"Generated radius_dimens.xml with {len(radius_values)} radius values")
 
-def collect_base_names(data: Dict[str, Any], path: List[str], base_names: Dict[str, int]) -> None:
-    """收集所有基础名称（不带括号数字），统计在同一模式下的出现次数"""
+# 生成Kotlin代码使用的包名
+KOTLIN_PACKAGE = "com.example.design.tokens"
+
+# radius_2xl -> TWO_XL
+NUMBER_WORDS = {'2': 'TWO', '3': 'THREE', '4': 'FOUR', '5': 'FIVE', '6': 'SIX', '7': 'SEVEN', '8': 'EIGHT', '9': 'NINE'}
+
+
+def format_radius_enum_name(xml_name: str) -> str:
+    """将半径资源名转换为枚举常量名，如 radius_xxs -> XXS，radius_2xl -> TWO_XL"""
+    name = xml_name[len('radius_'):] if xml_name.startswith('radius_') else xml_name
+    match = re.match(r'^(\d)([a-z].*)$', name)
+    if match and match.group(1) in NUMBER_WORDS:
+        name = f"{NUMBER_WORDS[match.group(1)]}_{match.group(2)}"
+    return re.sub(r'[^A-Za-z0-9]+', '_', name).upper()
+
+
+def generate_radius_kotlin(radius_values: Dict[str, str], output_dir: str) -> None:
+    """根据半径令牌生成 ktClass/AppRadius.kt
+
+    枚举按数值排序；fromValue 在预先排好序的 IntArray 上二分查找，fromDimenRes 使用初始化时
+    构建的 HashMap，都不再逐项扫描 entries。dp 值和按密度换算的 px 表也预先算好。
+    """
+    entries = []
+    for xml_name, value in radius_values.items():
+        number = float(value[:-2] if value.endswith('dp') else value)
+        entries.append((int(round(number)), format_radius_enum_name(xml_name), xml_name))
+    entries.sort()
+    if not entries:
+        print("No radius values found, skipping AppRadius.kt")
+        return
+
+    names = [name for _, name, _ in entries]
+    default = 'MD' if 'MD' in names else names[0]
+
+    # fromValue 的查找表：去重后的数值和对应的第一个枚举下标
+    keys: List[int] = []
+    indexes: List[int] = []
+    for index, (number, _, _) in enumerate(entries):
+        if not keys or keys[-1] != number:
+            keys.append(number)
+            indexes.append(index)
+
+    lines = [
+        f"package {KOTLIN_PACKAGE}",
+        "",
+        "// Generated by tokens.py from the \"2. radius\" tokens. Do not edit by hand.",
+        "",
+        "enum class AppRadius(",
+        "    val value: Int,",
+        "    val dimenRes: Int",
+        ") {",
+    ]
+    for position, (number, name, xml_name) in enumerate(entries):
+        terminator = ';' if position == len(entries) - 1 else ','
+        lines.append(f"    {name}({number}, R.dimen.{xml_name}){terminator}")
+    lines += [
+        "",
+        "    /** Radius in dp as a float, so drawing code does not convert on every frame. */",
+        "    val dp: Float = value.toFloat()",
+        "",
+        "    /** Radius in px for the given display density. */",
+        "    fun toPx(density: Float): Float = pxTable(density)[ordinal]",
+        "",
+        "    companion object {",
+        "        private val ENTRIES = values()",
+        "",
+        "        // Sorted distinct radius values and the entry index for each one",
+        f"        private val VALUE_KEYS = intArrayOf({', '.join(str(k) for k in keys)})",
+        f"        private val VALUE_INDEXES = intArrayOf({', '.join(str(i) for i in indexes)})",
+        "",
+        "        // R.dimen ids are only known at runtime, so this map is built once on first use",
+        "        private val BY_DIMEN_RES: Map<Int, AppRadius> by lazy {",
+        "            HashMap<Int, AppRadius>(ENTRIES.size * 2).apply { ENTRIES.forEach { put(it.dimenRes, it) } }",
+        "        }",
+        "",
+        "        // Density and its table are published together, so a reader never pairs one density with",
+        "        // another density's table",
+        "        private class PxTable(val density: Float, val px: FloatArray)",
+        "",
+        "        @Volatile private var pxCache: PxTable? = null",
+        "",
+        "        /** Pixel radii indexed by ordinal, cached for the last density seen. Do not modify. */",
+        "        fun pxTable(density: Float): FloatArray {",
+        "            val cached = pxCache",
+        "            if (cached != null && cached.density == density) return cached.px",
+        "            val table = PxTable(density, FloatArray(ENTRIES.size) { ENTRIES[it].value * density })",
+        "            pxCache = table",
+        "            return table.px",
+        "        }",
+        "",
+        "        fun fromValue(value: Int): AppRadius {",
+        "            val index = VALUE_KEYS.binarySearch(value)",
+        f"            return if (index >= 0) ENTRIES[VALUE_INDEXES[index]] else {default}",
+        "        }",
+        "",
+        "        fun fromDimenRes(res: Int): AppRadius {",
+        f"            return BY_DIMEN_RES[res] ?: {default}",
+        "        }",
+        "    }",
+        "}",
+    ]
+    content = '\n'.join(lines) + '\n'
+
+    kt_dir = os.path.join(output_dir, "ktClass")
+    os.makedirs(kt_dir, exist_ok=True)
+    file_path = os.path.join(kt_dir, "AppRadius.kt")
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    tracer.count_written(content)
+    print(f"Generated: {file_path} ({len(entries)} radius values)")
+
+
+def collect_semantic_names(data: Dict[str, Any], path: List[str], identity_path: List[str],
+                           identities: Dict[Tuple[str, ...], str], candidates: Dict[str, List[str]],
+                           modes: Tuple[str, ...] = DEFAULT_MODES, mode: Optional[str] = None) -> None:
+    """收集语义颜色的令牌身份和候选名称
+
+    Args:
+        identity_path: 去掉模式节点的路径，日夜间同一令牌得到相同身份
+        identities: 完整路径 -> 令牌身份
+        candidates: 令牌身份 -> [基础名称, 基础名称_括号数字]
+    """
     for key, value in data.items():
+        if not isinstance(value, dict):
+            continue
         current_path = path + [key]
-        
-        if isinstance(value, dict):
-            if 'value' in value and isinstance(value['value'], str):
-                # 这是一个颜色节点，计算其基础名称
-                # 使用 existing_names=None 来获取不带括号数字的基础名称
-                base_name = format_xml_name(current_path, existing_names=None)
-                
-                # 根据路径判断是light mode还是dark mode，分别统计
-                path_str = ' '.join(current_path).lower()
-                if 'light mode' in path_str:
-                    key_name = f"light:{base_name}"
-                elif 'dark mode' in path_str:
-                    key_name = f"dark:{base_name}"
-                else:
-                    key_name = f"unknown:{base_name}"
-                
-                base_names[key_name] = base_names.get(key_name, 0) + 1
-            else:
-                # 继续递归
-                collect_base_names(value, current_path, base_names)
+        node_mode = mode or match_mode(key, modes)
+        current_identity_path = identity_path if node_mode and not mode else identity_path + [key]
+        if 'value' in value and isinstance(value['value'], str):
+            if node_mode is None:
+                continue
+            identity = token_identity(current_identity_path, value)
+            identities[tuple(current_path)] = identity
+            if identity not in candidates:
+                base_name = format_xml_name(current_path)
+                suffixed_name = format_xml_name(current_path, {base_name})
+                candidates[identity] = [base_name] if suffixed_name == base_name else [base_name, suffixed_name]
+        else:
+            collect_semantic_names(value, current_path, current_identity_path, identities, candidates,
+                                   modes, node_mode)
 
 
 def traverse_semantic_colors(full_data:Dict[str,Any], data: Dict[str, Any], path: List[str],
-                             light_semantic: Dict[str, Union[str, Tuple[str, str]]],
-                             dark_semantic: Dict[str, Union[str, Tuple[str, str]]],
+                             semantic_by_mode: Dict[str, Dict[str, ColorToken]],
                              primitive_color_map: Dict[str, str],
-                             light_primitive_map: Dict[str, str],
-                             dark_primitive_map: Dict[str, str],
-                             existing_names: Optional[Set[str]] = None,
-                             light_added_names: Optional[Set[str]] = None,
-                             dark_added_names: Optional[Set[str]] = None) -> None:
+                             primitives_by_mode: Dict[str, Dict[str, str]],
+                             modes: Tuple[str, ...] = DEFAULT_MODES,
+                             mode: Optional[str] = None,
+                             added_names: Optional[Dict[str, Set[str]]] = None,
+                             assigned_names: Optional[Dict[Tuple[str, ...], str]] = None) -> None:
     """遍历语义颜色节点
     
     Args:
         full_data: 完整的JSON数据
         data: 当前需要遍历的数据
         path: 当前路径
-        light_semantic: 日间模式语义颜色字典
-        dark_semantic: 夜间模式语义颜色字典
+        semantic_by_mode: 模式 -> 语义颜色字典
         primitive_color_map: 基础颜色映射（合并的）
-        light_primitive_map: 日间模式基础颜色映射
-        dark_primitive_map: 夜间模式基础颜色映射
-        existing_names: 冲突的基础名称集合
-        light_added_names: 日间模式已添加的名称
-        dark_added_names: 夜间模式已添加的名称
+        primitives_by_mode: 模式 -> 基础颜色映射
+        modes: 所有模式
+        mode: 祖先节点确定的模式（集合下的 'light mode' 等子节点），每个节点只匹配一次
+        added_names: 模式 -> 已添加的名称
+        assigned_names: 完整路径 -> 名称注册表分配的资源名，没有时按已添加的名称追加后缀
     """
-    if light_added_names is None:
-        light_added_names = set()
-    if dark_added_names is None:
-        dark_added_names = set()
+    if added_names is None:
+        added_names = {}
+    if assigned_names is None:
+        assigned_names = {}
     
+    tracer.count(NODES_VISITED, len(data))
     for key, value in data.items():
         current_path = path + [key]
         
         if isinstance(value, dict):
+            node_mode = mode or match_mode(key, modes)
             if 'value' in value and isinstance(value['value'], str):
-                # 这是一个颜色节点
+                # 这是一个颜色节点，不属于任何模式时跳过
+                if node_mode is None:
+                    continue
                 reference = value['value']
                 
-                # 根据路径判断是light mode还是dark mode
-                path_str = ' '.join(current_path).lower()
-                is_light_mode = 'light mode' in path_str
-                is_dark_mode = 'dark mode' in path_str
-                
-                # 选择对应模式的 added_names
-                current_added_names = light_added_names if is_light_mode else (dark_added_names if is_dark_mode else set())
+                semantic = semantic_by_mode.setdefault(node_mode, {})
+                current_added_names = added_names.setdefault(node_mode, set())
+                provenance = '.'.join(current_path)
+                raw_value = reference
                 
                 # 判断是直接的颜色值还是引用
                 if reference.startswith('#'):
                     # 直接的颜色值，提取并去掉透明度（如果是8位）
                     color_value = extract_color_value(reference)
-                    xml_name = format_xml_name(current_path, current_added_names)
-                    
-                    if is_light_mode:
-                        light_semantic[xml_name] = color_value
-                        light_added_names.add(xml_name)
-                    elif is_dark_mode:
-                        dark_semantic[xml_name] = color_value
-                        dark_added_names.add(xml_name)
+                    xml_name = (assigned_names.get(tuple(current_path))
+                                or format_xml_name(current_path, current_added_names))
+                    semantic[xml_name] = ColorToken(xml_name, node_mode, raw_value, color_value,
+                                                    argb=parse_hex_color(color_value), provenance=provenance)
+                    current_added_names.add(xml_name)
                 else:
                     # 这是一个颜色引用
                     if reference.startswith('{1. color modes'): #说明引用的是color modes下的节点，找到这个节点读取其value属性。
                         reference = get_node_value(full_data, reference[1:-1])
-                    primitive_color_name, ref_mode = resolve_color_reference_to_name(reference, primitive_color_map)
+                    primitive_color_name, ref_mode = resolve_color_reference_to_name(reference, primitive_color_map,
+                                                                                     modes)
                     
                     if primitive_color_name:
-                        xml_name = format_xml_name(current_path, current_added_names)
+                        xml_name = (assigned_names.get(tuple(current_path))
+                                    or format_xml_name(current_path, current_added_names))
                         
                         # 检查是否存在跨模式引用
-                        current_mode = 'light mode' if is_light_mode else 'dark mode'
-                        is_cross_mode = ref_mode and ref_mode != current_mode
+                        is_cross_mode = ref_mode and ref_mode != node_mode
                         
                         if is_cross_mode:
                             # 跨模式引用：使用直接颜色值而非引用
                             # 从对应模式的primitive map中获取颜色值
-                            target_map = dark_primitive_map if ref_mode == 'dark mode' else light_primitive_map
+                            target_map = primitives_by_mode.get(ref_mode, {})
                             if primitive_color_name in target_map:
                                 color_value = target_map[primitive_color_name]
                                 comment = f"  <!-- {primitive_color_name} ({ref_mode}) -->"
-                                
-                                if is_light_mode:
-                                    light_semantic[xml_name] = (color_value, comment)
-                                    light_added_names.add(xml_name)
-                                elif is_dark_mode:
-                                    dark_semantic[xml_name] = (color_value, comment)
-                                    dark_added_names.add(xml_name)
+                                semantic[xml_name] = ColorToken(xml_name, node_mode, raw_value, color_value,
+                                                                argb=parse_hex_color(color_value),
+                                                                alias=primitive_color_name, comment=comment,
+                                                                provenance=provenance)
+                                current_added_names.add(xml_name)
                             else:
                                 print(f"Warning: Cross-mode color '{primitive_color_name}' not found in {ref_mode} primitive map")
                         else:
                             # 同模式引用：使用@color引用
                             color_reference = f"@color/{primitive_color_name}"
-                            
-                            if is_light_mode:
-                                light_semantic[xml_name] = color_reference
-                                light_added_names.add(xml_name)
-                            elif is_dark_mode:
-                                dark_semantic[xml_name] = color_reference
-                                dark_added_names.add(xml_name)
+                            primitive_value = primitives_by_mode.get(node_mode, {}).get(primitive_color_name)
+                            semantic[xml_name] = ColorToken(xml_name, node_mode, raw_value, color_reference,
+                                                            argb=parse_hex_color(primitive_value) if primitive_value else None,
+                                                            alias=primitive_color_name, provenance=provenance)
+                            current_added_names.add(xml_name)
             else:
                 # 继续递归
-                traverse_semantic_colors(full_data, value, current_path, light_semantic,
-                                         dark_semantic, primitive_color_map, light_primitive_map,
-                                         dark_primitive_map, existing_names, 
-                                         light_added_names, dark_added_names)
+                traverse_semantic_colors(full_data, value, current_path, semantic_by_mode,
+                                         primitive_color_map, primitives_by_mode, modes,
+                                         node_mode, added_names, assigned_names)
+
 
+def process_semantic_modes(data: Dict[str, Any], primitive_color_map: Dict[str, str],
+                           primitives_by_mode: Dict[str, Dict[str, str]],
+                           modes: Tuple[str, ...] = DEFAULT_MODES,
+                           registry: Optional[NameRegistry] = None) -> Dict[str, Dict[str, ColorToken]]:
+    """处理color modes节点，按模式提取语义颜色
 
-def process_color_modes(data: Dict[str, Any], primitive_color_map: Dict[str, str],
-                       light_primitive_map: Dict[str, str],
-                       dark_primitive_map: Dict[str, str]) -> Tuple[Dict[str, Union[str, Tuple[str, str]]], Dict[str, Union[str, Tuple[str, str]]]]:
-    """处理color modes节点，提取语义颜色"""
-    light_semantic = {}
-    dark_semantic = {}
+    资源名由名称注册表按令牌身份分配，不依赖节点顺序；不传注册表时使用不落盘的空注册表。
+    """
+    semantic_by_mode: Dict[str, Dict[str, ColorToken]] = {mode: {} for mode in modes}
     
     # 检查可能的color modes键名
-    color_modes_key = None
-    for key in data.keys():
-        if 'color modes' in key.lower():
-            color_modes_key = key
-            break
-    
+    color_modes_key = find_color_modes_key(data)
     if color_modes_key is None:
         print("Warning: 'color modes' not found in JSON")
-        return light_semantic, dark_semantic
+        return semantic_by_mode
     
     print("Processing semantic colors...")
     
-    # 第一步：收集所有基础名称，统计在同一模式下的出现次数
-    base_names = {}
-    collect_base_names(data[color_modes_key], [], base_names)
-    
-    # 找出每个模式下出现多次的名称（需要解决冲突）
-    conflicting_names = set()
-    for key_name, count in base_names.items():
-        if count > 1:
-            # 提取基础名称（去掉 light: 或 dark: 前缀）
-            if ':' in key_name:
-                base_name = key_name.split(':', 1)[1]
-                conflicting_names.add(base_name)
-                # 调试输出
-                # print(f"Conflict detected: {key_name} (count: {count}) -> {base_name}")
-    
-    # 第二步：遍历并生成颜色，传入冲突名称集合和分离的primitive maps
-    traverse_semantic_colors(data, data[color_modes_key], [], light_semantic,
-                           dark_semantic, primitive_color_map, light_primitive_map,
-                           dark_primitive_map, conflicting_names)
-    
-    return light_semantic, dark_semantic
-
-
-def generate_semantic_xml_files(light_semantic: Dict[str, Union[str, Tuple[str, str]]], 
-                               dark_semantic: Dict[str, Union[str, Tuple[str, str]]], 
-                               output_dir: str) -> None:
-    """生成语义颜色XML文件"""
+    identities: Dict[Tuple[str, ...], str] = {}
+    candidates: Dict[str, List[str]] = {}
+    collect_semantic_names(data[color_modes_key], [], [], identities, candidates, modes)
+    registry = registry or NameRegistry()
+    names = registry.assign(candidates)
+    for identity, old_name, new_name in registry.renamed:
+        print(f"Warning: renamed {identity}: {old_name} -> {new_name}")
+    assigned_names = {path: names[identity] for path, identity in identities.items()}
+
+    traverse_semantic_colors(data, data[color_modes_key], [], semantic_by_mode,
+                             primitive_color_map, primitives_by_mode, modes,
+                             assigned_names=assigned_names)
+    
+    return semantic_by_mode
+
+
+def generate_mode_xml_files(primitives_by_mode: Dict[str, Dict[str, str]],
+                            semantic_by_mode: Dict[str, Dict[str, ColorToken]],
+                            mode_qualifiers: Dict[str, str], output_dir: str,
+                            shard: bool = False) -> List[str]:
+    """为日间/夜间以外的模式生成原子和语义颜色XML，写入各自的资源目录
+
+    Returns:
+        已生成的模式
+    """
+    generated = []
+    for mode, semantic in semantic_by_mode.items():
+        if mode in DEFAULT_MODE_QUALIFIERS:
+            continue
+        directory = mode_qualifiers.get(mode)
+        if directory is None:
+            print(f"Warning: no resource qualifier for mode '{mode}', skipping "
+                  f"(use --mode-qualifier '{mode}=values-...')")
+            continue
+        mode_dir = os.path.join(output_dir, directory)
+        print(f"Generating {mode} color XML files in {mode_dir}...")
+        generate_android_xml(primitives_by_mode.get(mode, {}), mode_dir, "primitive_color.xml",
+                             primitive_group if shard else None)
+        generate_color_token_xml(semantic, mode_dir, "semantic_color.xml", semantic_category if shard else None)
+        generated.append(mode)
+    return generated
+
+
+def generate_semantic_xml_files(light_semantic: Dict[str, ColorToken], 
+                               dark_semantic: Dict[str, ColorToken], 
+                               output_dir: str, shard: bool = False) -> None:
+    """生成语义颜色XML文件，shard为True时按 text/bg/border/fg 等分类分片"""
     print("Generating semantic color XML files...")
-    generate_android_xml(light_semantic, os.path.join(output_dir, "values"), "semantic_color.xml")
-    generate_android_xml(dark_semantic, os.path.join(output_dir, "values-night"), "semantic_color.xml")
+    category = semantic_category if shard else None
+    generate_color_token_xml(light_semantic, os.path.join(output_dir, "values"), "semantic_color.xml", category)
+    generate_color_token_xml(dark_semantic, os.path.join(output_dir, "values-night"), "semantic_color.xml", category)
 
 
 def print_summary(light_colors: Dict[str, str], dark_colors: Dict[str, str],
-                  light_semantic: Dict[str, Union[str, Tuple[str, str]]], 
-                  dark_semantic: Dict[str, Union[str, Tuple[str, str]]],
+                  light_semantic: Dict[str, ColorToken], 
+                  dark_semantic: Dict[str, ColorToken],
                   output_dir: str) -> None:
     """打印处理结果摘要"""
     print(f"\nSummary:")
@@ -809,17 +975,205 @@ def process_semantic_spacing(data:Dict[str,Any]):
 
     return semantic_dimens
 
-def main():
+def write_token_resources(output_dir: str,
+                          light_colors: Dict[str, str], dark_colors: Dict[str, str],
+                          light_semantic: Dict[str, ColorToken],
+                          dark_semantic: Dict[str, ColorToken],
+                          dimensions: List[Tuple[str, int]],
+                          semantic_dimensions: List[Tuple[str, str]],
+                          gradients: Dict[str, GradientToken],
+                          radius_values: Dict[str, str],
+                          typography_styles: Dict[str, Dict[str, str]],
+                          text_sizes: Dict[str, int],
+                          font_indexes: Optional[Dict[str, Any]] = None,
+                          shard_colors: bool = False) -> None:
+    """将解析结果写成一套完整的Android资源"""
+    values_dir = os.path.join(output_dir, "values")
+    generate_xml_files(light_colors, dark_colors, output_dir, shard_colors)
+    generate_semantic_xml_files(light_semantic, dark_semantic, output_dir, shard_colors)
+    generate_ordered_dimens_xml(dimensions, values_dir, "dimens.xml")
+    generate_ordered_semantic_dimens_xml(semantic_dimensions, values_dir, "semantic_dimens.xml")
+    generate_gradient_xml_files(gradients, output_dir)
+    generate_radius_xml(radius_values, values_dir)
+    generate_radius_kotlin(radius_values, output_dir)
+    generate_typography_xml_files(typography_styles, output_dir, font_indexes)
+    generate_text_dimens_xml(text_sizes, output_dir)
+
+
+def build_snapshot_entries(light_colors: Dict[str, str], dark_colors: Dict[str, str],
+                           light_semantic: Dict[str, ColorToken],
+                           dark_semantic: Dict[str, ColorToken],
+                           dimensions: List[Tuple[str, int]],
+                           semantic_dimensions: List[Tuple[str, str]],
+                           radius_values: Dict[str, str],
+                           text_sizes: Dict[str, int]) -> List[SnapshotEntry]:
+    """整理快照记录 (名称, 类型, 日间值, 夜间值)，值与写入XML的内容一致（不含跨模式注释）"""
+    def plain(token: Optional[ColorToken]) -> Optional[str]:
+        return token.value if token else None
+
+    entries: List[SnapshotEntry] = []
+    for name in sorted(set(light_colors) | set(dark_colors)):
+        entries.append((name, TYPE_PRIMITIVE_COLOR, light_colors.get(name), dark_colors.get(name)))
+    for name in sorted(set(light_semantic) | set(dark_semantic)):
+        entries.append((name, TYPE_SEMANTIC_COLOR, plain(light_semantic.get(name)), plain(dark_semantic.get(name))))
+    for name, value in dimensions:
+        entries.append((name, TYPE_DIMEN, str(value), str(value)))
+    for name, value in semantic_dimensions:
+        entries.append((name, TYPE_SEMANTIC_DIMEN, str(value), str(value)))
+    for name, value in radius_values.items():
+        entries.append((name, TYPE_RADIUS, str(value), str(value)))
+    for name, value in text_sizes.items():
+        entries.append((name, TYPE_TEXT_SIZE, str(value), str(value)))
+    return entries
+
+
+# 与品牌无关的令牌层，brands.py 解析一次后通过 resolve_token_model 的 layers 参数共享
+SHARED_LAYERS = ('dimensions', 'semantic_dimensions', 'gradients', 'radius_values', 'typography_styles',
+                 'text_sizes')
+
+
+def process_shared_layers(data: Dict[str, Any]) -> Dict[str, Any]:
+    """解析尺寸、渐变、圆角和文字样式，键与 ResolvedTokens 的字段名相同"""
+    return {
+        'dimensions': process_spacing_dimensions(data),
+        'semantic_dimensions': process_semantic_spacing(data),
+        'gradients': process_gradients(data),
+        'radius_values': process_radius_data(data),
+        'typography_styles': process_typography_data(data),
+        'text_sizes': process_font_sizes(data),
+    }
+
+
+def resolve_token_model(data: Dict[str, Any], source: str, registry: NameRegistry,
+                        merge_map_file: Optional[str] = DEFAULT_MERGE_MAP_FILE,
+                        font_indexes: Optional[Dict[str, Any]] = None,
+                        primitives_by_mode: Optional[Dict[str, Dict[str, str]]] = None,
+                        layers: Optional[Dict[str, Any]] = None,
+                        save_registry: bool = True) -> ResolvedTokens:
+    """将令牌JSON解析为完整的只读模型
+
+    从语义颜色集合发现所有模式，按模式解析原子颜色和语义颜色（资源名取自注册表），
+    应用 palette_dedupe.py 记录的原子颜色合并，推导夜间缺失的颜色，再解析尺寸、渐变、圆角和文字样式。
+
+    Args:
+        primitives_by_mode: 已解析（如套用了品牌色阶）的原子颜色，不传时从JSON解析；不会被修改
+        layers: process_shared_layers 的结果，不传时从JSON解析
+        save_registry: 是否写回名称注册表；brands.py 的工作进程只读取
+    """
+    modes = discover_modes(data)
+    if len(modes) > len(DEFAULT_MODES):
+        print(f"Modes: {', '.join(modes)}")
+
+    # 处理primitives模块
+    if primitives_by_mode is None:
+        with tracer.span('walk', module='primitives'):
+            primitives_by_mode = process_primitive_modes(data, modes)
+    else:
+        # 合并映射会删除原子颜色，复制一份，调用方共享的颜色保持不变
+        primitives_by_mode = {mode: dict(primitives_by_mode.get(mode, {})) for mode in modes}
+    light_colors, dark_colors = primitives_by_mode[LIGHT_MODE], primitives_by_mode[DARK_MODE]
+
+    # 创建primitive color map，合并所有模式的颜色（后面的模式覆盖前面的同名颜色）
+    primitive_color_map = {}
+    for colors in primitives_by_mode.values():
+        primitive_color_map.update(colors)
+
+    # 处理color modes模块（语义颜色），传入分模式的primitive maps；资源名沿用注册表中登记的名称
+    with tracer.span('resolve', module='color modes'):
+        semantic_by_mode = process_semantic_modes(data, primitive_color_map, primitives_by_mode, modes, registry)
+    if save_registry:
+        registry.save()
+    # 应用 palette_dedupe.py 记录的原子颜色合并，语义颜色改为引用保留的颜色
+    merged = load_merge_map(merge_map_file)
+    if merged:
+        removed, rewritten = apply_merge_map(primitives_by_mode, semantic_by_mode, merged)
+        print(f"Applied merge map {merge_map_file}: removed {removed} primitive colors, "
+              f"rewrote {rewritten} semantic references")
+    # 夜间缺失的语义颜色由日间颜色推导，并在XML中标注 derived
+    with tracer.span('resolve', module='derived dark colors'):
+        fill_missing_dark_tokens(semantic_by_mode[LIGHT_MODE], semantic_by_mode[DARK_MODE], light_colors, dark_colors)
+
+    if layers is None:
+        with tracer.span('walk', module='dimensions, gradients, typography'):
+            layers = process_shared_layers(data)
+    return ResolvedTokens(source, primitives_by_mode, semantic_by_mode,
+                          *(layers[name] for name in SHARED_LAYERS), font_indexes)
+
+
+def run_token_pipeline(data: Dict[str, Any], source: str, output_dir: str, registry: NameRegistry,
+                       targets: Optional[List[str]] = None, options: Optional[Dict[str, Any]] = None,
+                       merge_map_file: Optional[str] = DEFAULT_MERGE_MAP_FILE,
+                       font_indexes: Optional[Dict[str, Any]] = None
+                       ) -> Tuple[ResolvedTokens, List[Tuple[str, List[str], float]]]:
+    """tokens.py 和 watch.py 共用的流水线：解析模型、渲染导出目标并检查语义颜色对比度
+
+    Args:
+        targets: 导出目标，默认 DEFAULT_TARGETS
+        options: 传给导出目标的选项（shard_colors、mode_qualifiers）
+
+    Returns:
+        (模型, 各目标的 (目标名, 写入的文件, 耗时秒))
+    """
+    model = resolve_token_model(data, source, registry, merge_map_file, font_indexes)
+
+    # 所有导出目标共享同一个只读模型（默认只有Android XML）
+    with tracer.span('emit', output=output_dir):
+        results = export_targets(model, list(targets or DEFAULT_TARGETS), output_dir, options)
+
+    with tracer.span('check_contrast'):
+        check_semantic_contrast(model.semantic(LIGHT_MODE), model.semantic(DARK_MODE),
+                                model.primitives(LIGHT_MODE), model.primitives(DARK_MODE))
+    return model, results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Generate Android resources from design tokens JSON')
+    parser.add_argument('--tokens', default='design-tokens.tokens(5).json',
+                        help='Token JSON file (default: design-tokens.tokens(5).json)')
+    parser.add_argument('--output-dir', default='.',
+                        help='Directory that receives values/, values-night/ and gradients/ (default: .)')
+    parser.add_argument('--mode-qualifier', action='append', default=[], metavar='MODE=DIR',
+                        help="Resource directory for an extra mode, e.g. 'high contrast mode=values-v31'; "
+                             "repeat for several modes (light/dark always use values/ and values-night/)")
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='Also write a binary token snapshot for theme.py/aucolorKt.py --snapshot')
+    parser.add_argument('--shard-colors', action='store_true',
+                        help='Split primitive colors by ramp and semantic colors by category into separate '
+                             'files so aapt2 recompiles only the shard that changed')
+    parser.add_argument('--name-registry', default=DEFAULT_REGISTRY_FILE, metavar='FILE',
+                        help=f'Persisted token -> resource name registry (default: {DEFAULT_REGISTRY_FILE})')
+    parser.add_argument('--merge-map', default=DEFAULT_MERGE_MAP_FILE, metavar='FILE',
+                        help=f'Primitive merges recorded by palette_dedupe.py --merge, applied before emitting '
+                             f'(default: {DEFAULT_MERGE_MAP_FILE}, ignored when missing)')
+    parser.add_argument('--static-dir', default='static',
+                        help='Font directory used to bind typography styles to font files (default: static)')
+    parser.add_argument('--variable-font', action='append', default=[],
+                        help='Variable font file outside --static-dir (see generate_android_fonts.py '
+                             '--variable-font); its family gets values-v26 text styles')
+    parser.add_argument('--target', action='append', choices=sorted(EXPORT_TARGETS), default=[],
+                        help=f"Export target to render from the resolved tokens; repeat for several, they render "
+                             f"concurrently (default: {', '.join(DEFAULT_TARGETS)})")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    try:
+        mode_qualifiers = parse_mode_qualifiers(args.mode_qualifier)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
     # JSON文件路径
-    json_file = "design-tokens.tokens(5).json"
+    json_file = args.tokens
 
-    # 输出目录 - 使用当前目录
-    output_dir = "."
+    # 输出目录 - 默认使用当前目录
+    output_dir = args.output_dir
 
     # 加载JSON文件
     print("Loading JSON file...")
     try:
-        data = load_json_file(json_file)
+        with tracer.span('load', file=json_file):
+            data = load_json_file(json_file)
     except FileNotFoundError:
         print(f"Error: File not found: {json_file}")
         return
@@ -832,47 +1186,32 @@ def main():
         print("Error: 'primitives' module not found in JSON")
         return
 
-    # 处理primitives模块
-    light_colors, dark_colors = process_primitives(data)
-    
-    # 创建primitive color map，合并light和dark模式的所有颜色
-    primitive_color_map = {}
-    primitive_color_map.update(light_colors)
-    primitive_color_map.update(dark_colors)
-    
-        
-    # 处理color modes模块（语义颜色），传入分离的light和dark primitive maps
-    light_semantic, dark_semantic = process_color_modes(data, primitive_color_map,
-                                                       light_colors, dark_colors)
-    
-    # 处理spacing尺寸
-    dimensions = process_spacing_dimensions(data)
-    semantic_dimensions = process_semantic_spacing(data)
-    # 处理渐变
-    gradients = process_gradients(data)
-    # 处理半径
-    radius_values = process_radius_data(data)
-    # 处理typography
-    typography_styles = process_typography_data(data)
-    # 处理font sizes
-    text_sizes = process_font_sizes(data)
-
-    # 生成XML文件
-    generate_xml_files(light_colors, dark_colors, output_dir)
-    generate_semantic_xml_files(light_semantic, dark_semantic, output_dir)
-    generate_ordered_dimens_xml(dimensions, os.path.join(output_dir, "values"), "dimens.xml")
-    generate_ordered_semantic_dimens_xml(semantic_dimensions,os.path.join(output_dir,"values"),"semantic_dimens.xml")
-    generate_gradient_xml_files(gradients, output_dir)
-    generate_radius_xml(radius_values, os.path.join(output_dir, "values"))
-    generate_typography_xml_files(typography_styles, output_dir)
-    generate_text_dimens_xml(text_sizes, output_dir)
-    
+    # 解析、渲染导出目标并检查对比度
+    registry = NameRegistry(args.name_registry)
+    model, results = run_token_pipeline(data, json_file, output_dir, registry,
+                                        list(dict.fromkeys(args.target)),
+                                        {'shard_colors': args.shard_colors, 'mode_qualifiers': mode_qualifiers},
+                                        args.merge_map, build_font_weight_indexes(args.static_dir, args.variable_font))
+    light_colors, dark_colors = model.primitives(LIGHT_MODE), model.primitives(DARK_MODE)
+    light_semantic, dark_semantic = model.semantic(LIGHT_MODE), model.semantic(DARK_MODE)
+
+    if args.snapshot:
+        with tracer.span('emit', file=args.snapshot):
+            entries = build_snapshot_entries(light_colors, dark_colors, light_semantic, dark_semantic,
+                                             model.dimensions, model.semantic_dimensions, model.radius_values,
+                                             model.text_sizes)
+            count = write_snapshot(args.snapshot, entries, json_file)
+        print(f"Generated snapshot: {args.snapshot} ({count} tokens)")
+
     # 打印摘要
     print_summary(light_colors, dark_colors, light_semantic, dark_semantic, output_dir)
-    print(f"Spacing dimensions: {len(dimensions)}")
-    print(f"Gradients: {len(gradients)}")
-    print(f"Radius values: {len(radius_values)}")
-    print(f"Typography styles: {len(typography_styles)}")
+    print(f"Spacing dimensions: {len(model.dimensions)}")
+    print(f"Gradients: {len(model.gradients)}")
+    print(f"Radius values: {len(model.radius_values)}")
+    print(f"Typography styles: {len(model.typography_styles)}")
+    print_timings(results)
+
+    finish_from_args(args)
 
 
 def is_gradient_node(node: Dict[str, Any]) -> bool:
@@ -905,17 +1244,9 @@ def format_gradient_name(parent_name: str, node_name: str) -> str:
 
 def generate_android_gradient_xml(gradient_name: str, rotation: float, start_color: str, end_color: str) -> str:
     """生成单个Android渐变XML内容"""
-    # 确保颜色值格式正确
-    if not start_color.startswith('#'):
-        start_color = f"#{start_color}"
-    if not end_color.startswith('#'):
-        end_color = f"#{end_color}"
-    
-    # 处理8位颜色值（包含透明度）
-    if len(start_color) == 9:
-        start_color = start_color[:7]  # 去掉透明度
-    if len(end_color) == 9:
-        end_color = end_color[:7]  # 去掉透明度
+    # 确保颜色值格式正确，并去掉8位颜色值中的透明度
+    start_color = to_opaque_rgb_hex(start_color)
+    end_color = to_opaque_rgb_hex(end_color)
     
     xml_content = f'''<?xml version="1.0" encoding="utf-8"?>
 <shape xmlns:android="http://schemas.android.com/apk/res/android"
@@ -930,8 +1261,9 @@ def generate_android_gradient_xml(gradient_name: str, rotation: float, start_col
     return xml_content
 
 
-def traverse_gradient_nodes(data: Dict[str, Any], path: List[str], gradients: Dict[str, Dict[str, Any]]) -> None:
+def traverse_gradient_nodes(data: Dict[str, Any], path: List[str], gradients: Dict[str, GradientToken]) -> None:
     """遍历渐变节点"""
+    tracer.count(NODES_VISITED, len(data))
     for key, value in data.items():
         current_path = path + [key]
         
@@ -955,19 +1287,16 @@ def traverse_gradient_nodes(data: Dict[str, Any], path: List[str], gradients: Di
                     else:
                         xml_name = format_gradient_name('gradient', current_path[-1])
                     
-                    gradients[xml_name] = {
-                        'rotation': rotation,
-                        'start_color': start_color,
-                        'end_color': end_color
-                    }
+                    gradients[xml_name] = GradientToken(xml_name, rotation, start_color, end_color,
+                                                        provenance='.'.join(current_path))
                     
-                    print(f"Found gradient: {xml_name} - {start_color} -> {end_color} ({rotation}°)")
+                    logger.debug("Found gradient: %s - %s -> %s (%s°)", xml_name, start_color, end_color, rotation)
             else:
                 # 继续递归
                 traverse_gradient_nodes(value, current_path, gradients)
 
 
-def process_gradients(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def process_gradients(data: Dict[str, Any]) -> Dict[str, GradientToken]:
     """处理gradient模块，提取渐变"""
     gradients = {}
     
@@ -1002,31 +1331,29 @@ def process_radius_data(data: Dict[str, Any]) -> Dict[str, str]:
     return radius_values
 
 
-def generate_gradient_xml_files(gradients: Dict[str, Dict[str, Any]], output_dir: str) -> None:
+def generate_gradient_xml_files(gradients: Dict[str, GradientToken], output_dir: str) -> None:
     """生成渐变XML文件"""
     gradient_dir = os.path.join(output_dir, "gradients")
     os.makedirs(gradient_dir, exist_ok=True)
     
     print(f"Generating gradient XML files in {gradient_dir}...")
     
-    for gradient_name, gradient_data in gradients.items():
+    for gradient_name, gradient in gradients.items():
         xml_content = generate_android_gradient_xml(
             gradient_name,
-            gradient_data['rotation'],
-            gradient_data['start_color'],
-            gradient_data['end_color']
+            gradient.rotation,
+            gradient.start_color,
+            gradient.end_color
         )
         
         file_path = os.path.join(gradient_dir, f"{gradient_name}.xml")
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(xml_content)
+        tracer.count_written(xml_content)
         
-        print(f"Generated: {file_path}")
-
-
-def is_typography_node(node: Dict[str, Any]) -> bool:
-    """判断是否为typography节点"""
-    return node.get('type') == 'custom-typography' and 'value' in node
+        logger.debug("Generated: %s", file_path)
+    
+    print(f"Generated {len(gradients)} gradient XML files")
 
 
 def format_typography_name(node_name: str) -> str:
@@ -1051,6 +1378,13 @@ def format_typography_name(node_name: str) -> str:
     return name.lower()
 
 
+def unwrap_token_value(token: Any) -> Any:
+    """取出 {'type': ..., 'value': ...} 形式令牌的值，其他值原样返回"""
+    if isinstance(token, dict) and 'value' in token:
+        return token['value']
+    return token
+
+
 def extract_typography_value(node_name: str, value_dict: Dict[str, Any]) -> Dict[str, str]:
     """提取typography值，从节点名中提取字体大小"""
     result = {}
@@ -1066,6 +1400,22 @@ def extract_typography_value(node_name: str, value_dict: Dict[str, Any]) -> Dict
     # 从value中提取其他属性
     typography_value = value_dict.get('value', {})
     
+    # 子节点（如 regular/semibold）中的属性是 {'type':..., 'value':...} 形式的令牌
+    typography_value = dict(typography_value)
+    for token_key in ('fontWeight', 'fontStyle', 'fontFamily', 'fontSize'):
+        if token_key in typography_value:
+            typography_value[token_key] = unwrap_token_value(typography_value[token_key])
+
+    # 提取字体大小
+    if 'text_size' not in result and isinstance(typography_value.get('fontSize'), (int, float)):
+        result['text_size'] = f"{typography_value['fontSize']}sp"
+
+    # 提取字体族和字体样式
+    if isinstance(typography_value.get('fontFamily'), str):
+        result['font_family'] = typography_value['fontFamily']
+    if typography_value.get('fontStyle') == 'italic':
+        result['font_style'] = 'italic'
+
     # 提取字体粗细
     if 'fontWeight' in typography_value:
         font_weight = typography_value['fontWeight']
@@ -1106,31 +1456,44 @@ def extract_typography_value(node_name: str, value_dict: Dict[str, Any]) -> Dict
             percentage = float(line_height.rstrip('%'))
             result['line_height_multiplier'] = f"{percentage / 100:.2f}"
     
-    # 提取字母间距
+    # 提取字母间距，android:letterSpacing 的单位是em，需要用像素值除以字体大小
     if 'letterSpacing' in typography_value:
-        letter_spacing = typography_value['letterSpacing']
-        if isinstance(letter_spacing, dict) and 'value' in letter_spacing:
-            spacing_value = letter_spacing['value']
-            if isinstance(spacing_value, str):
-                result['letter_spacing'] = spacing_value
-            elif isinstance(spacing_value, (int, float)):
-                result['letter_spacing'] = f"{spacing_value}sp"
+        letter_spacing = unwrap_token_value(typography_value['letterSpacing'])
+        font_size = typography_value.get('fontSize')
+        if isinstance(letter_spacing, str):
+            result['letter_spacing'] = letter_spacing
         elif isinstance(letter_spacing, (int, float)):
-            result['letter_spacing'] = f"{letter_spacing}sp"
+            if isinstance(font_size, (int, float)) and font_size:
+                result['letter_spacing'] = f"{letter_spacing / font_size:.4g}"
+            else:
+                result['letter_spacing'] = f"{letter_spacing}"
     
     return result
 
 
 def traverse_typography_nodes(data: Dict[str, Any], 
                               typography_styles: Dict[str, Dict[str, str]]) -> None:
-    """遍历typography节点下的直接子节点"""
+    """遍历typography节点下的直接子节点，以及其下按字重划分的子样式（regular、semibold等）"""
+    tracer.count(NODES_VISITED, len(data))
     for key, value in data.items():
         xml_name = format_typography_name(key)
         typography_values = extract_typography_value(key, value)
 
         if typography_values:
             typography_styles[xml_name] = typography_values
-            print(f"Found typography style: {xml_name} - {typography_values}")
+            logger.debug("Found typography style: %s - %s", xml_name, typography_values)
+
+        if not isinstance(value, dict):
+            continue
+
+        for weight_key, weight_value in value.items():
+            if not isinstance(weight_value, dict) or 'fontWeight' not in weight_value:
+                continue
+            weight_name = f"{xml_name}_{format_typography_name(weight_key)}"
+            weight_values = extract_typography_value(key, {'value': weight_value})
+            weight_values['parent'] = xml_name
+            typography_styles[weight_name] = weight_values
+            logger.debug("Found typography style: %s - %s", weight_name, weight_values)
 
 
 def process_typography_data(data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
@@ -1148,24 +1511,68 @@ def process_typography_data(data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
     return typography_styles
 
 
-def generate_typography_xml_files(typography_styles: Dict[str, Dict[str, str]], output_dir: str) -> None:
-    """生成typography XML文件"""
-    if not typography_styles:
-        print("No typography styles found, skipping XML generation")
-        return
+def find_font_index(style_values: Dict[str, str], font_indexes: Optional[Dict[str, Any]]) -> Optional[Any]:
+    """按样式的 font_family 查找字重索引，只有一个字体族时直接使用它"""
+    if not font_indexes:
+        return None
+    family_key = style_values.get('font_family', '').replace(' ', '').replace('-', '').lower()
+    font_index = font_indexes.get(family_key)
+    if font_index is None and len(font_indexes) == 1:
+        font_index = next(iter(font_indexes.values()))
+    return font_index
+
+
+def resolve_typography_font(style_values: Dict[str, str],
+                            font_indexes: Optional[Dict[str, Any]],
+                            variable: bool = False) -> Optional[str]:
+    """通过字重索引查找样式对应的字体资源
+
+    Args:
+        style_values: 样式属性
+        font_indexes: generate_android_fonts.build_font_weight_indexes 的结果，键为小写字体族名
+        variable: 为 values-v26 生成时为True，字体族有可变字体时直接引用字体族XML
+
+    Returns:
+        @font/ 资源引用：有字重时为对应的字体文件，否则为字体族XML；找不到字体族时返回None
+    """
+    font_index = find_font_index(style_values, font_indexes)
+    if font_index is None:
+        return None
+    if 'text_weight' not in style_values or (variable and font_index.variable):
+        return font_index.family_resource
+    return font_index.lookup(int(style_values['text_weight']), style_values.get('font_style') == 'italic')
+
 
-    # 生成text styles XML
+def write_text_styles_xml(typography_styles: Dict[str, Dict[str, str]], values_dir: str,
+                          font_indexes: Optional[Dict[str, Any]] = None, variable: bool = False) -> None:
+    """写入 text_styles.xml
+
+    Args:
+        typography_styles: 样式名称 -> 样式属性
+        values_dir: 资源目录（values 或 values-v26）
+        font_indexes: 字体族的字重索引
+        variable: 为True时有可变字体的样式引用字体族XML，由 textFontWeight（API 28+）选择字重；
+            API 26-27 忽略 textFontWeight，按 textStyle 在字体族中匹配
+    """
     text_styles_content = '<?xml version="1.0" encoding="utf-8"?>\n'
     text_styles_content += '<resources>\n'
 
     for style_name, style_values in sorted(typography_styles.items()):
-        text_styles_content += f'    <style name="{style_name}">\n'
+        if 'parent' in style_values:
+            text_styles_content += f'    <style name="{style_name}" parent="{style_values["parent"]}">\n'
+        else:
+            text_styles_content += f'    <style name="{style_name}">\n'
 
         if 'text_size' in style_values:
             text_styles_content += f'        <item name="android:textSize">{style_values["text_size"]}</item>\n'
 
+        font_resource = resolve_typography_font(style_values, font_indexes, variable)
+        if font_resource:
+            text_styles_content += f'        <item name="android:fontFamily">{font_resource}</item>\n'
+
         if 'text_weight' in style_values:
-            text_styles_content += f'        <item name="android:textStyle">{style_values["text_weight"]}</item>\n'
+            text_styles_content += f'        <item name="android:textFontWeight">{style_values["text_weight"]}</item>\n'
+            text_styles_content += f'        <item name="android:textStyle">{style_values.get("font_style", "normal")}</item>\n'
 
         if 'line_height' in style_values:
             text_styles_content += f'        <item name="android:lineHeight">{style_values["line_height"]}</item>\n'
@@ -1180,22 +1587,50 @@ def generate_typography_xml_files(typography_styles: Dict[str, Dict[str, str]],
 
     text_styles_content += '</resources>'
 
-    # 确保输出目录存在
-    os.makedirs(output_dir, exist_ok=True)
-
-    # 写入text styles文件
-    text_styles_path = os.path.join(output_dir, "values", "text_styles.xml")
+    os.makedirs(values_dir, exist_ok=True)
+    text_styles_path = os.path.join(values_dir, "text_styles.xml")
     with open(text_styles_path, 'w', encoding='utf-8') as f:
         f.write(text_styles_content)
+    tracer.count_written(text_styles_content)
 
     print(f"Generated: {text_styles_path}")
 
+
+def generate_typography_xml_files(typography_styles: Dict[str, Dict[str, str]], output_dir: str,
+                                  font_indexes: Optional[Dict[str, Any]] = None) -> None:
+    """生成typography XML文件
+
+    Args:
+        typography_styles: 样式名称 -> 样式属性
+        output_dir: 输出目录
+        font_indexes: 字体族的字重索引，用于给样式绑定具体字体文件，避免运行时合成粗体
+    """
+    if not typography_styles:
+        print("No typography styles found, skipping XML generation")
+        return
+
+    # 确保输出目录存在
+    os.makedirs(output_dir, exist_ok=True)
+
+    write_text_styles_xml(typography_styles, os.path.join(output_dir, "values"), font_indexes)
+
+    # 可变字体在 font-v26 中以字体族形式提供，API 26+ 的样式引用字体族，由 textFontWeight 选择字重
+    variable_styles = {name: values for name, values in typography_styles.items()
+                       if 'text_weight' in values
+                       and getattr(find_font_index(values, font_indexes), 'variable', False)}
+    v26_path = os.path.join(output_dir, "values-v26", "text_styles.xml")
+    if variable_styles:
+        write_text_styles_xml(variable_styles, os.path.dirname(v26_path), font_indexes, variable=True)
+    elif os.path.exists(v26_path):
+        os.remove(v26_path)
+        print(f"Removed stale: {v26_path}")
+
     # 生成dimens文件用于字体大小
     dimens_content = '<?xml version="1.0" encoding="utf-8"?>\n'
     dimens_content += '<resources>\n'
 
     for style_name, style_values in sorted(typography_styles.items()):
-        if 'text_size' in style_values:
+        if 'text_size' in style_values and 'parent' not in style_values:
             # 提取数值部分，去掉sp单位
             size_value = style_values['text_size']
             if size_value.endswith('sp'):
@@ -1207,6 +1642,7 @@ def generate_typography_xml_files(typography_styles: Dict[str, Dict[str, str]],
     dimens_path = os.path.join(output_dir, "values", "text_sizes.xml")
     with open(dimens_path, 'w', encoding='utf-8') as f:
         f.write(dimens_content)
+    tracer.count_written(dimens_content)
 
     print(f"Generated: {dimens_path}")
 
@@ -1219,7 +1655,11 @@ This directory contains Android typography style files generated from design tok
 
 - `values/text_styles.xml` - Text style definitions with all typography properties
 - `values/text_sizes.xml` - Text size dimensions for easy reference
-
+"""
+    if variable_styles:
+        readme_content += ("- `values-v26/text_styles.xml` - API 26+ overrides that use the variable font family "
+                           "with `android:textFontWeight`\n")
+    readme_content += """
 ## Usage
 
 ### In XML:
@@ -1247,6 +1687,15 @@ textView.setTextAppearance(context, R.style.display_2xl)
         if 'text_size' in style_values:
             readme_content += f"- Text Size: {style_values['text_size']}\n"
 
+        if 'parent' in style_values:
+            readme_content += f"- Parent: {style_values['parent']}\n"
+
+        font_resource = resolve_typography_font(style_values, font_indexes)
+        if font_resource:
+            readme_content += f"- Font: {font_resource}\n"
+        if style_name in variable_styles:
+            readme_content += f"- Font (API 26+): {resolve_typography_font(style_values, font_indexes, True)}\n"
+
         if 'text_weight' in style_values:
             readme_content += f"- Font Weight: {style_values['text_weight']}\n"
 
@@ -1264,12 +1713,14 @@ textView.setTextAppearance(context, R.style.display_2xl)
     readme_path = os.path.join(output_dir, "typography_readme.md")
     with open(readme_path, 'w', encoding='utf-8') as f:
         f.write(readme_content)
+    tracer.count_written(readme_content)
 
     print(f"Generated: {readme_path}")
 
 
 def traverse_font_size_nodes(font_size_data: Dict[str, Any], text_sizes: Dict[str, int]) -> None:
     """遍历font size节点，提取文字大小"""
+    tracer.count(NODES_VISITED, len(font_size_data))
     for key, value in font_size_data.items():
         if isinstance(value, dict) and value.get('type') == 'dimension' and 'value' in value:
             # 这是一个字体大小节点
@@ -1285,7 +1736,7 @@ def traverse_font_size_nodes(font_size_data: Dict[str, Any], text_sizes: Dict[st
             xml_name = xml_name.replace('-', '_')
 
             text_sizes[xml_name] = size_value
-            print(f"Found font size: {xml_name} = {size_value}sp")
+            logger.debug("Found font size: %s = %ssp", xml_name, size_value)
 
 
 def process_font_sizes(data: Dict[str, Any]) -> Dict[str, int]:
@@ -1333,6 +1784,7 @@ def generate_text_dimens_xml(text_sizes: Dict[str, int], output_dir: str) -> Non
     file_path = os.path.join(output_dir, "values", "text_dimens.xml")
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
+    tracer.count_written(xml_content)
 
     print(f"Generated: {file_path}")
 
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+监听模式：常驻进程轮询设计令牌JSON、svgs/ 和 static/，变化稳定后（防抖）增量重新生成资源。
+上一次解析的令牌树（按子树哈希）和解析出的令牌模型保留在内存中；令牌变化时与 tokens.py 运行同一条
+流水线（tokens.run_token_pipeline：所有模式、合并映射、夜间推导和导出目标），
+栅格、阴影、主题和AuColor*.kt 只在对应的顶层模块或颜色发生变化时重新生成。
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import aucolorKt
+from breakpoints import generate_breakpoints, qualifier_dir
+from export_targets import EXPORT_TARGETS, DEFAULT_TARGETS
+from generate_android_fonts import AndroidFontGenerator, build_font_weight_indexes
+from instrumentation import tracer, add_arguments, setup_from_args, finish_from_args
+from name_registry import NameRegistry, DEFAULT_REGISTRY_FILE
+from palette_dedupe import DEFAULT_MERGE_MAP_FILE
+from shadows import ShadowBaker, process_shadows, np
+from svg_to_vector import SvgToVectorConverter
+from theme import generate_theme_files
+from token_diff import build_tree, TreeNode
+from token_model import ResolvedTokens
+from tokens import (LIGHT_MODE, DARK_MODE, parse_mode_qualifiers, run_token_pipeline,
+                    generate_typography_xml_files)
+
+SVG_EXTENSIONS = {'.svg'}
+FONT_EXTENSIONS = {'.ttf', '.otf'}
+
+FileState = Dict[str, Tuple[int, int]]
+
+
+def scan_sources(json_file: str, svg_dir: str, static_dir: str,
+                 extra_files: Sequence[str] = ()) -> FileState:
+    """返回所有被监听文件的 (修改时间ns, 大小)；extra_files 为目录之外单独监听的文件（如可变字体）"""
+    state: FileState = {}
+    for file_path in (json_file, *extra_files):
+        try:
+            stat = os.stat(file_path)
+            state[file_path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+
+    for directory, extensions in ((svg_dir, SVG_EXTENSIONS), (static_dir, FONT_EXTENSIONS)):
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                    stat = entry.stat()
+                    state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+class PollingWatcher:
+    """轮询文件状态，合并一段时间内的连续变化后再返回"""
+
+    def __init__(self, json_file: str, svg_dir: str, static_dir: str,
+                 interval: float = 0.2, debounce: float = 0.3, extra_files: Sequence[str] = ()):
+        self.json_file = json_file
+        self.svg_dir = svg_dir
+        self.static_dir = static_dir
+        self.extra_files = list(extra_files)
+        self.interval = interval
+        self.debounce = debounce
+        self.state = scan_sources(json_file, svg_dir, static_dir, self.extra_files)
+
+    def poll(self) -> Set[str]:
+        """返回自上次轮询以来新增、删除或修改的文件"""
+        state = scan_sources(self.json_file, self.svg_dir, self.static_dir, self.extra_files)
+        changed = {path for path in state.keys() | self.state.keys()
+                   if state.get(path) != self.state.get(path)}
+        self.state = state
+        return changed
+
+    def wait_for_changes(self) -> Set[str]:
+        """阻塞直到有文件变化，并且在防抖时间内没有新的变化"""
+        pending: Set[str] = set()
+        last_change = 0.0
+        while True:
+            time.sleep(self.interval)
+            changed = self.poll()
+            now = time.monotonic()
+            if changed:
+                pending |= changed
+                last_change = now
+            elif pending and now - last_change >= self.debounce:
+                return pending
+
+
+# 不参与 tokens.py 流水线的顶层模块，只变化它们时不重新运行流水线
+GRID_MODULES = {'grid', '4. widths', '5. containers'}
+SHADOW_MODULE = 'effect'
+STANDALONE_MODULES = GRID_MODULES | {SHADOW_MODULE}
+
+ColorState = Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]
+
+
+def color_state(model: ResolvedTokens) -> ColorState:
+    """模型中的原子颜色和语义颜色输出值，用于判断主题和AuColor*.kt是否需要重新生成"""
+    return ({mode: dict(colors) for mode, colors in model.primitives_by_mode.items()},
+            {mode: {name: token.value for name, token in tokens.items()}
+             for mode, tokens in model.semantic_by_mode.items()})
+
+
+class WarmPipeline:
+    """常驻内存的令牌流水线
+
+    保留上次的JSON内容摘要、令牌哈希树和解析出的令牌模型。重新生成时先比较顶层模块的子树哈希，
+    只有 tokens.py 使用的模块变化时才运行共用流水线；颜色结果不变时，不再重写主题和AuColor*.kt。
+    """
+
+    def __init__(self, json_file: str, output_dir: str = ".", static_dir: str = "static",
+                 svg_dir: str = "svgs", vector_dir: str = "vectors", shard_colors: bool = False,
+                 targets: Optional[List[str]] = None, mode_qualifiers: Optional[Dict[str, str]] = None,
+                 merge_map_file: Optional[str] = DEFAULT_MERGE_MAP_FILE,
+                 variable_fonts: Optional[List[str]] = None):
+        self.json_file = json_file
+        self.output_dir = output_dir
+        self.static_dir = static_dir
+        self.variable_fonts = list(variable_fonts or [])
+        self.svg_dir = svg_dir
+        self.vector_dir = vector_dir
+        self.targets = list(targets or DEFAULT_TARGETS)
+        self.target_options = {'shard_colors': shard_colors, 'mode_qualifiers': mode_qualifiers or {}}
+        self.merge_map_file = merge_map_file
+        self.converter = SvgToVectorConverter()
+        self.shadow_baker = ShadowBaker(output_dir)
+        self.name_registry = NameRegistry(os.path.join(output_dir, DEFAULT_REGISTRY_FILE))
+
+        self.source_digest: Optional[bytes] = None
+        self.tree: Optional[TreeNode] = None
+        self.data: Optional[Dict[str, Any]] = None
+        self.font_indexes: Optional[Dict[str, Any]] = None
+
+        # 上次的令牌模型和颜色输出
+        self.model: Optional[ResolvedTokens] = None
+        self.colors: Optional[ColorState] = None
+
+    @property
+    def values_dir(self) -> str:
+        return os.path.join(self.output_dir, "values")
+
+    def changed_modules(self, tree: TreeNode) -> Set[str]:
+        """返回内容变化的顶层模块（规范化名称），首次运行时为全部模块"""
+        if self.tree is None:
+            return set(tree.children)
+        old = self.tree.children
+        new = tree.children
+        return {key for key in old.keys() | new.keys()
+                if key not in old or key not in new or old[key].digest != new[key].digest}
+
+    def refresh_tokens(self) -> List[str]:
+        """重新加载令牌JSON，返回重新生成的输出"""
+        with tracer.span('load', file=self.json_file):
+            with open(self.json_file, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if digest == self.source_digest:
+                return []
+            try:
+                data = json.loads(raw.decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                # 导出工具可能仍在写入，保留上次的模型，等待下一次变化
+                print(f"Error parsing JSON: {e}")
+                return []
+            tree = build_tree('', data)
+
+        changed = self.changed_modules(tree)
+        self.data, self.tree, self.source_digest = data, tree, digest
+        if not changed:
+            return []
+        print(f"Changed modules: {', '.join(sorted(changed))}")
+
+        outputs: List[str] = []
+        if changed - STANDALONE_MODULES:
+            # 与 tokens.py 相同的流水线：所有模式、合并映射、夜间推导、导出目标和对比度检查
+            if self.font_indexes is None:
+                self.font_indexes = build_font_weight_indexes(self.static_dir, self.variable_fonts)
+            self.model, results = run_token_pipeline(data, self.json_file, self.output_dir, self.name_registry,
+                                                     self.targets, self.target_options, self.merge_map_file,
+                                                     self.font_indexes)
+            outputs += [output for _, target_outputs, _ in results for output in target_outputs]
+
+            colors = color_state(self.model)
+            if colors != self.colors:
+                self.colors = colors
+                outputs += self.regenerate_colors()
+
+        if changed & GRID_MODULES:
+            layouts = generate_breakpoints(data, self.output_dir)
+            outputs += ["values/width_dimens.xml", "ktClass/AppBreakpoints.kt"]
+            outputs += [os.path.join(qualifier_dir(layout.min_width), "grid_dimens.xml") for layout in layouts]
+
+        if SHADOW_MODULE in changed:
+            if np is None:
+                print("Warning: effect tokens changed but shadow baking requires NumPy (pip install numpy); "
+                      "9-patch shadows were not regenerated")
+            else:
+                with tracer.span('emit', module='shadows'):
+                    results = self.shadow_baker.bake(process_shadows(data))
+                # 参数未变的阴影直接取自缓存，只列出重新渲染的图片
+                outputs += [f"drawable-{bucket}/{name}.9.png" for name, bucket, _, _, cached in results if not cached]
+
+        return outputs
+
+    def regenerate_colors(self) -> List[str]:
+        """根据模型中的颜色生成主题和按分类拆分的AuColor*.kt（颜色XML由android导出目标写出）"""
+        light_colors = dict(self.model.primitives(LIGHT_MODE))
+        dark_colors = dict(self.model.primitives(DARK_MODE))
+
+        # 主题和AuColor.kt直接使用内存中的值，不再回读刚写出的XML
+        light_values = {name: token.value for name, token in self.model.semantic(LIGHT_MODE).items()}
+        dark_values = {name: token.value for name, token in self.model.semantic(DARK_MODE).items()}
+        generate_theme_files(light_values, dark_values, light_colors, dark_colors,
+                             os.path.join(self.values_dir, "semantic_color_attrs.xml"),
+                             os.path.join(self.values_dir, "themes.xml"))
+
+        kt_files = aucolorKt.generate_kt_files(aucolorKt.strip_color_references(light_values),
+                                               aucolorKt.strip_color_references(dark_values),
+                                               light_colors, dark_colors)
+        kt_written = aucolorKt.write_kt_files(self.output_dir, kt_files)
+        return ["values/semantic_color_attrs.xml", "values/themes.xml"] + kt_written
+
+    def regenerate_typography(self) -> List[str]:
+        """使用缓存的字重索引重新生成文字样式"""
+        if self.font_indexes is None:
+            self.font_indexes = build_font_weight_indexes(self.static_dir, self.variable_fonts)
+        with tracer.span('emit', module='typography'):
+            generate_typography_xml_files(self.model.typography_styles, self.output_dir, self.font_indexes)
+        return ["values/text_styles.xml", "values/text_sizes.xml", "typography_readme.md"]
+
+    def refresh_fonts(self) -> List[str]:
+        """字体文件变化：重新生成字体族XML，并按新的字重索引重新绑定文字样式"""
+        with tracer.span('emit', module='fonts'):
+            generator = AndroidFontGenerator(self.static_dir, os.path.join(self.output_dir, "font"),
+                                             os.path.join(self.output_dir, "font-v26"), self.variable_fonts)
+            generator.run()
+        outputs = ["font/", "font-v26/"]
+
+        self.font_indexes = build_font_weight_indexes(self.static_dir, self.variable_fonts)
+        if self.model is not None:
+            outputs += self.regenerate_typography()
+        return outputs
+
+    def refresh_svgs(self, svg_files: Optional[Set[str]] = None) -> List[str]:
+        """转换新增或修改的SVG，删除已移除SVG对应的矢量图；svg_files为None时转换整个目录"""
+        os.makedirs(self.vector_dir, exist_ok=True)
+        if svg_files is None:
+            try:
+                svg_files = {entry.path for entry in os.scandir(self.svg_dir)
+                             if os.path.splitext(entry.name)[1].lower() in SVG_EXTENSIONS}
+            except OSError:
+                return []
+
+        outputs = []
+        for svg_file in sorted(svg_files):
+            stem = os.path.splitext(os.path.basename(svg_file))[0]
+            vector_file = os.path.join(self.vector_dir, f"{stem}.xml")
+            if os.path.exists(svg_file):
+                with tracer.span('convert', file=os.path.basename(svg_file)):
+                    converted = self.converter.convert_svg_to_vector(svg_file, self.vector_dir)
+                if converted:
+                    outputs.append(vector_file)
+            elif os.path.exists(vector_file):
+                os.remove(vector_file)
+                print(f"Removed: {vector_file}")
+                outputs.append(vector_file)
+        return outputs
+
+    def build_all(self) -> List[str]:
+        """首次完整生成，同时填充缓存"""
+        outputs = []
+        if os.path.exists(self.json_file):
+            outputs += self.refresh_tokens()
+        else:
+            print(f"Warning: token file not found: {self.json_file}")
+        outputs += self.refresh_svgs()
+        return outputs
+
+    def handle_changes(self, changed: Set[str]) -> List[str]:
+        """按文件所属的源分派变化"""
+        svg_files = {path for path in changed if os.path.dirname(path) == self.svg_dir}
+        font_files = {path for path in changed
+                      if os.path.dirname(path) == self.static_dir or path in self.variable_fonts}
+
+        outputs = []
+        if font_files:
+            outputs += self.refresh_fonts()
+        if self.json_file in changed and os.path.exists(self.json_file):
+            outputs += self.refresh_tokens()
+        if svg_files:
+            outputs += self.refresh_svgs(svg_files)
+        return outputs
+
+
+def report(outputs: List[str], start: float) -> None:
+    elapsed = (time.perf_counter() - start) * 1000
+    if outputs:
+        print(f"\nRegenerated {len(outputs)} output(s) in {elapsed:.1f} ms:")
+        for output in outputs:
+            print(f"  {output}")
+    else:
+        print(f"\nNo output changes ({elapsed:.1f} ms)")
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description='Watch token JSON, SVG and font sources and regenerate '
+                                                 'only the affected Android resources')
+    parser.add_argument('--tokens', default='design-tokens.tokens(5).json',
+                        help='Token JSON file (default: design-tokens.tokens(5).json)')
+    parser.add_argument('--svg-dir', default='svgs', help='SVG input directory (default: svgs)')
+    parser.add_argument('--vector-dir', default='vectors', help='Vector drawable output directory (default: vectors)')
+    parser.add_argument('--static-dir', default='static', help='Font directory (default: static)')
+    parser.add_argument('--variable-font', action='append', default=[],
+                        help='Variable font file outside --static-dir (see generate_android_fonts.py '
+                             '--variable-font); watched and given values-v26 text styles like tokens.py')
+    parser.add_argument('--interval', type=float, default=0.2,
+                        help='Polling interval in seconds (default: 0.2)')
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help='Quiet period in seconds before regenerating (default: 0.3)')
+    parser.add_argument('--shard-colors', action='store_true',
+                        help='Write color resources as per-category shards (see tokens.py --shard-colors)')
+    parser.add_argument('--mode-qualifier', action='append', default=[], metavar='MODE=DIR',
+                        help="Resource directory for an extra mode (see tokens.py --mode-qualifier)")
+    parser.add_argument('--merge-map', default=DEFAULT_MERGE_MAP_FILE, metavar='FILE',
+                        help=f'Primitive merge map applied before emitting (default: {DEFAULT_MERGE_MAP_FILE})')
+    parser.add_argument('--target', action='append', choices=sorted(EXPORT_TARGETS), default=[],
+                        help=f"Export target to render on every token change; repeat for several "
+                             f"(default: {', '.join(DEFAULT_TARGETS)})")
+    parser.add_argument('--once', action='store_true',
+                        help='Run the initial build and exit without watching')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    setup_from_args(args)
+
+    try:
+        mode_qualifiers = parse_mode_qualifiers(args.mode_qualifier)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    svg_dir = os.path.normpath(args.svg_dir)
+    static_dir = os.path.normpath(args.static_dir)
+    variable_fonts = [os.path.normpath(path) for path in args.variable_font]
+    pipeline = WarmPipeline(args.tokens, ".", static_dir, svg_dir, args.vector_dir, args.shard_colors,
+                            list(dict.fromkeys(args.target)), mode_qualifiers, args.merge_map, variable_fonts)
+
+    start = time.perf_counter()
+    report(pipeline.build_all(), start)
+    if args.once:
+        finish_from_args(args)
+        return
+
+    watcher = PollingWatcher(args.tokens, svg_dir, static_dir, args.interval, args.debounce, variable_fonts)
+    print(f"\nWatching {args.tokens}, {svg_dir}/ and {static_dir}/ (Ctrl+C to stop)...")
+    try:
+        while True:
+            changed = watcher.wait_for_changes()
+            print(f"\nDetected {len(changed)} changed file(s)")
+            start = time.perf_counter()
+            try:
+                outputs = pipeline.handle_changes(changed)
+            except Exception:
+                # 保持监听，修复源文件后会再次触发
+                traceback.print_exc()
+                continue
+            report(outputs, start)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+    finish_from_args(args)
+
+
+if __name__ == '__main__':
+    main()